@@ -18,6 +18,7 @@ from app.db.repositories.job_repo import (
     JobRepository,
     ReferenceJDRepository,
 )
+from app.db.repositories.recommendation_repo import JobRecommendationRepository
 from app.db.repositories.resume_repo import (
     ResumeCertificationRepository,
     ResumeEducationRepository,
@@ -33,14 +34,22 @@ from app.db.repositories.user_repo import (
     UserGoogleRepository,
     UserRepository,
 )
-from app.db.session import get_db
+from app.db.session import get_db, get_db_readonly
 
 # Integration imports
-from app.integrations.qdrant.vector_service import JobVectorService
+from app.integrations.qdrant.candidate_vector_service import (
+    CandidateVectorService,
+    get_candidate_vector_service,
+)
+from app.integrations.qdrant.vector_service import (
+    JobVectorService,
+    get_job_vector_service,
+)
 from app.services.auth.auth_service import AuthService
 from app.services.auth.organization_auth_service import OrganizationAuthService
 from app.services.candidate.application_service import ApplicationService
 from app.services.candidate.profile_service import ProfileService
+from app.services.candidate.recommendation_service import RecommendationService
 from app.services.candidate.resume_service import ResumeService
 
 # Service imports
@@ -53,6 +62,8 @@ from app.services.recruiter.job_generation_service import JobGenerationService
 from app.services.recruiter.reference_jd_service import ReferenceJDService
 from app.services.recruiter.shortlist_service import ShortlistService
 from app.services.recruiter.stats_services import StatsService
+from app.services.recruiter.talent_search_service import TalentSearchService
+from app.services.suggestion_service import SuggestionService
 from app.services.user_service import UserService
 
 
@@ -83,6 +94,12 @@ def get_reference_jd_repo(db: AsyncSession = Depends(get_db)) -> ReferenceJDRepo
     return ReferenceJDRepository(db)
 
 
+def get_job_recommendation_repo(
+    db: AsyncSession = Depends(get_db),
+) -> JobRecommendationRepository:
+    return JobRecommendationRepository(db)
+
+
 def get_candidate_profile_repo(
     db: AsyncSession = Depends(get_db),
 ) -> CandidateProfileRepository:
@@ -165,7 +182,7 @@ def get_resume_skill_repo(db: AsyncSession = Depends(get_db)) -> ResumeSkillRepo
 
 # Integration Dependencies
 def get_vector_service() -> JobVectorService:
-    return JobVectorService()
+    return get_job_vector_service()
 
 
 # Service Dependencies
@@ -174,6 +191,21 @@ def get_activity_emitter() -> ActivityEventEmitter:
     return ActivityEventEmitter()
 
 
+def get_recommendation_service(
+    recommendation_repo: JobRecommendationRepository = Depends(
+        get_job_recommendation_repo
+    ),
+    candidate_profile_repo: CandidateProfileRepository = Depends(
+        get_candidate_profile_repo
+    ),
+    job_repo: JobRepository = Depends(get_job_repo),
+    vector_service: JobVectorService = Depends(get_vector_service),
+) -> RecommendationService:
+    return RecommendationService(
+        recommendation_repo, candidate_profile_repo, job_repo, vector_service
+    )
+
+
 def get_job_service(
     job_repo: JobRepository = Depends(get_job_repo),
     job_description_repo: JobDescriptionRepository = Depends(get_job_description_repo),
@@ -183,6 +215,7 @@ def get_job_service(
     user_repo: UserRepository = Depends(get_user_repo),
     vector_service: JobVectorService = Depends(get_vector_service),
     activity_emitter: ActivityEventEmitter = Depends(get_activity_emitter),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service),
 ) -> JobService:
     return JobService(
         job_repo,
@@ -191,9 +224,19 @@ def get_job_service(
         user_repo,
         vector_service,
         activity_emitter,
+        recommendation_service,
     )
 
 
+def get_suggestion_service(
+    job_repo: JobRepository = Depends(get_job_repo),
+    candidate_skills_repo: CandidateSkillsRepository = Depends(
+        get_candidate_skills_repo
+    ),
+) -> SuggestionService:
+    return SuggestionService(job_repo, candidate_skills_repo)
+
+
 def get_user_service(
     user_repo: UserRepository = Depends(get_user_repo),
 ) -> UserService:
@@ -363,3 +406,134 @@ def get_recruiter_candidate_service(
     application_repo: JobApplicationRepository = Depends(get_job_application_repo),
 ) -> RecruiterCandidateService:
     return RecruiterCandidateService(application_repo)
+
+
+# Read-only Dependencies
+# Services for GET endpoints, all built on one read-only session that is
+# released as soon as the handler returns. They must never back a handler
+# that writes; the session rejects flushes and DML.
+def get_job_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+    vector_service: JobVectorService = Depends(get_vector_service),
+    activity_emitter: ActivityEventEmitter = Depends(get_activity_emitter),
+) -> JobService:
+    job_repo = JobRepository(db)
+    candidate_profile_repo = CandidateProfileRepository(db)
+    recommendation_service = RecommendationService(
+        JobRecommendationRepository(db),
+        candidate_profile_repo,
+        job_repo,
+        vector_service,
+    )
+    return JobService(
+        job_repo,
+        JobDescriptionRepository(db),
+        candidate_profile_repo,
+        UserRepository(db),
+        vector_service,
+        activity_emitter,
+        recommendation_service,
+    )
+
+
+def get_stats_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> StatsService:
+    return StatsService(JobRepository(db), JobApplicationRepository(db))
+
+
+def get_recruiter_candidate_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> RecruiterCandidateService:
+    return RecruiterCandidateService(JobApplicationRepository(db))
+
+
+def get_talent_search_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+    job_vector_service: JobVectorService = Depends(get_vector_service),
+    candidate_vector_service: CandidateVectorService = Depends(
+        get_candidate_vector_service
+    ),
+) -> TalentSearchService:
+    return TalentSearchService(
+        JobRepository(db),
+        CandidateProfileRepository(db),
+        job_vector_service,
+        candidate_vector_service,
+    )
+
+
+def get_application_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+    activity_emitter: ActivityEventEmitter = Depends(get_activity_emitter),
+) -> ApplicationService:
+    return ApplicationService(
+        JobApplicationRepository(db),
+        JobApplicationStatusHistoryRepository(db),
+        CandidateProfileRepository(db),
+        JobRepository(db),
+        ResumeRepository(db),
+        UserRepository(db),
+        activity_emitter,
+    )
+
+
+def get_profile_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> ProfileService:
+    return ProfileService(
+        CandidateProfileRepository(db),
+        CandidateSkillsRepository(db),
+        CandidateWorkExperienceRepository(db),
+        CandidateEducationRepository(db),
+        CandidateCertificationRepository(db),
+        CandidateSocialLinkRepository(db),
+        UserRepository(db),
+    )
+
+
+def get_resume_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> ResumeService:
+    return ResumeService(
+        ResumeRepository(db),
+        CandidateProfileRepository(db),
+        ResumeWorkExperienceRepository(db),
+        ResumeEducationRepository(db),
+        ResumeSkillRepository(db),
+        ResumeCertificationRepository(db),
+        ResumeSocialLinkRepository(db),
+    )
+
+
+def get_organization_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> OrganizationService:
+    return OrganizationService(OrganizationRepository(db))
+
+
+def get_recruiter_crud_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> RecruiterCrudService:
+    user_repo = UserRepository(db)
+    organization_repo = OrganizationRepository(db)
+    return RecruiterCrudService(
+        user_repo,
+        organization_repo,
+        AuthService(
+            user_repo, UserGoogleRepository(db), CandidateProfileRepository(db)
+        ),
+        OrganizationAuthService(user_repo, organization_repo),
+    )
+
+
+def get_reference_jd_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> ReferenceJDService:
+    return ReferenceJDService(ReferenceJDRepository(db), OrganizationRepository(db))
+
+
+def get_shortlist_service_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> ShortlistService:
+    return ShortlistService(JobApplicationRepository(db), JobRepository(db))
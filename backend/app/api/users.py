@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Request
 
 from app.api.dependencies import get_user_service
-from app.core import get_current_active_user
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.models.user import User
@@ -17,7 +17,7 @@ router = APIRouter()
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_current_user(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
 ):
     return current_user
 
@@ -3,8 +3,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.dependencies import get_application_service
-from app.core import get_current_active_user
+from app.api.dependencies import (
+    get_application_service,
+    get_application_service_readonly,
+)
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.models.user import User
@@ -22,9 +25,9 @@ router = APIRouter()
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_my_applications(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     application_service: Annotated[
-        ApplicationService, Depends(get_application_service)
+        ApplicationService, Depends(get_application_service_readonly)
     ],
 ):
     applications = await application_service.get_candidate_applications(
@@ -42,9 +45,9 @@ async def get_my_applications(
 async def get_application_detail(
     request: Request,
     application_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     application_service: Annotated[
-        ApplicationService, Depends(get_application_service)
+        ApplicationService, Depends(get_application_service_readonly)
     ],
 ):
     application = await application_service.get_application_by_id(
@@ -62,9 +65,9 @@ async def get_application_detail(
 async def get_application_by_job(
     request: Request,
     job_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     application_service: Annotated[
-        ApplicationService, Depends(get_application_service)
+        ApplicationService, Depends(get_application_service_readonly)
     ],
 ):
     return await application_service.get_application_by_job(
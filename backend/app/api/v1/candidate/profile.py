@@ -3,8 +3,8 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.dependencies import get_profile_service
-from app.core import get_current_active_user
+from app.api.dependencies import get_profile_service, get_profile_service_readonly
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.models.user import User
@@ -18,8 +18,8 @@ router = APIRouter()
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_my_profile(
     request: Request,
-    profile_service: Annotated[ProfileService, Depends(get_profile_service)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    profile_service: Annotated[ProfileService, Depends(get_profile_service_readonly)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
 ):
     profile = await profile_service.get_full_profile(current_user)
     if not profile:
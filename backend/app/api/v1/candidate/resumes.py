@@ -3,8 +3,8 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.dependencies import get_resume_service
-from app.core import get_current_active_user
+from app.api.dependencies import get_resume_service, get_resume_service_readonly
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.models.user import User
@@ -32,8 +32,8 @@ router = APIRouter()
 @limiter.limit(settings.RATE_LIMIT_API)
 async def list_resumes(
     request: Request,
-    resume_service: Annotated[ResumeService, Depends(get_resume_service)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    resume_service: Annotated[ResumeService, Depends(get_resume_service_readonly)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
 ):
     return await resume_service.list_resumes(current_user)
 
@@ -60,9 +60,9 @@ async def create_resume(
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_resume(
     request: Request,
-    resume_service: Annotated[ResumeService, Depends(get_resume_service)],
+    resume_service: Annotated[ResumeService, Depends(get_resume_service_readonly)],
     resume_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
 ):
     resume = await resume_service.get_resume(current_user, resume_id)
     if not resume:
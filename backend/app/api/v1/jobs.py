@@ -3,7 +3,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.dependencies import get_job_service
+from app.api.dependencies import (
+    get_job_service,
+    get_job_service_readonly,
+    get_suggestion_service,
+)
 from app.core import get_current_active_user
 from app.core.config import settings
 from app.core.limiter import limiter
@@ -11,6 +15,7 @@ from app.core.security import get_current_active_user_optional
 from app.db.models.user import User
 from app.schemas import job as schemas
 from app.services.job_service import JobService
+from app.services.suggestion_service import SuggestionService
 
 router = APIRouter()
 
@@ -25,41 +30,64 @@ async def get_recommendations(
     limit: int = 10,
     employment_type: str | None = None,
     location_type: str | None = None,
+    cursor: str | None = None,
 ):
-    return await job_service.get_recommendations(
-        user_id=current_user.user_id,
-        page=page,
-        limit=limit,
-        employment_type=employment_type,
-        location_type=location_type,
-    )
+    try:
+        return await job_service.get_recommendations(
+            user_id=current_user.user_id,
+            page=page,
+            limit=limit,
+            employment_type=employment_type,
+            location_type=location_type,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/search", response_model=schemas.JobListResponse)
 @limiter.limit(settings.RATE_LIMIT_API)
 async def search_jobs(
     request: Request,
-    job_service: Annotated[JobService, Depends(get_job_service)],
+    job_service: Annotated[JobService, Depends(get_job_service_readonly)],
     q: str = "",
     page: int = 1,
     limit: int = 10,
     employment_type: str | None = None,
     location_type: str | None = None,
+    cursor: str | None = None,
+    include_facets: bool = False,
+):
+    try:
+        return await job_service.search_jobs(
+            query=q,
+            page=page,
+            limit=limit,
+            employment_type=employment_type,
+            location_type=location_type,
+            cursor=cursor,
+            include_facets=include_facets,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/suggest", response_model=schemas.SuggestionResponse)
+@limiter.limit(settings.RATE_LIMIT_API)
+async def suggest(
+    request: Request,
+    suggestion_service: Annotated[SuggestionService, Depends(get_suggestion_service)],
+    q: str = "",
+    limit: int = 8,
 ):
-    return await job_service.search_jobs(
-        query=q,
-        page=page,
-        limit=limit,
-        employment_type=employment_type,
-        location_type=location_type,
-    )
+    return suggestion_service.suggest(q, limit)
 
 
 @router.get("", response_model=schemas.JobListResponse)
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_jobs(
     request: Request,
-    job_service: Annotated[JobService, Depends(get_job_service)],
+    job_service: Annotated[JobService, Depends(get_job_service_readonly)],
     user_id: uuid.UUID | None = None,
     organization_id: uuid.UUID | None = None,
     current_user: Annotated[
@@ -68,6 +96,7 @@ async def get_jobs(
     status: str | None = None,
     page: int = 1,
     limit: int = 10,
+    cursor: str | None = None,
 ):
     if (
         user_id is None
@@ -76,13 +105,29 @@ async def get_jobs(
         and (current_user.organization_id == organization_id)
     ):
         user_id = current_user.user_id
-    return await job_service.get_jobs(
-        user_id=user_id,
-        organization_id=organization_id,
-        status=status,
-        page=page,
-        limit=limit,
-    )
+    try:
+        return await job_service.get_jobs(
+            user_id=user_id,
+            organization_id=organization_id,
+            status=status,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        # The `status` query parameter shadows fastapi.status here
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{job_id}/similar", response_model=schemas.SimilarJobsResponse)
+@limiter.limit(settings.RATE_LIMIT_API)
+async def get_similar_jobs(
+    request: Request,
+    job_id: uuid.UUID,
+    job_service: Annotated[JobService, Depends(get_job_service_readonly)],
+    limit: int = 6,
+):
+    return await job_service.get_similar_jobs(job_id=job_id, limit=limit)
 
 
 @router.get("/{job_id}", response_model=schemas.JobResponse)
@@ -90,7 +135,7 @@ async def get_jobs(
 async def get_job_detail(
     request: Request,
     job_id: uuid.UUID,
-    job_service: Annotated[JobService, Depends(get_job_service)],
+    job_service: Annotated[JobService, Depends(get_job_service_readonly)],
 ):
     job = await job_service.get_job_by_id(job_id=job_id)
     if not job:
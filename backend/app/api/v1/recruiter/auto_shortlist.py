@@ -3,8 +3,8 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.api.dependencies import get_job_service
-from app.core import get_current_active_user
+from app.api.dependencies import get_job_service, get_job_service_readonly
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.db.models.user import User
 from app.services.job_service import JobService
 
@@ -14,8 +14,8 @@ router = APIRouter()
 @router.get("/{job_id}", status_code=status.HTTP_200_OK)
 async def get_auto_shortlist(
     job_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    job_service: Annotated[JobService, Depends(get_job_service)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
+    job_service: Annotated[JobService, Depends(get_job_service_readonly)],
 ):
     """Get auto_shortlist value for a job"""
     try:
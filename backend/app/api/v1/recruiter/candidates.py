@@ -3,19 +3,25 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.dependencies import get_recruiter_candidate_service
-from app.core import get_current_active_user
+from app.api.dependencies import (
+    get_recruiter_candidate_service,
+    get_recruiter_candidate_service_readonly,
+    get_talent_search_service_readonly,
+)
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.core.authorization import require_recruiter_with_organization
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.models.user import User
 from app.schemas.recruiter_candidate import (
     RecruiterCandidateListResponse,
+    TalentSearchResponse,
     UpdateApplicationRequest,
     UpdateApplicationResponse,
 )
 from app.schemas.resume import ResumeResponse
 from app.services.recruiter.candidate_service import RecruiterCandidateService
+from app.services.recruiter.talent_search_service import TalentSearchService
 
 router = APIRouter()
 
@@ -29,9 +35,9 @@ router = APIRouter()
 async def get_all_candidates(
     request: Request,
     candidate_service: Annotated[
-        RecruiterCandidateService, Depends(get_recruiter_candidate_service)
+        RecruiterCandidateService, Depends(get_recruiter_candidate_service_readonly)
     ],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     page: int = 1,
     limit: int = 20,
 ):
@@ -47,6 +53,40 @@ async def get_all_candidates(
     )
 
 
+@router.get(
+    "/search",
+    response_model=TalentSearchResponse,
+    status_code=status.HTTP_200_OK,
+)
+@limiter.limit(settings.RATE_LIMIT_API)
+async def search_candidates(
+    request: Request,
+    job_id: uuid.UUID,
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
+    talent_search_service: Annotated[
+        TalentSearchService, Depends(get_talent_search_service_readonly)
+    ],
+    limit: int = 20,
+):
+    """Rank the whole candidate pool against one of the organization's jobs."""
+    try:
+        organization_id = require_recruiter_with_organization(current_user)
+        return await talent_search_service.search_candidates_for_job(
+            job_id=job_id, organization_id=organization_id, limit=limit
+        )
+    except ValueError as e:
+        detail = str(e)
+        if "Access denied" in detail:
+            status_code = status.HTTP_403_FORBIDDEN
+        elif detail == "Job not found":
+            status_code = status.HTTP_404_NOT_FOUND
+        elif detail == "Talent search is unavailable right now":
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        else:
+            status_code = status.HTTP_400_BAD_REQUEST
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
 @router.get(
     "/applications/{application_id}/resume",
     response_model=ResumeResponse,
@@ -56,9 +96,9 @@ async def get_all_candidates(
 async def get_application_resume_detail(
     request: Request,
     application_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     candidate_service: Annotated[
-        RecruiterCandidateService, Depends(get_recruiter_candidate_service)
+        RecruiterCandidateService, Depends(get_recruiter_candidate_service_readonly)
     ],
 ):
     try:
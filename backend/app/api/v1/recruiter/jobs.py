@@ -6,10 +6,13 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request,
 from app.api.dependencies import (
     get_job_generation_service,
     get_job_service,
+    get_job_service_readonly,
     get_reference_jd_service,
+    get_reference_jd_service_readonly,
     get_shortlist_service,
+    get_shortlist_service_readonly,
 )
-from app.core import get_current_active_user
+from app.core import get_current_active_user, get_current_active_user_readonly
 from app.core.authorization import (
     require_recruiter_with_organization,
     verify_user_can_edit_job,
@@ -195,9 +198,11 @@ async def trigger_shortlisting(
 async def get_shortlisting_summary(
     request: Request,
     job_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    job_service: Annotated[JobService, Depends(get_job_service)],
-    shortlist_service: Annotated[ShortlistService, Depends(get_shortlist_service)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
+    job_service: Annotated[JobService, Depends(get_job_service_readonly)],
+    shortlist_service: Annotated[
+        ShortlistService, Depends(get_shortlist_service_readonly)
+    ],
 ):
     job = await job_service.get_job_by_id(job_id)
     if not job:
@@ -240,9 +245,9 @@ async def create_reference_jd(
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_reference_jds(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     reference_jd_service: Annotated[
-        ReferenceJDService, Depends(get_reference_jd_service)
+        ReferenceJDService, Depends(get_reference_jd_service_readonly)
     ],
 ):
     try:
@@ -271,9 +276,9 @@ async def get_reference_jds(
 async def get_reference_jd_by_id(
     request: Request,
     reference_jd_id: uuid.UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
     reference_jd_service: Annotated[
-        ReferenceJDService, Depends(get_reference_jd_service)
+        ReferenceJDService, Depends(get_reference_jd_service_readonly)
     ],
 ):
     try:
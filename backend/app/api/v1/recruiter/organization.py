@@ -5,7 +5,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from app.api.dependencies import (
     get_organization_service,
+    get_organization_service_readonly,
     get_recruiter_crud_service,
+    get_recruiter_crud_service_readonly,
 )
 from app.core import get_current_recruiter_organization_id
 from app.core.authorization import verify_recruiter_belongs_to_organization
@@ -29,7 +31,7 @@ router = APIRouter()
 async def get_organization_profile(
     request: Request,
     organization_service: Annotated[
-        OrganizationService, Depends(get_organization_service)
+        OrganizationService, Depends(get_organization_service_readonly)
     ],
     organization_id: uuid.UUID = Depends(get_current_recruiter_organization_id),
 ):
@@ -67,7 +69,7 @@ async def update_organization_profile(
 async def get_organization_recruiters(
     request: Request,
     recruiter_crud_service: Annotated[
-        RecruiterCrudService, Depends(get_recruiter_crud_service)
+        RecruiterCrudService, Depends(get_recruiter_crud_service_readonly)
     ],
     organization_id: uuid.UUID = Depends(get_current_recruiter_organization_id),
 ):
@@ -103,7 +105,7 @@ async def get_recruiter(
     request: Request,
     recruiter_id: uuid.UUID,
     recruiter_crud_service: Annotated[
-        RecruiterCrudService, Depends(get_recruiter_crud_service)
+        RecruiterCrudService, Depends(get_recruiter_crud_service_readonly)
     ],
     organization_id: uuid.UUID = Depends(get_current_recruiter_organization_id),
 ):
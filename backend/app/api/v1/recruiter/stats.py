@@ -2,8 +2,8 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.dependencies import get_stats_service
-from app.core import get_current_active_user
+from app.api.dependencies import get_stats_service_readonly
+from app.core import get_current_active_user_readonly
 from app.core.config import settings
 from app.core.limiter import limiter
 from app.db.models.user import User
@@ -16,8 +16,8 @@ router = APIRouter()
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_active_jobs_count(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    stats_service: Annotated[StatsService, Depends(get_stats_service)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
+    stats_service: Annotated[StatsService, Depends(get_stats_service_readonly)],
 ):
     count = await stats_service.get_active_jobs_count(current_user)
     if count is None:
@@ -32,8 +32,8 @@ async def get_active_jobs_count(
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_active_candidates_count(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    stats_service: Annotated[StatsService, Depends(get_stats_service)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
+    stats_service: Annotated[StatsService, Depends(get_stats_service_readonly)],
 ):
     count = await stats_service.get_active_candidates_count(current_user)
     if count is None:
@@ -48,8 +48,8 @@ async def get_active_candidates_count(
 @limiter.limit(settings.RATE_LIMIT_API)
 async def get_recent_activity(
     request: Request,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    stats_service: Annotated[StatsService, Depends(get_stats_service)],
+    current_user: Annotated[User, Depends(get_current_active_user_readonly)],
+    stats_service: Annotated[StatsService, Depends(get_stats_service_readonly)],
     limit: int = 20,
 ):
     activities = await stats_service.get_recent_activity(current_user, limit=limit)
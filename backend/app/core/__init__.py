@@ -7,6 +7,7 @@ from .logging_config import logger
 from .security import (
     create_token,
     get_current_active_user,
+    get_current_active_user_readonly,
     get_current_organization_id,
     get_current_recruiter_organization_id,
     get_current_user_id,
@@ -26,6 +27,7 @@ __all__ = [
     "verify_token",
     "get_current_user_id",
     "get_current_active_user",
+    "get_current_active_user_readonly",
     "get_current_organization_id",
     "get_current_recruiter_organization_id",
     "logger",
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,10 +18,57 @@ class Settings(BaseSettings):
     ENVIRONMENT: str
     APP_VERSION: str
     DATABASE_URL: str
+    # "direct" caches prepared statements per connection; "pgbouncer" does too
+    # with uniquely named statements (PgBouncer >= 1.21 with
+    # max_prepared_statements set); "pgbouncer_unprepared" disables caching
+    # for older transaction poolers
+    DB_ENGINE_PROFILE: Literal["direct", "pgbouncer", "pgbouncer_unprepared"] = (
+        "pgbouncer_unprepared"
+    )
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PREWARM: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 500
+    # Read-only dependencies use the replica when set; a user who just wrote
+    # stays on the primary for DB_REPLICA_STICKY_SECONDS to read their writes
+    DATABASE_REPLICA_URL: str | None = None
+    DB_REPLICA_STICKY_SECONDS: float = 5
     QDRANT_URL: str
     QDRANT_COLLECTION_NAME: str
     EMBEDDING_MODEL: str
+    # Lower values (1536, 768) truncate the Matryoshka embedding at the source
     EMBEDDING_DIM: int = 3072
+    EMBEDDING_BATCH_MAX_SIZE: int = 100
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5
+    VECTOR_BACKEND: Literal["qdrant", "local"] = "qdrant"
+    VECTOR_FAILOVER_CACHE: bool = True
+    LOCAL_VECTOR_INDEX_PATH: str = "data/vector_index"
+    QDRANT_QUANTIZATION: Literal["none", "scalar", "binary"] = "none"
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    QDRANT_ON_DISK_VECTORS: bool = False
+    QDRANT_SEARCH_OVERSAMPLING: float = 2.0
+    QDRANT_SEARCH_RESCORE: bool = True
+    QDRANT_SKILL_QUERY_COLLECTION_NAME: str = "candidate_skill_queries"
+    QDRANT_CANDIDATE_COLLECTION_NAME: str = "candidate_profiles"
+    RECOMMENDATION_TOP_K: int = 100
+    RECOMMENDATION_BATCH_SIZE: int = 100
+    INDEXING_BATCH_SIZE: int = 64
+    SHORTLIST_WRITE_BATCH_SIZE: int = 10
+    INDEXING_CONCURRENCY: int = 4
+    INDEX_SYNC_INTERVAL_SECONDS: int = 30
+    INDEX_SYNC_BATCH_SIZE: int = 100
+    INDEX_SYNC_MAX_ATTEMPTS: int = 5
+    REINDEX_THROTTLE_SECONDS: float = 0.5
+    SEARCH_CACHE_TTL_SECONDS: int = 120
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    SIMILAR_JOBS_POOL_SIZE: int = 20
+    SIMILAR_JOBS_CACHE_TTL_SECONDS: int = 600
+    # Queries of up to this many words try the full-text index before embedding
+    LEXICAL_SEARCH_MAX_TERMS: int = 2
+    SEARCH_RRF_K: int = 60
+    SUGGESTIONS_REBUILD_INTERVAL_MINUTES: int = 15
     FAST_LLM: str = "llama-3.1-8b-instant"
     THINK_LLM: str = "openai/gpt-oss-120b"
     LLM_TEMPERATURE: int = 0
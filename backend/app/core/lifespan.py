@@ -1,6 +1,6 @@
 import asyncio
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import anyio
 from alembic import command
@@ -8,10 +8,15 @@ from alembic.config import Config
 from fastapi import FastAPI
 from sqlalchemy.exc import OperationalError
 
+from app.core.config import settings
 from app.core.logging_config import logger
-from app.db.session import AsyncSessionLocal, engine
-from app.integrations.qdrant.vector_service import JobVectorService
-from app.worker.scheduler import shutdown_scheduler, start_scheduler
+from app.db.session import AsyncSessionLocal, engine, prewarm_pool, replica_engine
+from app.integrations.qdrant.vector_service import get_job_vector_service
+from app.worker.scheduler import (
+    rebuild_suggestions_task,
+    shutdown_scheduler,
+    start_scheduler,
+)
 
 
 def run_alembic_upgrade():
@@ -42,7 +47,24 @@ def run_alembic_upgrade():
             raise
 
 
-async def _run_startup_tasks():
+async def _index_pending_jobs():
+    try:
+        vector_service = get_job_vector_service()
+        await vector_service.ensure_collection()
+        await vector_service.apply_storage_config()
+        await vector_service.detect_alias_swap()  # Records the current alias target
+        await vector_service.sync_local_index()
+        logger.info("Indexing pending active jobs...")
+        async with AsyncSessionLocal() as db:
+            await vector_service.index_all_pending_jobs(db)
+    except asyncio.CancelledError:
+        logger.info("Startup indexing cancelled; it resumes on next start.")
+        raise
+    except Exception as e:
+        logger.error(f"Startup indexing error: {e}")
+
+
+async def _run_startup_tasks() -> asyncio.Task:
     try:
         await anyio.to_thread.run_sync(run_alembic_upgrade)
         logger.success("Database migrations applied successfully.")
@@ -50,20 +72,22 @@ async def _run_startup_tasks():
         logger.error(f"Migration error: {e}")
         raise
 
-    try:
-        logger.info("Indexing pending active jobs...")
-        async with AsyncSessionLocal() as db:
-            vector_service = JobVectorService()
-            await vector_service.index_all_pending_jobs(db)
-        logger.success("System Ready!")
-    except Exception as e:
-        logger.error(f"Startup indexing error: {e}")
+    if settings.DB_POOL_PREWARM:
+        await prewarm_pool(engine)
+        if replica_engine is not engine:
+            await prewarm_pool(replica_engine)
+    await rebuild_suggestions_task()
+
+    # Indexing runs in the background so a large backlog doesn't block startup
+    indexing_task = asyncio.create_task(_index_pending_jobs())
+    logger.success("System Ready!")
+    return indexing_task
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting ConvexHire API...")
-    await _run_startup_tasks()
+    indexing_task = await _run_startup_tasks()
     start_scheduler()
     try:
         yield
@@ -71,6 +95,11 @@ async def lifespan(app: FastAPI):
         pass
     finally:
         logger.trace("Shutting down ConvexHire API...")
+        if not indexing_task.done():
+            indexing_task.cancel()
+        # Let indexing release its connection before the engine is disposed
+        with suppress(asyncio.CancelledError):
+            await indexing_task
         try:
             shutdown_scheduler()
         except Exception as e:
@@ -79,5 +108,7 @@ async def lifespan(app: FastAPI):
             )
         try:
             await engine.dispose()
+            if replica_engine is not engine:
+                await replica_engine.dispose()
         except (Exception, asyncio.CancelledError) as e:
             logger.debug(f"Error disposing engine (may be expected during reload): {e}")
@@ -0,0 +1,110 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+
+# Results memoized per prefix, enough for any type-ahead dropdown
+MEMO_SIZE = 20
+MEMO_MAX_PREFIXES = 10_000
+
+
+class PrefixIndex:
+    """In-memory type-ahead index of weighted terms
+
+    Every word suffix of a term is kept as a key in one sorted list, so
+    "eng" matches both "Engineering Manager" and "Software Engineer". A
+    lookup is a bisect to the first key with the prefix, a scan over the
+    matching keys and a top-k by weight, memoized per prefix so that broad
+    one or two letter prefixes are only scanned once between writes. Terms
+    are matched case-insensitively and shown as first added.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: list[tuple[str, str]] = []
+        self._weights: dict[str, int] = {}
+        self._display: dict[str, str] = {}
+        self._memo: dict[str, list[str]] = {}
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def _suffix_keys(term: str) -> list[tuple[str, str]]:
+        words = term.split(" ")
+        return [(" ".join(words[i:]), term) for i in range(len(words))]
+
+    def _invalidate(self, term: str) -> None:
+        keys = [key for key, _ in self._suffix_keys(term)]
+        for prefix in [p for p in self._memo if any(k.startswith(p) for k in keys)]:
+            del self._memo[prefix]
+
+    def add(self, text: str, weight: int = 1) -> None:
+        term = self._normalize(text)
+        if not term:
+            return
+        with self._lock:
+            self._invalidate(term)
+            if term not in self._weights:
+                self._weights[term] = 0
+                self._display[term] = text.strip()
+                for key in self._suffix_keys(term):
+                    insort(self._keys, key)
+            self._weights[term] += weight
+
+    def remove(self, text: str, weight: int = 1) -> None:
+        term = self._normalize(text)
+        with self._lock:
+            if term not in self._weights:
+                return
+            self._invalidate(term)
+            self._weights[term] -= weight
+            if self._weights[term] > 0:
+                return
+            del self._weights[term]
+            del self._display[term]
+            for key in self._suffix_keys(term):
+                i = bisect_left(self._keys, key)
+                if i < len(self._keys) and self._keys[i] == key:
+                    del self._keys[i]
+
+    def replace(self, weighted_terms: list[tuple[str, int]]) -> None:
+        """Rebuild the whole index from (term, weight) pairs"""
+        weights: dict[str, int] = {}
+        display: dict[str, str] = {}
+        for text, weight in weighted_terms:
+            term = self._normalize(text)
+            if not term:
+                continue
+            weights[term] = weights.get(term, 0) + weight
+            display.setdefault(term, text.strip())
+        keys = sorted(key for term in weights for key in self._suffix_keys(term))
+        with self._lock:
+            self._keys, self._weights, self._display = keys, weights, display
+            self._memo = {}
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        """Get the heaviest terms with a word starting with `prefix`"""
+        prefix = self._normalize(prefix)
+        if not prefix or limit <= 0:
+            return []
+        with self._lock:
+            top = self._memo.get(prefix)
+            if top is None or limit > MEMO_SIZE:
+                matches = set()
+                i = bisect_left(self._keys, (prefix,))
+                while i < len(self._keys) and self._keys[i][0].startswith(prefix):
+                    matches.add(self._keys[i][1])
+                    i += 1
+                top = heapq.nlargest(
+                    max(limit, MEMO_SIZE),
+                    matches,
+                    key=lambda term: (self._weights[term], term),
+                )
+                if len(self._memo) >= MEMO_MAX_PREFIXES:
+                    self._memo.clear()
+                self._memo[prefix] = top[:MEMO_SIZE]
+            return [self._display[term] for term in top[:limit]]
+
+    def __len__(self) -> int:
+        return len(self._weights)
@@ -9,7 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.session import get_db
+from app.db.session import get_db, get_db_readonly
 
 from .config import settings
 from .current_datetime import get_datetime
@@ -103,10 +103,7 @@ def get_current_organization_id(request: Request) -> uuid.UUID:
     return entity_id
 
 
-async def get_current_active_user(
-    db: AsyncSession = Depends(get_db),
-    user_id: uuid.UUID = Depends(get_current_user_id),
-) -> "User":
+async def _load_active_user(db: AsyncSession, user_id: uuid.UUID) -> "User":
     from app.db.models.user import User
 
     result = await db.execute(
@@ -122,6 +119,21 @@ async def get_current_active_user(
     return user
 
 
+async def get_current_active_user(
+    db: AsyncSession = Depends(get_db),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+) -> "User":
+    return await _load_active_user(db, user_id)
+
+
+async def get_current_active_user_readonly(
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+    user_id: uuid.UUID = Depends(get_current_user_id),
+) -> "User":
+    """Current user for read-only endpoints, loaded without a write transaction"""
+    return await _load_active_user(db, user_id)
+
+
 def get_current_user_id_optional(request: Request) -> uuid.UUID | None:
     token = request.cookies.get("auth_token")
     if not token:
@@ -136,7 +148,7 @@ def get_current_user_id_optional(request: Request) -> uuid.UUID | None:
 
 
 async def get_current_active_user_optional(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
     user_id: uuid.UUID | None = Depends(get_current_user_id_optional),
 ) -> "User | None":
     if not user_id:
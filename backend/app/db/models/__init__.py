@@ -9,8 +9,9 @@ from .candidate import (
     CandidateSocialLink,
     CandidateWorkExperience,
 )
-from .job import JobDescription, JobPosting, ReferenceJD
+from .job import IndexAction, JobDescription, JobIndexOutbox, JobPosting, ReferenceJD
 from .organization import Organization
+from .recommendation import JobRecommendation, JobRecommendationRefresh
 from .resume import (
     Resume,
     ResumeCertification,
@@ -41,8 +42,12 @@ __all__ = [
     "ResumeSkills",
     "JobPosting",
     "JobDescription",
+    "JobIndexOutbox",
+    "IndexAction",
     "JobApplication",
     "JobApplicationStatusHistory",
     "ApplicationStatus",
     "ReferenceJD",
+    "JobRecommendation",
+    "JobRecommendationRefresh",
 ]
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core import get_datetime
@@ -23,6 +23,15 @@ class ApplicationStatus(StrEnum):
 
 class JobApplication(Base):
     __tablename__ = "job_application"
+    __table_args__ = (
+        Index("ix_job_application_job_applied", "job_id", "applied_at"),
+        Index(
+            "ix_job_application_organization_applied", "organization_id", "applied_at"
+        ),
+        Index(
+            "ix_job_application_candidate_applied", "candidate_profile_id", "applied_at"
+        ),
+    )
     application_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
     candidate_profile_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("candidate_profile.profile_id"), nullable=False
@@ -62,6 +71,13 @@ class JobApplication(Base):
 
 class JobApplicationStatusHistory(Base):
     __tablename__ = "job_application_status_history"
+    __table_args__ = (
+        Index(
+            "ix_job_application_status_history_application_changed",
+            "application_id",
+            "changed_at",
+        ),
+    )
     status_history_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
     application_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("job_application.application_id"), nullable=False
@@ -3,8 +3,19 @@ from datetime import date, datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, Uuid
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Uuid,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core import get_datetime
@@ -19,13 +30,37 @@ class ShortlistStatus(StrEnum):
     COMPLETED = "completed"
 
 
+class IndexAction(StrEnum):
+    # PAYLOAD still re-embeds when the job text hash no longer matches
+    REINDEX = "reindex"
+    PAYLOAD = "payload"
+    DELETE = "delete"
+
+
 if TYPE_CHECKING:
     from .organization import Organization
     from .user import User
 
+# Full-text search documents, weighted title > summary > lists. `job_text_array`
+# is an IMMUTABLE wrapper of array_to_string, created by the migration, since
+# generated columns only accept immutable expressions.
+JOB_DESCRIPTION_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(job_summary, '')), 'B') || "
+    "setweight(to_tsvector('english', job_text_array(job_responsibilities) || ' ' "
+    "|| job_text_array(required_qualifications)), 'C') || "
+    "setweight(to_tsvector('english', job_text_array(preferred) || ' ' "
+    "|| job_text_array(compensation_and_benefits)), 'D')"
+)
+JOB_POSTING_SEARCH_VECTOR = "setweight(to_tsvector('english', title), 'A')"
+
 
 class JobDescription(Base):
     __tablename__ = "job_description"
+    __table_args__ = (
+        Index(
+            "ix_job_description_search_vector", "search_vector", postgresql_using="gin"
+        ),
+    )
     job_description_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
     job_summary: Mapped[str] = mapped_column(String, nullable=False)
     job_responsibilities: Mapped[list[str]] = mapped_column(
@@ -38,6 +73,9 @@ class JobDescription(Base):
     compensation_and_benefits: Mapped[list[str] | None] = mapped_column(
         ARRAY(String), nullable=True
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(JOB_DESCRIPTION_SEARCH_VECTOR, persisted=True), deferred=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=get_datetime, nullable=False
     )
@@ -51,6 +89,27 @@ class JobDescription(Base):
 
 class JobPosting(Base):
     __tablename__ = "job_posting"
+    __table_args__ = (
+        Index("ix_job_posting_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_job_posting_organization_posted",
+            "organization_id",
+            "posted_date",
+            "job_id",
+        ),
+        # Visible listings and deadline expiry only ever read active jobs
+        Index(
+            "ix_job_posting_active_posted",
+            "posted_date",
+            "job_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_job_posting_active_deadline",
+            "application_deadline",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
     job_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
     organization_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("organization.organization_id"), nullable=False
@@ -62,6 +121,9 @@ class JobPosting(Base):
         Uuid, ForeignKey("user.user_id"), nullable=True
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(JOB_POSTING_SEARCH_VECTOR, persisted=True), deferred=True
+    )
     department: Mapped[str | None] = mapped_column(String, nullable=True)
     level: Mapped[str | None] = mapped_column(String, nullable=True)
     location_city: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -75,6 +137,7 @@ class JobPosting(Base):
     salary_currency: Mapped[str | None] = mapped_column(String, nullable=True)
     status: Mapped[str] = mapped_column(String, default="active", nullable=False)
     is_indexed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    embedded_text_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     auto_shortlist: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     shortlist_status: Mapped[str] = mapped_column(
         String, default=ShortlistStatus.NOT_STARTED, nullable=False
@@ -150,3 +213,17 @@ class ReferenceJD(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=get_datetime, onupdate=get_datetime, nullable=False
     )
+
+
+class JobIndexOutbox(Base):
+    """Pending vector index changes, written in the same transaction as the job"""
+
+    __tablename__ = "job_index_outbox"
+    event_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    job_id: Mapped[uuid.UUID] = mapped_column(Uuid, index=True, nullable=False)
+    action: Mapped[str] = mapped_column(String, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_datetime, index=True, nullable=False
+    )
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core import get_datetime
+
+from . import Base
+
+
+class JobRecommendation(Base):
+    """Materialized top-K job matches for a candidate profile"""
+
+    __tablename__ = "job_recommendation"
+    __table_args__ = (
+        Index("ix_job_recommendation_profile_rank", "profile_id", "score", "job_id"),
+    )
+    profile_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("candidate_profile.profile_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("job_posting.job_id"), primary_key=True, index=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_datetime, nullable=False
+    )
+
+
+class JobRecommendationRefresh(Base):
+    """When a profile's recommendations were last materialized
+
+    Kept even when the refresh found no matching jobs, so an empty result
+    is not recomputed on every read.
+    """
+
+    __tablename__ = "job_recommendation_refresh"
+    profile_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("candidate_profile.profile_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=get_datetime, nullable=False
+    )
@@ -1,14 +1,15 @@
 import uuid
 from collections.abc import Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import JSON, Row, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
 from app.db.models.application import JobApplication, JobApplicationStatusHistory
-from app.db.models.candidate import CandidateProfile
+from app.db.models.candidate import CandidateProfile, CandidateSocialLink
 from app.db.models.job import JobPosting
 from app.db.models.resume import Resume
+from app.db.models.user import User
 from app.db.repositories.base import BaseRepository
 
 
@@ -131,6 +132,70 @@ class JobApplicationRepository(BaseRepository[JobApplication]):
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_candidate_summaries(
+        self, organization_id: uuid.UUID, skip: int = 0, limit: int = 100
+    ) -> Sequence[Row]:
+        """Flat rows for the recruiter candidate list, in one query
+
+        Selects only the listed columns, with the candidate's social links
+        aggregated to JSON. Each row also carries the organization's total
+        application count.
+        """
+        social_links = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        func.json_build_object(
+                            "social_link_id",
+                            CandidateSocialLink.social_link_id,
+                            "type",
+                            CandidateSocialLink.type,
+                            "url",
+                            CandidateSocialLink.url,
+                        )
+                    ),
+                    literal([], JSON),
+                    type_=JSON,
+                )
+            )
+            .where(
+                CandidateSocialLink.profile_id == JobApplication.candidate_profile_id
+            )
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                JobApplication.application_id,
+                JobApplication.job_id,
+                JobPosting.title.label("job_title"),
+                JobApplication.candidate_profile_id.label("candidate_id"),
+                User.name,
+                User.email,
+                CandidateProfile.phone,
+                User.picture,
+                CandidateProfile.professional_headline,
+                CandidateProfile.professional_summary,
+                JobApplication.current_status,
+                JobApplication.applied_at,
+                JobApplication.score,
+                JobApplication.feedback,
+                social_links.label("social_links"),
+                func.count().over().label("total"),
+            )
+            .join(JobPosting, JobPosting.job_id == JobApplication.job_id)
+            .join(
+                CandidateProfile,
+                CandidateProfile.profile_id == JobApplication.candidate_profile_id,
+            )
+            .join(User, User.user_id == CandidateProfile.user_id)
+            .where(JobApplication.organization_id == organization_id)
+            .order_by(JobApplication.applied_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return result.all()
+
     async def count_by_organization(self, organization_id: uuid.UUID) -> int:
         """Count applications by organization"""
         query = select(func.count(JobApplication.application_id)).where(
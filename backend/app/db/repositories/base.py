@@ -1,4 +1,5 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import select, update
@@ -58,7 +59,28 @@ class BaseRepository[ModelType: Base]:
         return obj
 
     async def update(self, id: UUID, **kwargs) -> ModelType | None:
-        query = update(self.model).where(self._pk_column == id).values(**kwargs)
-        await self.db.execute(query)
-        await self.db.flush()
-        return await self.get(id)
+        return await self.update_returning(id, **kwargs)
+
+    async def update_returning(self, id: UUID, **kwargs) -> ModelType | None:
+        """Update a row and load it back from the same UPDATE ... RETURNING
+
+        An instance already in the session gets the new column values and
+        keeps its loaded relationships.
+        """
+        query = (
+            update(self.model)
+            .where(self._pk_column == id)
+            .values(**kwargs)
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def bulk_update(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Update several rows by primary key in one executemany
+
+        Each mapping holds the primary key attribute plus the values to set.
+        """
+        if rows:
+            await self.db.execute(update(self.model), [dict(row) for row in rows])
@@ -1,7 +1,7 @@
 import uuid
 from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -54,6 +54,85 @@ class CandidateProfileRepository(BaseRepository[CandidateProfile]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_batch_with_skills(
+        self, after_profile_id: uuid.UUID | None = None, limit: int = 100
+    ) -> Sequence[CandidateProfile]:
+        """Get the next batch of profiles that have skills, ordered by profile ID"""
+        query = (
+            select(CandidateProfile)
+            .options(selectinload(CandidateProfile.skills))
+            .where(CandidateProfile.skills.any())
+            .order_by(CandidateProfile.profile_id)
+            .limit(limit)
+        )
+        if after_profile_id:
+            query = query.where(CandidateProfile.profile_id > after_profile_id)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    def _search_details_query(self):
+        return (
+            select(CandidateProfile)
+            .options(
+                selectinload(CandidateProfile.skills),
+                selectinload(CandidateProfile.work_experiences),
+            )
+            .execution_options(populate_existing=True)
+        )
+
+    async def get_with_search_details(
+        self, profile_id: uuid.UUID
+    ) -> CandidateProfile | None:
+        """Get a profile with the fields that feed its talent search embedding"""
+        query = self._search_details_query().where(
+            CandidateProfile.profile_id == profile_id
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_many_with_search_details(
+        self, profile_ids: Sequence[uuid.UUID]
+    ) -> Sequence[CandidateProfile]:
+        """Get several profiles with the fields that feed their embeddings"""
+        if not profile_ids:
+            return []
+        query = self._search_details_query().where(
+            CandidateProfile.profile_id.in_(profile_ids)
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_search_batch(
+        self, after_profile_id: uuid.UUID | None = None, limit: int = 100
+    ) -> Sequence[CandidateProfile]:
+        """Get the next batch of profiles with search details, ordered by ID"""
+        query = (
+            self._search_details_query()
+            .order_by(CandidateProfile.profile_id)
+            .limit(limit)
+        )
+        if after_profile_id:
+            query = query.where(CandidateProfile.profile_id > after_profile_id)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_many_with_user(
+        self, profile_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, CandidateProfile]:
+        """Get profiles with user and skills keyed by profile ID"""
+        if not profile_ids:
+            return {}
+        query = (
+            select(CandidateProfile)
+            .options(
+                selectinload(CandidateProfile.user),
+                selectinload(CandidateProfile.skills),
+            )
+            .where(CandidateProfile.profile_id.in_(profile_ids))
+        )
+        result = await self.db.execute(query)
+        return {profile.profile_id: profile for profile in result.scalars().all()}
+
 
 class CandidateSkillsRepository(BaseRepository[CandidateSkills]):
     def __init__(self, db: AsyncSession):
@@ -69,6 +148,16 @@ class CandidateSkillsRepository(BaseRepository[CandidateSkills]):
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_skill_counts(self) -> list[tuple[str, int]]:
+        """Get each skill name with its number of profiles, most common first"""
+        query = (
+            select(CandidateSkills.skill_name, func.count())
+            .group_by(CandidateSkills.skill_name)
+            .order_by(func.count().desc())
+        )
+        result = await self.db.execute(query)
+        return [(skill_name, count) for skill_name, count in result.all()]
+
 
 class CandidateWorkExperienceRepository(BaseRepository[CandidateWorkExperience]):
     def __init__(self, db: AsyncSession):
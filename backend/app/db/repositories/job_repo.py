@@ -1,29 +1,213 @@
 import math
 import uuid
 from collections.abc import Sequence
-from datetime import date
-
-from sqlalchemy import case, delete, func, or_, select, update
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import (
+    Uuid,
+    any_,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core import get_datetime
+from app.core.pagination import encode_cursor
 from app.db.models.application import (
     JobApplication,
     JobApplicationStatusHistory,
 )
-from app.db.models.job import JobDescription, JobPosting, ReferenceJD
+from app.db.models.job import (
+    IndexAction,
+    JobDescription,
+    JobIndexOutbox,
+    JobPosting,
+    ReferenceJD,
+)
+from app.db.models.organization import Organization
+from app.db.models.recommendation import JobRecommendation
 from app.db.models.user import User
 from app.db.repositories.base import BaseRepository
 
 VISIBLE_STATUSES = ["active"]
 
 
+def visible_job_conditions() -> list:
+    """Filter conditions for jobs that candidates are allowed to see"""
+    return [
+        JobPosting.status.in_(VISIBLE_STATUSES),
+        or_(
+            JobPosting.application_deadline.is_(None),
+            JobPosting.application_deadline >= date.today(),
+        ),
+    ]
+
+
+def job_id_array(job_ids: Sequence[uuid.UUID]):
+    """Bind job IDs as one uuid[] parameter, keeping the SQL text constant"""
+    return literal(list(job_ids), ARRAY(Uuid))
+
+
+def ranked_job_ids(job_ids: Sequence[uuid.UUID]):
+    """Table of (job_id, rank) from ranked IDs, via unnest WITH ORDINALITY"""
+    return (
+        func.unnest(job_id_array(job_ids))
+        .table_valued("job_id", with_ordinality="rank")
+        .render_derived(name="ranked")
+    )
+
+
+@dataclass(slots=True)
+class JobOrganizationRow:
+    """Organization fields shown alongside a job in listings"""
+
+    id: uuid.UUID
+    name: str
+    description: str | None
+    location_city: str | None
+    location_country: str | None
+    website: str | None
+    industry: str | None
+    founded_year: int | None
+
+
+@dataclass(slots=True)
+class JobListingRow:
+    """A visible job as read by the Core listing queries
+
+    Carries the same attributes `JobResponse` reads from a `JobPosting`, so
+    either can be returned from the listing endpoints.
+    """
+
+    job_id: uuid.UUID
+    organization_id: uuid.UUID
+    job_description_id: uuid.UUID
+    title: str
+    department: str | None
+    level: str | None
+    employment_type: str | None
+    status: str
+    location_city: str | None
+    location_country: str | None
+    location_type: str
+    salary_min: int | None
+    salary_max: int | None
+    salary_currency: str | None
+    posted_date: date
+    application_deadline: date | None
+    auto_shortlist: bool
+    shortlist_status: str
+    created_at: datetime
+    updated_at: datetime
+    job_summary: str
+    job_responsibilities: list[str]
+    required_qualifications: list[str] | None
+    preferred: list[str] | None
+    compensation_and_benefits: list[str] | None
+    organization: JobOrganizationRow
+
+    @property
+    def id(self) -> uuid.UUID:
+        return self.job_id
+
+
+# In the field order of JobListingRow and JobOrganizationRow
+JOB_LISTING_COLUMNS = (
+    JobPosting.job_id,
+    JobPosting.organization_id,
+    JobPosting.job_description_id,
+    JobPosting.title,
+    JobPosting.department,
+    JobPosting.level,
+    JobPosting.employment_type,
+    JobPosting.status,
+    JobPosting.location_city,
+    JobPosting.location_country,
+    JobPosting.location_type,
+    JobPosting.salary_min,
+    JobPosting.salary_max,
+    JobPosting.salary_currency,
+    JobPosting.posted_date,
+    JobPosting.application_deadline,
+    JobPosting.auto_shortlist,
+    JobPosting.shortlist_status,
+    JobPosting.created_at,
+    JobPosting.updated_at,
+    JobDescription.job_summary,
+    JobDescription.job_responsibilities,
+    JobDescription.required_qualifications,
+    JobDescription.preferred,
+    JobDescription.compensation_and_benefits,
+)
+JOB_ORGANIZATION_COLUMNS = (
+    Organization.organization_id,
+    Organization.name,
+    Organization.description,
+    Organization.location_city,
+    Organization.location_country,
+    Organization.website,
+    Organization.industry,
+    Organization.founded_year,
+)
+
+
+def job_listing_select():
+    """One joined Core SELECT of everything a job listing shows"""
+    return (
+        select(*JOB_LISTING_COLUMNS, *JOB_ORGANIZATION_COLUMNS)
+        .select_from(JobPosting)
+        .join(
+            JobDescription,
+            JobDescription.job_description_id == JobPosting.job_description_id,
+        )
+        .join(Organization, Organization.organization_id == JobPosting.organization_id)
+    )
+
+
+def job_listing_rows(result) -> list[JobListingRow]:
+    """Map rows of `job_listing_select` positionally, without the ORM"""
+    split = len(JOB_LISTING_COLUMNS)
+    return [
+        JobListingRow(*row[:split], JobOrganizationRow(*row[split:])) for row in result
+    ]
+
+
 class JobRepository(BaseRepository[JobPosting]):
     def __init__(self, db: AsyncSession):
         super().__init__(JobPosting, db)
 
+    async def enqueue_index_events(
+        self, job_ids: Sequence[uuid.UUID], action: IndexAction
+    ) -> None:
+        """Record vector index changes in the outbox within the current transaction"""
+        if not job_ids:
+            return
+        now = get_datetime()
+        await self.db.execute(
+            insert(JobIndexOutbox),
+            [
+                {
+                    "event_id": uuid.uuid4(),
+                    "job_id": job_id,
+                    "action": action,
+                    "attempts": 0,
+                    "created_at": now,
+                }
+                for job_id in job_ids
+            ],
+        )
+
     async def get_with_details(self, job_id: uuid.UUID) -> JobPosting | None:
         """Get job with organization and description details"""
         query = (
@@ -45,66 +229,279 @@ class JobRepository(BaseRepository[JobPosting]):
         location_type: str | None = None,
         job_ids: list[uuid.UUID] | None = None,
         order_by_date: bool = True,
+        after: tuple[date, uuid.UUID] | None = None,
+        total: int | None = None,
     ) -> dict:
-        """Get paginated visible jobs with filters"""
-        today = date.today()
-        base_stmt = (
-            select(JobPosting)
-            .options(
-                selectinload(JobPosting.organization),
-                selectinload(JobPosting.job_description),
-            )
-            .where(
-                JobPosting.status.in_(VISIBLE_STATUSES),
-                or_(
-                    JobPosting.application_deadline.is_(None),
-                    JobPosting.application_deadline >= today,
-                ),
-            )
-        )
+        """Get paginated visible jobs with filters
 
-        # Apply filters
-        if job_ids:
-            base_stmt = base_stmt.where(JobPosting.job_id.in_(job_ids))
+        Date-ordered pages start right after the `after` (posted_date, job_id)
+        key when it is given, otherwise `page` is applied as an offset. A known
+        `total` skips the count query.
+        """
+        stmt = select(JobPosting).options(
+            selectinload(JobPosting.organization),
+            selectinload(JobPosting.job_description),
+        )
+        result, total = await self._get_visible_page(
+            stmt,
+            page,
+            limit,
+            employment_type,
+            location_type,
+            job_ids,
+            order_by_date,
+            after,
+            total,
+        )
+        jobs = list(result.scalars().all())
+        return self._keyset_page(jobs, total, page, limit, after, order_by_date)
 
-        if employment_type:
-            base_stmt = base_stmt.where(JobPosting.employment_type == employment_type)
+    async def get_visible_listing_paginated(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        employment_type: str | None = None,
+        location_type: str | None = None,
+        job_ids: list[uuid.UUID] | None = None,
+        order_by_date: bool = True,
+        after: tuple[date, uuid.UUID] | None = None,
+        total: int | None = None,
+    ) -> dict:
+        """Same page as `get_visible_jobs_paginated`, as `JobListingRow`s
 
-        if location_type:
-            base_stmt = base_stmt.where(JobPosting.location_type == location_type)
+        Reads the page with one joined Core query instead of loading
+        `JobPosting` objects and their relationships, for read-only listings.
+        """
+        result, total = await self._get_visible_page(
+            job_listing_select(),
+            page,
+            limit,
+            employment_type,
+            location_type,
+            job_ids,
+            order_by_date,
+            after,
+            total,
+        )
+        jobs = job_listing_rows(result)
+        return self._keyset_page(jobs, total, page, limit, after, order_by_date)
 
-        if job_ids and not order_by_date:
-            order_mapping = {job_id: idx for idx, job_id in enumerate(job_ids)}
-            order_case = case(order_mapping, value=JobPosting.job_id)
-            base_stmt = base_stmt.order_by(order_case)
+    async def _get_visible_page(
+        self,
+        stmt,
+        page: int,
+        limit: int,
+        employment_type: str | None,
+        location_type: str | None,
+        job_ids: list[uuid.UUID] | None,
+        order_by_date: bool,
+        after: tuple[date, uuid.UUID] | None,
+        total: int | None,
+    ) -> tuple:
+        """Filter and order `stmt` to visible jobs, returning (page result, total)
+
+        Up to `limit + 1` rows are fetched so the caller can tell whether a
+        next page exists.
+        """
+        ranked = ranked_job_ids(job_ids) if job_ids else None
+
+        def apply_filters(query):
+            query = query.where(*visible_job_conditions())
+            if ranked is not None:
+                query = query.join(ranked, ranked.c.job_id == JobPosting.job_id)
+            if employment_type:
+                query = query.where(JobPosting.employment_type == employment_type)
+            if location_type:
+                query = query.where(JobPosting.location_type == location_type)
+            return query
+
+        if total is None:
+            count_stmt = apply_filters(select(func.count()).select_from(JobPosting))
+            total = (await self.db.execute(count_stmt)).scalar_one() or 0
+
+        stmt = apply_filters(stmt)
+        if ranked is not None and not order_by_date:
+            stmt = stmt.order_by(ranked.c.rank)
         elif order_by_date:
-            base_stmt = base_stmt.order_by(JobPosting.posted_date.desc())
-
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one() or 0
-
-        offset = (page - 1) * limit
-        jobs_stmt = base_stmt.offset(offset).limit(limit)
-        jobs_result = await self.db.execute(jobs_stmt)
-        jobs = jobs_result.scalars().all()
-
-        if job_ids and not order_by_date:
-            job_order = {job_id: idx for idx, job_id in enumerate(job_ids)}
-            jobs = sorted(jobs, key=lambda job: job_order.get(job.job_id, float("inf")))
-
-        total_pages = math.ceil(total / limit) if limit > 0 else 0
+            stmt = stmt.order_by(
+                JobPosting.posted_date.desc(), JobPosting.job_id.desc()
+            )
 
+        if after is not None and order_by_date:
+            stmt = stmt.where(self._posted_before(after))
+        else:
+            stmt = stmt.offset((page - 1) * limit)
+        return await self.db.execute(stmt.limit(limit + 1)), total
+
+    @staticmethod
+    def _posted_before(after: tuple[date, uuid.UUID]):
+        return tuple_(JobPosting.posted_date, JobPosting.job_id) < tuple_(*after)
+
+    @staticmethod
+    def _keyset_page(
+        jobs: list,
+        total: int,
+        page: int,
+        limit: int,
+        after: tuple[date, uuid.UUID] | None,
+        with_cursor: bool = True,
+    ) -> dict:
+        """Build a page from up to `limit + 1` fetched jobs"""
+        has_next = len(jobs) > limit
+        jobs = jobs[:limit]
+        next_cursor = None
+        if has_next and with_cursor:
+            last = jobs[-1]
+            next_cursor = encode_cursor([last.posted_date.isoformat(), last.job_id])
         return {
             "jobs": jobs,
             "total": total,
             "page": page,
             "limit": limit,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1,
+            "total_pages": math.ceil(total / limit) if limit > 0 else 0,
+            "has_next": has_next,
+            "has_prev": page > 1 or after is not None,
+            "next_cursor": next_cursor,
         }
 
+    async def get_visible_ids_ranked(
+        self,
+        job_ids: list[uuid.UUID],
+        employment_type: str | None = None,
+        location_type: str | None = None,
+    ) -> list[uuid.UUID]:
+        """Keep the visible jobs matching the filters, preserving the given order"""
+        if not job_ids:
+            return []
+        ranked = ranked_job_ids(job_ids)
+        query = (
+            select(JobPosting.job_id)
+            .join(ranked, ranked.c.job_id == JobPosting.job_id)
+            .where(*visible_job_conditions())
+            .order_by(ranked.c.rank)
+        )
+        if employment_type:
+            query = query.where(JobPosting.employment_type == employment_type)
+        if location_type:
+            query = query.where(JobPosting.location_type == location_type)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def search_visible_ids(
+        self,
+        query: str,
+        limit: int,
+        employment_type: str | None = None,
+        location_type: str | None = None,
+    ) -> list[uuid.UUID]:
+        """Full-text search over visible jobs, best `ts_rank` first
+
+        Title and description matches are looked up through their own GIN
+        indexes and unioned, so only matching rows are joined and ranked.
+        """
+        tsquery = func.websearch_to_tsquery("english", query)
+        matches = union(
+            select(JobPosting.job_id).where(
+                JobPosting.search_vector.bool_op("@@")(tsquery)
+            ),
+            select(JobPosting.job_id)
+            .join(JobDescription)
+            .where(JobDescription.search_vector.bool_op("@@")(tsquery)),
+        ).subquery()
+        document = JobPosting.search_vector.op("||", return_type=TSVECTOR)(
+            JobDescription.search_vector
+        )
+        stmt = (
+            select(JobPosting.job_id)
+            .join(JobDescription)
+            .where(
+                JobPosting.job_id.in_(select(matches.c.job_id)),
+                *visible_job_conditions(),
+            )
+            .order_by(
+                func.ts_rank(document, tsquery).desc(), JobPosting.posted_date.desc()
+            )
+            .limit(limit)
+        )
+        if employment_type:
+            stmt = stmt.where(JobPosting.employment_type == employment_type)
+        if location_type:
+            stmt = stmt.where(JobPosting.location_type == location_type)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_facet_counts(
+        self, job_ids: list[uuid.UUID] | None = None
+    ) -> list[tuple[str | None, str, int]]:
+        """Count visible jobs per (employment_type, location_type) pair
+
+        Counts all visible jobs, or only the given ones.
+        """
+        query = (
+            select(JobPosting.employment_type, JobPosting.location_type, func.count())
+            .where(*visible_job_conditions())
+            .group_by(JobPosting.employment_type, JobPosting.location_type)
+        )
+        if job_ids is not None:
+            if not job_ids:
+                return []
+            query = query.where(JobPosting.job_id == any_(job_id_array(job_ids)))
+        result = await self.db.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    async def get_visible_title_counts(self) -> list[tuple[str, int]]:
+        """Get each visible job title with its number of postings"""
+        query = (
+            select(JobPosting.title, func.count())
+            .where(*visible_job_conditions())
+            .group_by(JobPosting.title)
+        )
+        result = await self.db.execute(query)
+        return [(title, count) for title, count in result.all()]
+
+    async def get_visible_by_ids(self, job_ids: list[uuid.UUID]) -> list[JobPosting]:
+        """Get visible jobs with details in the order of the given IDs"""
+        if not job_ids:
+            return []
+        ranked = ranked_job_ids(job_ids)
+        query = (
+            select(JobPosting)
+            .options(
+                selectinload(JobPosting.organization),
+                selectinload(JobPosting.job_description),
+            )
+            .join(ranked, ranked.c.job_id == JobPosting.job_id)
+            .where(*visible_job_conditions())
+            .order_by(ranked.c.rank)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_visible_listing_by_ids(
+        self, job_ids: list[uuid.UUID]
+    ) -> list[JobListingRow]:
+        """Core twin of `get_visible_by_ids`, as `JobListingRow`s in ID order"""
+        if not job_ids:
+            return []
+        ranked = ranked_job_ids(job_ids)
+        query = (
+            job_listing_select()
+            .join(ranked, ranked.c.job_id == JobPosting.job_id)
+            .where(*visible_job_conditions())
+            .order_by(ranked.c.rank)
+        )
+        return job_listing_rows(await self.db.execute(query))
+
+    async def filter_visible_ids(self, job_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+        """Return the subset of job IDs that are currently visible"""
+        if not job_ids:
+            return set()
+        query = select(JobPosting.job_id).where(
+            JobPosting.job_id == any_(job_id_array(job_ids)), *visible_job_conditions()
+        )
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
+
     async def get_by_organization(
         self, organization_id: uuid.UUID, skip: int = 0, limit: int = 100
     ) -> Sequence[JobPosting]:
@@ -176,14 +573,9 @@ class JobRepository(BaseRepository[JobPosting]):
     ) -> JobPosting | None:
         """Updates only the auto_shortlist toggle for a job."""
         try:
-            query = (
-                update(JobPosting)
-                .where(JobPosting.job_id == job_id)
-                .values(auto_shortlist=auto_shortlist, updated_at=get_datetime())
+            return await self.update_returning(
+                job_id, auto_shortlist=auto_shortlist, updated_at=get_datetime()
             )
-            await self.db.execute(query)
-            await self.db.flush()
-            return await self.get(job_id)
         except (IntegrityError, SQLAlchemyError) as e:
             await self._handle_db_error(e, "Failed to update auto-shortlist settings.")
 
@@ -209,10 +601,13 @@ class JobRepository(BaseRepository[JobPosting]):
                 JobPosting.status == "active", JobPosting.application_deadline < today
             )
             .values(status="expired", updated_at=get_datetime())
+            .returning(JobPosting.job_id)
         )
         result = await self.db.execute(update_stmt)
+        expired_ids = list(result.scalars().all())
+        await self.enqueue_index_events(expired_ids, IndexAction.DELETE)
         await self.db.flush()
-        return result.rowcount
+        return len(expired_ids)
 
     async def get_jobs_paginated(
         self,
@@ -221,8 +616,15 @@ class JobRepository(BaseRepository[JobPosting]):
         status: str | None = None,
         page: int = 1,
         limit: int = 10,
+        after: tuple[date, uuid.UUID] | None = None,
+        total: int | None = None,
     ) -> dict:
-        """Get paginated jobs with filters for recruiter view"""
+        """Get paginated jobs with filters for recruiter view
+
+        Pages start right after the `after` (posted_date, job_id) key when it
+        is given, otherwise `page` is applied as an offset. A known `total`
+        skips the count query.
+        """
         query = select(JobPosting)
         is_recruiter_view = False
 
@@ -246,35 +648,28 @@ class JobRepository(BaseRepository[JobPosting]):
             query = query.where(JobPosting.status.in_(VISIBLE_STATUSES))
 
         # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one() or 0
+        if total is None:
+            count_query = select(func.count()).select_from(query.subquery())
+            total_result = await self.db.execute(count_query)
+            total = total_result.scalar_one() or 0
 
         # Get paginated results
-        offset = (page - 1) * limit
+        if after is not None:
+            query = query.where(self._posted_before(after))
+        else:
+            query = query.offset((page - 1) * limit)
         jobs_query = (
             query.options(
                 selectinload(JobPosting.organization),
                 selectinload(JobPosting.job_description),
             )
-            .order_by(JobPosting.posted_date.desc())
-            .offset(offset)
-            .limit(limit)
+            .order_by(JobPosting.posted_date.desc(), JobPosting.job_id.desc())
+            .limit(limit + 1)
         )
         jobs_result = await self.db.execute(jobs_query)
-        jobs = jobs_result.scalars().all()
+        jobs = list(jobs_result.scalars().all())
 
-        total_pages = math.ceil(total / limit) if limit > 0 else 0
-
-        return {
-            "jobs": jobs,
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1,
-        }
+        return self._keyset_page(jobs, total, page, limit, after)
 
     def _empty_pagination_response(self, page: int, limit: int) -> dict:
         """Return empty pagination response"""
@@ -295,6 +690,7 @@ class JobRepository(BaseRepository[JobPosting]):
             job.status = "expired"
             job.application_deadline = date.today()
             job.updated_at = get_datetime()
+            await self.enqueue_index_events([job_id], IndexAction.DELETE)
             await self.db.flush()
         return job
 
@@ -327,6 +723,11 @@ class JobRepository(BaseRepository[JobPosting]):
                 delete(JobApplication).where(JobApplication.job_id == job_id)
             )
 
+            # Delete materialized recommendations
+            await self.db.execute(
+                delete(JobRecommendation).where(JobRecommendation.job_id == job_id)
+            )
+
             # 2. Delete the Job (this also triggers the JobDescription delete if logic matches)
             job_desc_id = job.job_description_id
             await self.db.delete(job)
@@ -336,6 +737,7 @@ class JobRepository(BaseRepository[JobPosting]):
                 )
             )
 
+            await self.enqueue_index_events([job_id], IndexAction.DELETE)
             await self.db.flush()
             return True
         except (IntegrityError, SQLAlchemyError) as e:
@@ -348,7 +750,15 @@ class JobRepository(BaseRepository[JobPosting]):
     async def update_job_and_description(
         self, job_posting: JobPosting, job_data
     ) -> JobPosting:
-        """Update job posting and its description"""
+        """Update job posting and its description
+
+        Queues a vector index change in the outbox: a delete when the job
+        leaves the visible statuses, a re-embed when it becomes visible again,
+        and a payload update otherwise, which the sync worker turns into a
+        re-embed when the job text hash changed.
+        """
+        was_visible = job_posting.status in VISIBLE_STATUSES
+
         # Update job posting fields
         if job_data.title is not None:
             job_posting.title = job_data.title
@@ -402,15 +812,134 @@ class JobRepository(BaseRepository[JobPosting]):
                 )
             job_description.updated_at = get_datetime()
 
+        is_visible = job_posting.status in VISIBLE_STATUSES
+        if not is_visible:
+            action = IndexAction.DELETE if was_visible else None
+        elif not was_visible:
+            action = IndexAction.REINDEX
+        else:
+            action = IndexAction.PAYLOAD
+        if action:
+            await self.enqueue_index_events([job_posting.job_id], action)
+
         await self.db.flush()
         return job_posting
 
+    async def get_many_with_details(
+        self, job_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, JobPosting]:
+        """Get jobs with organization and description details keyed by job ID"""
+        if not job_ids:
+            return {}
+        query = (
+            select(JobPosting)
+            .options(
+                selectinload(JobPosting.organization),
+                selectinload(JobPosting.job_description),
+            )
+            .where(JobPosting.job_id.in_(job_ids))
+        )
+        result = await self.db.execute(query)
+        return {job.job_id: job for job in result.scalars().all()}
+
+    async def get_active_batch(
+        self, after_job_id: uuid.UUID | None = None, limit: int = 64
+    ) -> Sequence[JobPosting]:
+        """Get the next batch of active jobs with details, ordered by job ID"""
+        query = (
+            select(JobPosting)
+            .options(
+                selectinload(JobPosting.organization),
+                selectinload(JobPosting.job_description),
+            )
+            .where(JobPosting.status == "active")
+            .order_by(JobPosting.job_id)
+            .limit(limit)
+        )
+        if after_job_id:
+            query = query.where(JobPosting.job_id > after_job_id)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_active_ids(self) -> set[uuid.UUID]:
+        """Get the IDs of all active jobs"""
+        result = await self.db.execute(
+            select(JobPosting.job_id).where(JobPosting.status == "active")
+        )
+        return set(result.scalars().all())
+
+    async def get_active_ids_changed_since(self, since: datetime) -> list[uuid.UUID]:
+        """Get active jobs whose posting or description changed after `since`"""
+        query = (
+            select(JobPosting.job_id)
+            .join(JobDescription)
+            .where(
+                JobPosting.status == "active",
+                or_(
+                    JobPosting.updated_at >= since,
+                    JobDescription.updated_at >= since,
+                ),
+            )
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def set_indexed(self, job_ids: Sequence[uuid.UUID], is_indexed: bool) -> None:
+        """Set the is_indexed flag for several jobs"""
+        if not job_ids:
+            return
+        await self.db.execute(
+            update(JobPosting)
+            .where(JobPosting.job_id.in_(job_ids))
+            .values(is_indexed=is_indexed)
+        )
+        await self.db.flush()
+
 
 class JobDescriptionRepository(BaseRepository[JobDescription]):
     def __init__(self, db: AsyncSession):
         super().__init__(JobDescription, db)
 
 
+class JobIndexOutboxRepository(BaseRepository[JobIndexOutbox]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(JobIndexOutbox, db)
+
+    async def claim_batch(
+        self, limit: int = 100, max_attempts: int = 5
+    ) -> Sequence[JobIndexOutbox]:
+        """Lock the oldest pending events, skipping rows claimed by other workers"""
+        query = (
+            select(JobIndexOutbox)
+            .where(JobIndexOutbox.attempts < max_attempts)
+            .order_by(JobIndexOutbox.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def delete_events(self, event_ids: Sequence[uuid.UUID]) -> None:
+        """Remove processed events"""
+        if not event_ids:
+            return
+        await self.db.execute(
+            delete(JobIndexOutbox).where(JobIndexOutbox.event_id.in_(event_ids))
+        )
+        await self.db.flush()
+
+    async def mark_failed(self, event_ids: Sequence[uuid.UUID], error: str) -> None:
+        """Record a failed attempt so the events are retried later"""
+        if not event_ids:
+            return
+        await self.db.execute(
+            update(JobIndexOutbox)
+            .where(JobIndexOutbox.event_id.in_(event_ids))
+            .values(attempts=JobIndexOutbox.attempts + 1, last_error=error[:1000])
+        )
+        await self.db.flush()
+
+
 class ReferenceJDRepository(BaseRepository[ReferenceJD]):
     def __init__(self, db: AsyncSession):
         super().__init__(ReferenceJD, db)
@@ -0,0 +1,233 @@
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import delete, func, not_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core import get_datetime
+from app.db.models.job import JobPosting
+from app.db.models.recommendation import JobRecommendation, JobRecommendationRefresh
+from app.db.repositories.base import BaseRepository
+from app.db.repositories.job_repo import visible_job_conditions
+
+
+class JobRecommendationRepository(BaseRepository[JobRecommendation]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(JobRecommendation, db)
+
+    async def has_recommendations(self, profile_id: uuid.UUID) -> bool:
+        """Check whether recommendations were materialized for a profile"""
+        query = (
+            select(JobRecommendation.job_id)
+            .where(JobRecommendation.profile_id == profile_id)
+            .limit(1)
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def is_materialized(self, profile_id: uuid.UUID) -> bool:
+        """Check whether a profile was refreshed, even if nothing matched"""
+        query = select(JobRecommendationRefresh.profile_id).where(
+            JobRecommendationRefresh.profile_id == profile_id
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def replace_for_profile(
+        self, profile_id: uuid.UUID, scored_jobs: list[tuple[uuid.UUID, float]]
+    ) -> None:
+        """Replace the materialized recommendations of a profile
+
+        The refresh is recorded even for an empty list.
+        """
+        await self.db.execute(
+            delete(JobRecommendation).where(JobRecommendation.profile_id == profile_id)
+        )
+        computed_at = get_datetime()
+        stmt = insert(JobRecommendationRefresh).values(
+            profile_id=profile_id, computed_at=computed_at
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[JobRecommendationRefresh.profile_id],
+                set_={"computed_at": stmt.excluded.computed_at},
+            )
+        )
+        if scored_jobs:
+            await self.db.execute(
+                insert(JobRecommendation),
+                [
+                    {
+                        "profile_id": profile_id,
+                        "job_id": job_id,
+                        "score": score,
+                        "computed_at": computed_at,
+                    }
+                    for job_id, score in scored_jobs
+                ],
+            )
+        await self.db.flush()
+
+    async def merge_jobs(
+        self,
+        job_profile_scores: dict[uuid.UUID, dict[uuid.UUID, float]],
+        top_k: int,
+    ) -> int:
+        """Insert jobs into already materialized profiles and trim them to top_k
+
+        `job_profile_scores` maps each job to its scores per profile. Profiles
+        without materialized recommendations are skipped; they get computed in
+        full on their next read or nightly refresh. Returns how many profiles
+        were updated.
+        """
+        candidate_ids = {
+            profile_id
+            for profile_scores in job_profile_scores.values()
+            for profile_id in profile_scores
+        }
+        if not candidate_ids:
+            return 0
+        materialized = await self.db.execute(
+            select(JobRecommendationRefresh.profile_id).where(
+                JobRecommendationRefresh.profile_id.in_(list(candidate_ids))
+            )
+        )
+        profile_ids = set(materialized.scalars().all())
+        if not profile_ids:
+            return 0
+
+        computed_at = get_datetime()
+        stmt = insert(JobRecommendation)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[JobRecommendation.profile_id, JobRecommendation.job_id],
+                set_={"score": stmt.excluded.score, "computed_at": computed_at},
+            ),
+            [
+                {
+                    "profile_id": profile_id,
+                    "job_id": job_id,
+                    "score": score,
+                    "computed_at": computed_at,
+                }
+                for job_id, profile_scores in job_profile_scores.items()
+                for profile_id, score in profile_scores.items()
+                if profile_id in profile_ids
+            ],
+        )
+
+        ranked = (
+            select(
+                JobRecommendation.profile_id,
+                JobRecommendation.job_id,
+                func.row_number()
+                .over(
+                    partition_by=JobRecommendation.profile_id,
+                    order_by=(
+                        JobRecommendation.score.desc(),
+                        JobRecommendation.job_id.desc(),
+                    ),
+                )
+                .label("rank"),
+            )
+            .where(JobRecommendation.profile_id.in_(list(profile_ids)))
+            .subquery()
+        )
+        await self.db.execute(
+            delete(JobRecommendation).where(
+                tuple_(JobRecommendation.profile_id, JobRecommendation.job_id).in_(
+                    select(ranked.c.profile_id, ranked.c.job_id).where(
+                        ranked.c.rank > top_k
+                    )
+                )
+            )
+        )
+        await self.db.flush()
+        return len(profile_ids)
+
+    async def delete_by_jobs(self, job_ids: Sequence[uuid.UUID]) -> int:
+        """Remove jobs from every materialized recommendation list"""
+        if not job_ids:
+            return 0
+        result = await self.db.execute(
+            delete(JobRecommendation).where(JobRecommendation.job_id.in_(job_ids))
+        )
+        await self.db.flush()
+        return result.rowcount
+
+    async def prune_invisible(self) -> int:
+        """Remove recommendations pointing at jobs that are no longer visible"""
+        visible_ids = select(JobPosting.job_id).where(*visible_job_conditions())
+        result = await self.db.execute(
+            delete(JobRecommendation).where(
+                not_(JobRecommendation.job_id.in_(visible_ids))
+            )
+        )
+        await self.db.flush()
+        return result.rowcount
+
+    def _visible_query(
+        self,
+        profile_id: uuid.UUID,
+        employment_type: str | None,
+        location_type: str | None,
+    ):
+        query = (
+            select(JobPosting, JobRecommendation.score)
+            .join(JobRecommendation, JobRecommendation.job_id == JobPosting.job_id)
+            .where(
+                JobRecommendation.profile_id == profile_id, *visible_job_conditions()
+            )
+        )
+        if employment_type:
+            query = query.where(JobPosting.employment_type == employment_type)
+        if location_type:
+            query = query.where(JobPosting.location_type == location_type)
+        return query
+
+    async def count_visible(
+        self,
+        profile_id: uuid.UUID,
+        employment_type: str | None = None,
+        location_type: str | None = None,
+    ) -> int:
+        """Count visible recommended jobs for a profile"""
+        query = self._visible_query(profile_id, employment_type, location_type)
+        count_query = select(func.count()).select_from(query.subquery())
+        result = await self.db.execute(count_query)
+        return result.scalar_one() or 0
+
+    async def get_visible_page(
+        self,
+        profile_id: uuid.UUID,
+        limit: int = 10,
+        after: tuple[float, uuid.UUID] | None = None,
+        offset: int = 0,
+        employment_type: str | None = None,
+        location_type: str | None = None,
+    ) -> list[tuple[JobPosting, float]]:
+        """Get a page of visible recommended jobs ordered by score
+
+        When `after` is given the page starts right after that (score, job_id)
+        key, otherwise `offset` is applied.
+        """
+        query = self._visible_query(profile_id, employment_type, location_type)
+        if after is not None:
+            query = query.where(
+                tuple_(JobRecommendation.score, JobRecommendation.job_id)
+                < tuple_(after[0], after[1])
+            )
+        else:
+            query = query.offset(offset)
+        query = (
+            query.options(
+                selectinload(JobPosting.organization),
+                selectinload(JobPosting.job_description),
+            )
+            .order_by(JobRecommendation.score.desc(), JobRecommendation.job_id.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return [(job, score) for job, score in result.all()]
@@ -1,10 +1,31 @@
 import uuid
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    String,
+    Uuid,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy import values as values_clause
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core import get_datetime
+from app.db.models.candidate import (
+    CandidateCertification,
+    CandidateEducation,
+    CandidateProfile,
+    CandidateSkills,
+    CandidateSocialLink,
+    CandidateWorkExperience,
+)
 from app.db.models.resume import (
     Resume,
     ResumeCertification,
@@ -15,6 +36,45 @@ from app.db.models.resume import (
 )
 from app.db.repositories.base import BaseRepository
 
+# (ResumeCreate field, resume model, profile model, copied columns)
+FORK_SECTIONS = (
+    (
+        "work_experiences",
+        ResumeWorkExperience,
+        CandidateWorkExperience,
+        (
+            "job_title",
+            "company",
+            "location",
+            "start_date",
+            "end_date",
+            "is_current",
+            "description",
+        ),
+    ),
+    (
+        "educations",
+        ResumeEducation,
+        CandidateEducation,
+        ("college_name", "degree", "location", "start_date", "end_date", "is_current"),
+    ),
+    ("skills", ResumeSkills, CandidateSkills, ("skill_name",)),
+    (
+        "certifications",
+        ResumeCertification,
+        CandidateCertification,
+        (
+            "certification_name",
+            "issuing_body",
+            "credential_url",
+            "issue_date",
+            "expiration_date",
+            "does_not_expire",
+        ),
+    ),
+    ("social_links", ResumeSocialLink, CandidateSocialLink, ("type", "url")),
+)
+
 
 class ResumeRepository(BaseRepository[Resume]):
     def __init__(self, db: AsyncSession):
@@ -46,6 +106,105 @@ class ResumeRepository(BaseRepository[Resume]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def fork_from_profile(
+        self,
+        user_id: uuid.UUID,
+        target_job_title: str | None,
+        custom_summary: str | None,
+        sections: Mapping[str, Sequence[Mapping[str, Any]] | None],
+    ) -> uuid.UUID | None:
+        """Create a resume from the user's profile in a single statement
+
+        Sections given in `sections` are inserted from those rows; the others
+        are copied from the candidate_* tables with INSERT ... SELECT. Every
+        insert hangs off the profile lookup, so nothing is written when the
+        user has no profile.
+
+        Returns:
+            The new resume ID, or None if the user has no candidate profile
+        """
+        resume_id = uuid.uuid4()
+        now = literal(get_datetime(), DateTime)
+        profile = (
+            select(CandidateProfile.profile_id, CandidateProfile.professional_summary)
+            .where(CandidateProfile.user_id == user_id)
+            .cte("fork_profile")
+        )
+
+        section_inserts = []
+        for name, resume_model, profile_model, columns in FORK_SECTIONS:
+            given = sections.get(name)
+            if given is not None:
+                if not given:
+                    continue
+                table = resume_model.__table__
+                rows = values_clause(
+                    *(column(col, table.c[col].type) for col in columns),
+                    name=f"given_{name}",
+                ).data([tuple(row.get(col) for col in columns) for row in given])
+                # All-NULL VALUES columns come back as text, so cast explicitly
+                source = (
+                    select(*(cast(rows.c[col], table.c[col].type) for col in columns))
+                    .select_from(profile)
+                    .join(rows, literal(True))
+                )
+            else:
+                source = select(
+                    *(getattr(profile_model, col) for col in columns)
+                ).join_from(
+                    profile,
+                    profile_model,
+                    profile_model.profile_id == profile.c.profile_id,
+                )
+            source = source.subquery(f"source_{name}")
+            pk_name = resume_model.__mapper__.primary_key[0].name
+            section_inserts.append(
+                insert(resume_model)
+                .from_select(
+                    [pk_name, "resume_id", *columns, "created_at", "updated_at"],
+                    select(
+                        func.gen_random_uuid(),
+                        literal(resume_id, Uuid),
+                        *(source.c[col] for col in columns),
+                        now,
+                        now,
+                    ),
+                )
+                .cte(f"fork_{name}")
+            )
+
+        # The section rows reference the resume inserted by the outer
+        # statement; foreign keys are checked once the whole statement is done
+        query = (
+            insert(Resume)
+            .from_select(
+                [
+                    "resume_id",
+                    "profile_id",
+                    "target_job_title",
+                    "custom_summary",
+                    "created_at",
+                    "updated_at",
+                ],
+                select(
+                    literal(resume_id, Uuid),
+                    profile.c.profile_id,
+                    literal(target_job_title, String),
+                    # An empty custom summary also falls back to the profile's
+                    func.coalesce(
+                        func.nullif(literal(custom_summary, String), ""),
+                        profile.c.professional_summary,
+                    ),
+                    now,
+                    now,
+                ),
+            )
+            .add_cte(*section_inserts)
+            .returning(Resume.resume_id)
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
     async def get_by_user_id(self, user_id: uuid.UUID) -> Sequence[Resume]:
         """Get resumes by user ID through candidate profile"""
         from app.db.models.candidate import CandidateProfile
@@ -1,22 +1,186 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import uuid
 
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.logging_config import logger
+
+ENGINE_PROFILES = ("direct", "pgbouncer", "pgbouncer_unprepared")
+
+
+def _unique_statement_name() -> str:
+    # Statements prepared through PgBouncer may land on any server connection,
+    # so names must never collide between client connections
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def build_engine_options(profile: str | None = None) -> dict:
+    """Engine keyword arguments for a connection profile
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    profile = profile or settings.DB_ENGINE_PROFILE
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown database engine profile: {profile}")
+    cache_size = settings.DB_STATEMENT_CACHE_SIZE
+    if profile == "pgbouncer_unprepared":
+        connect_args = {
+            "prepared_statement_cache_size": 0,  # Disables SQLAlchemy side cache
+            "statement_cache_size": 0,  # Disables asyncpg side cache
+        }
+    else:
+        connect_args = {
+            "prepared_statement_cache_size": cache_size,
+            "statement_cache_size": cache_size,
+        }
+        if profile == "pgbouncer":
+            connect_args["prepared_statement_name_func"] = _unique_statement_name
+    return {
+        "echo": False,
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "connect_args": connect_args,
+    }
+
+
+def create_engine_for_profile(
+    profile: str | None = None, url: str | None = None
+) -> AsyncEngine:
+    return create_async_engine(
+        url or settings.DATABASE_URL, **build_engine_options(profile)
+    )
+
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
-    pool_pre_ping=True,
-    connect_args={
-        "prepared_statement_cache_size": 0,  # Disables SQLAlchemy side cache
-        "statement_cache_size": 0,  # Disables asyncpg side cache
-    },
+async def prewarm_pool(engine: AsyncEngine, size: int | None = None) -> None:
+    """Open pool connections up front so first requests skip the handshake"""
+    size = size or settings.DB_POOL_SIZE
+
+    async def checkout():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(checkout() for _ in range(size)))
+        logger.debug(f"Pre-warmed {size} database connections")
+    except Exception as e:
+        logger.warning(f"Database pool pre-warm failed: {e}")
+
+
+engine = create_engine_for_profile()
+
+# Without a replica, read-only sessions share the primary engine
+replica_engine = (
+    create_engine_for_profile(url=settings.DATABASE_REPLICA_URL)
+    if settings.DATABASE_REPLICA_URL
+    else engine
 )
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
 
+_READONLY_KEY = "readonly"
+_WROTE_KEY = "wrote"
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def _read_sessionmaker(bind: AsyncEngine) -> async_sessionmaker:
+    """Sessions for read-only endpoints
+
+    They run in autocommit mode, so queries skip the BEGIN and COMMIT round
+    trips, and they refuse to flush or execute DML.
+    """
+    return async_sessionmaker(
+        bind=bind.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        info={_READONLY_KEY: True},
+    )
+
+
+AsyncReadSessionLocal = _read_sessionmaker(replica_engine)
+
+# Read-only sessions on the primary, for entities inside the sticky window
+AsyncPrimaryReadSessionLocal = _read_sessionmaker(engine)
+
+# Entities that committed a write recently; their reads stay on the primary
+# until replication has caught up. Process-local, like the other TTL caches.
+recent_writers = TTLCache(settings.DB_REPLICA_STICKY_SECONDS, max_entries=10_000)
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_readonly_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get(_READONLY_KEY):
+        raise InvalidRequestError("Read-only session cannot flush changes")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session: Session, flush_context) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        if orm_execute_state.session.info.get(_READONLY_KEY):
+            raise InvalidRequestError("Read-only session cannot execute DML")
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+def run_after_commit(session: AsyncSession | Session, callback) -> None:
+    """Run `callback` once the session's transaction commits
+
+    For in-memory state mirroring database rows, which must not change for a
+    write that is later rolled back. Dropped if the transaction rolls back.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+def _request_entity_id(request: Request) -> uuid.UUID | None:
+    """User or organization ID from the auth cookie, without a database hit"""
+    # Imported here since app.core.security depends on this module
+    from app.core.security import verify_token
+
+    token = request.cookies.get("auth_token")
+    if not token:
+        return None
+    try:
+        entity_id, _ = verify_token(token)
+    except ValueError:
+        return None
+    return entity_id
+
 
 async def init_db():
     from app.db.base import Base
@@ -25,13 +189,34 @@ async def init_db():
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def get_db():
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
         try:
             yield session
             await session.commit()
+            if replica_engine is not engine and session.info.get(_WROTE_KEY):
+                entity_id = _request_entity_id(request)
+                if entity_id:
+                    recent_writers.set(entity_id, True)
         except Exception:
             await session.rollback()
             raise
         finally:
             await session.close()
+
+
+async def get_db_readonly(request: Request):
+    """Session for read-only endpoints, served by the replica when configured
+
+    Falls back to the primary for an entity that wrote within the sticky
+    window so it always sees its own changes. There is nothing to commit;
+    declare it with ``Depends(get_db_readonly, scope="function")`` so the
+    connection goes back to the pool before the response is sent.
+    """
+    session_factory = AsyncReadSessionLocal
+    if replica_engine is not engine:
+        entity_id = _request_entity_id(request)
+        if entity_id and recent_writers.get(entity_id):
+            session_factory = AsyncPrimaryReadSessionLocal
+    async with session_factory() as session:
+        yield session
@@ -0,0 +1,92 @@
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.integrations.llm.provider import get_embedding_model
+
+EmbedBatch = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+class EmbeddingDispatcher:
+    """Coalesces concurrent single-text embedding requests into batched calls
+
+    The first request of a batch opens a short window; every request that
+    arrives before it closes, or until the batch is full, shares one API call.
+    """
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatch,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ):
+        self.embed_batch = embed_batch
+        self.max_batch_size = max_batch_size or settings.EMBEDDING_BATCH_MAX_SIZE
+        if max_wait_ms is None:
+            max_wait_ms = settings.EMBEDDING_BATCH_MAX_WAIT_MS
+        self.max_wait = max_wait_ms / 1000
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            vectors = await self.embed_batch([text for text, _ in batch])
+            # A short response would leave the trailing waiters hanging
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} embeddings, got {len(vectors)}"
+                )
+        except Exception as e:
+            logger.error(f"Batched embedding of {len(batch)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        logger.trace(f"Embedded {len(batch)} coalesced texts in one call")
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
+
+
+_query_dispatchers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_query_embedding_dispatcher() -> EmbeddingDispatcher:
+    """Shared dispatcher for search query embeddings on the running event loop"""
+    loop = asyncio.get_running_loop()
+    dispatcher = _query_dispatchers.get(loop)
+    if dispatcher is None:
+        embedding_model = get_embedding_model()
+
+        async def embed_queries(texts: list[str]) -> list[list[float]]:
+            return await embedding_model.aembed_documents(
+                texts, batch_size=len(texts), task_type="RETRIEVAL_QUERY"
+            )
+
+        dispatcher = EmbeddingDispatcher(embed_queries)
+        _query_dispatchers[loop] = dispatcher
+    return dispatcher
@@ -0,0 +1,192 @@
+import hashlib
+import threading
+import uuid
+from functools import partial
+
+import anyio
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import PointIdsList, PointStruct
+
+from app.core import settings
+from app.core.logging_config import logger
+from app.db.models.candidate import CandidateProfile
+from app.integrations.llm.provider import get_embedding_model
+from app.integrations.qdrant.local_index import get_local_index
+from app.integrations.qdrant.storage import (
+    build_quantization_config,
+    build_search_params,
+    build_vector_params,
+)
+
+
+class CandidateVectorService:
+    """Embeddings of candidate profiles for recruiter talent search
+
+    Each point stores the hash of the embedded profile text, so writes that
+    don't change the text never cost an embedding call.
+    """
+
+    def __init__(self):
+        self.embedding_model = get_embedding_model()
+        self.collection_name = settings.QDRANT_CANDIDATE_COLLECTION_NAME
+        self.search_params = build_search_params()
+        self.client = None
+        self.local_index = None
+        # Created on first write, so building the service never calls Qdrant
+        self._collection_ready = False
+        self._setup_lock = threading.Lock()
+        if settings.VECTOR_BACKEND == "local":
+            self.local_index = get_local_index(self.collection_name)
+            return
+        self.client = QdrantClient(url=settings.QDRANT_URL, check_compatibility=False)
+
+    async def _ensure_collection(self) -> None:
+        if self.client and not self._collection_ready:
+            await self._run(self._ensure_collection_once)
+
+    def _ensure_collection_once(self) -> None:
+        with self._setup_lock:
+            if self._collection_ready:
+                return
+            if not self.client.collection_exists(self.collection_name):
+                self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=build_vector_params(),
+                    quantization_config=build_quantization_config(),
+                )
+                logger.trace(f"Created Qdrant collection: {self.collection_name}")
+            self._collection_ready = True
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking Qdrant client call without blocking the event loop"""
+        return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+    def _construct_profile_text(self, profile: CandidateProfile) -> str:
+        parts = []
+        if profile.professional_headline:
+            parts.append(f"Headline: {profile.professional_headline}")
+        if profile.professional_summary:
+            parts.append(f"Summary: {profile.professional_summary}")
+        if profile.skills:
+            skills = ", ".join(sorted(s.skill_name for s in profile.skills))
+            parts.append(f"Skills: {skills}")
+        for experience in sorted(
+            profile.work_experiences, key=lambda e: e.start_date, reverse=True
+        ):
+            line = f"Experience: {experience.job_title} at {experience.company}"
+            if experience.description:
+                line += f" - {experience.description}"
+            parts.append(line)
+        return "\n".join(parts)
+
+    async def _get_text_hashes(self, profile_ids: list[uuid.UUID]) -> dict:
+        if not self.client:
+            stored = await self._run(self.local_index.get_many, profile_ids)
+            return {profile_id: label for profile_id, (label, _) in stored.items()}
+        points = await self._run(
+            self.client.retrieve,
+            collection_name=self.collection_name,
+            ids=[str(profile_id) for profile_id in profile_ids],
+            with_payload=["text_hash"],
+            with_vectors=False,
+        )
+        return {uuid.UUID(str(p.id)): p.payload.get("text_hash") for p in points}
+
+    async def index_profiles(self, profiles: list[CandidateProfile]) -> int:
+        """Embed profiles whose text changed, in one batched call
+
+        Profiles without any searchable text are removed from the collection.
+        Returns the number of profiles that were embedded.
+        """
+        await self._ensure_collection()
+        texts = {p.profile_id: self._construct_profile_text(p) for p in profiles}
+        empty = [profile_id for profile_id, text in texts.items() if not text]
+        await self.delete_profiles(empty)
+
+        hashes = {
+            profile_id: hashlib.sha256(text.encode()).hexdigest()
+            for profile_id, text in texts.items()
+            if text
+        }
+        if not hashes:
+            return 0
+        stored = await self._get_text_hashes(list(hashes))
+        changed = [
+            pid for pid, text_hash in hashes.items() if stored.get(pid) != text_hash
+        ]
+        if not changed:
+            return 0
+
+        vectors = await self.embedding_model.aembed_documents(
+            [texts[profile_id] for profile_id in changed], batch_size=len(changed)
+        )
+        if not self.client:
+            await self._run(
+                self.local_index.upsert,
+                changed,
+                vectors,
+                [hashes[profile_id] for profile_id in changed],
+            )
+            return len(changed)
+        await self._run(
+            self.client.upsert,
+            collection_name=self.collection_name,
+            points=[
+                PointStruct(
+                    id=str(profile_id),
+                    vector=vector,
+                    payload={"text_hash": hashes[profile_id]},
+                )
+                for profile_id, vector in zip(changed, vectors, strict=True)
+            ],
+        )
+        return len(changed)
+
+    async def delete_profiles(self, profile_ids: list[uuid.UUID]) -> None:
+        if not profile_ids:
+            return
+        await self._ensure_collection()
+        if not self.client:
+            await self._run(self.local_index.delete, profile_ids)
+            return
+        await self._run(
+            self.client.delete,
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=[str(pid) for pid in profile_ids]),
+        )
+
+    async def search_by_vector(
+        self, vector: list[float], limit: int
+    ) -> list[tuple[uuid.UUID, float]] | None:
+        """Rank candidate profiles against a stored vector, e.g. a job's
+
+        Returns None when the candidate index cannot be searched.
+        """
+        try:
+            if not self.client:
+                return await self._run(self.local_index.search, vector, limit)
+            response = await self._run(
+                self.client.query_points,
+                collection_name=self.collection_name,
+                query=vector,
+                limit=limit,
+                search_params=self.search_params,
+                with_payload=False,
+            )
+        except Exception as e:
+            logger.error(f"Talent search error: {e}")
+            return None
+        return [(uuid.UUID(str(p.id)), p.score) for p in response.points]
+
+
+_candidate_vector_service: CandidateVectorService | None = None
+_candidate_vector_service_lock = threading.Lock()
+
+
+def get_candidate_vector_service() -> CandidateVectorService:
+    """Process-wide candidate vector service, sharing one Qdrant client"""
+    global _candidate_vector_service
+    with _candidate_vector_service_lock:
+        if _candidate_vector_service is None:
+            _candidate_vector_service = CandidateVectorService()
+        return _candidate_vector_service
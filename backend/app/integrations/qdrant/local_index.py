@@ -0,0 +1,199 @@
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from app.core import settings
+from app.core.logging_config import logger
+
+INITIAL_CAPACITY = 1024
+LABEL_DTYPE = "U64"
+
+
+class LocalVectorIndex:
+    """Exact cosine top-k over a memory-mapped float32 matrix
+
+    Rows are stored normalized in `vectors.npy`, with the point UUID, a free
+    row mask and an optional short label per row in sibling files, so the
+    index survives restarts without re-embedding. Deleted rows are reused.
+    Meant for a single process; calls are serialized with a lock.
+    """
+
+    def __init__(self, path: Path, dim: int):
+        self.path = path
+        self.dim = dim
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _file(self, name: str) -> Path:
+        return self.path / f"{name}.npy"
+
+    def _load(self) -> None:
+        if self._file("vectors").exists():
+            vectors = np.load(self._file("vectors"), mmap_mode="r+")
+            if vectors.ndim == 2 and vectors.shape[1] == self.dim:
+                self._vectors = vectors
+                self._ids = np.load(self._file("ids"), mmap_mode="r+")
+                self._used = np.load(self._file("used"), mmap_mode="r+")
+                self._labels = np.load(self._file("labels"), mmap_mode="r+")
+                self._index_rows()
+                return
+            logger.warning(
+                f"Local vector index at {self.path} has dimension "
+                f"{vectors.shape[-1]}, expected {self.dim}; rebuilding it"
+            )
+            del vectors
+        self._allocate(INITIAL_CAPACITY)
+
+    def _open(self, name: str, shape: tuple, dtype) -> np.memmap:
+        return np.lib.format.open_memmap(
+            self._file(name), mode="w+", dtype=dtype, shape=shape
+        )
+
+    def _allocate(self, capacity: int) -> None:
+        self._vectors = self._open("vectors", (capacity, self.dim), np.float32)
+        self._ids = self._open("ids", (capacity, 16), np.uint8)
+        self._used = self._open("used", (capacity,), np.bool_)
+        self._labels = self._open("labels", (capacity,), LABEL_DTYPE)
+        self._index_rows()
+
+    def _index_rows(self) -> None:
+        used = np.flatnonzero(self._used)
+        self._rows = {uuid.UUID(bytes=self._ids[i].tobytes()): int(i) for i in used}
+        self._free = [int(i) for i in np.flatnonzero(~self._used)][::-1]
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._used)
+        new_capacity = max(capacity * 2, capacity + needed)
+        arrays = {
+            "vectors": self._vectors,
+            "ids": self._ids,
+            "used": self._used,
+            "labels": self._labels,
+        }
+        grown = {}
+        for name, array in arrays.items():
+            tmp = self.path / f"{name}.grow.npy"
+            target = np.lib.format.open_memmap(
+                tmp,
+                mode="w+",
+                dtype=array.dtype,
+                shape=(new_capacity, *array.shape[1:]),
+            )
+            target[:capacity] = array
+            target.flush()
+            grown[name] = target
+        for name, target in grown.items():
+            os.replace(self.path / f"{name}.grow.npy", self._file(name))
+        self._vectors = grown["vectors"]
+        self._ids = grown["ids"]
+        self._used = grown["used"]
+        self._labels = grown["labels"]
+        self._free = list(range(new_capacity - 1, capacity - 1, -1)) + self._free
+
+    def _flush(self) -> None:
+        for array in (self._vectors, self._ids, self._used, self._labels):
+            array.flush()
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def upsert(
+        self,
+        ids: list[uuid.UUID],
+        vectors: list[list[float]],
+        labels: list[str] | None = None,
+    ) -> None:
+        if not ids:
+            return
+        matrix = self._normalize(vectors)
+        with self._lock:
+            new = sum(1 for point_id in set(ids) if point_id not in self._rows)
+            if new > len(self._free):
+                self._grow(new - len(self._free))
+            for i, point_id in enumerate(ids):
+                row = self._rows.get(point_id)
+                if row is None:
+                    row = self._free.pop()
+                    self._rows[point_id] = row
+                    self._ids[row] = np.frombuffer(point_id.bytes, dtype=np.uint8)
+                    self._used[row] = True
+                self._vectors[row] = matrix[i]
+                self._labels[row] = labels[i] if labels else ""
+            self._flush()
+
+    def delete(self, ids: list[uuid.UUID]) -> None:
+        with self._lock:
+            for point_id in ids:
+                row = self._rows.pop(point_id, None)
+                if row is None:
+                    continue
+                self._used[row] = False
+                self._vectors[row] = 0
+                self._free.append(row)
+            self._flush()
+
+    def search(
+        self, vector: list[float], limit: int, label: str | None = None
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Top-k rows by cosine similarity, optionally only rows with `label`"""
+        query = self._normalize(vector)
+        with self._lock:
+            mask = self._used if label is None else self._used & (self._labels == label)
+            count = int(np.count_nonzero(mask))
+            if not count or limit <= 0:
+                return []
+            scores = np.where(mask, self._vectors @ query, -np.inf)
+            k = min(limit, count)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [
+                (uuid.UUID(bytes=self._ids[i].tobytes()), float(scores[i])) for i in top
+            ]
+
+    def get_many(
+        self, ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[str, list[float]]]:
+        """Get stored (label, vector) pairs for the given IDs"""
+        with self._lock:
+            return {
+                point_id: (str(self._labels[row]), self._vectors[row].tolist())
+                for point_id in ids
+                if (row := self._rows.get(point_id)) is not None
+            }
+
+    def ids(self) -> set[uuid.UUID]:
+        with self._lock:
+            return set(self._rows)
+
+    def count(self) -> int:
+        return len(self._rows)
+
+    def reset(self) -> None:
+        with self._lock:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._allocate(INITIAL_CAPACITY)
+
+
+_indexes: dict[str, LocalVectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_local_index(name: str) -> LocalVectorIndex:
+    """Process-wide local index stored under LOCAL_VECTOR_INDEX_PATH/<name>"""
+    with _indexes_lock:
+        index = _indexes.get(name)
+        if index is None:
+            index = LocalVectorIndex(
+                Path(settings.LOCAL_VECTOR_INDEX_PATH) / name, settings.EMBEDDING_DIM
+            )
+            _indexes[name] = index
+        return index
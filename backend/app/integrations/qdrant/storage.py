@@ -0,0 +1,122 @@
+import math
+
+from qdrant_client.http.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Disabled,
+    Distance,
+    KeywordIndexParams,
+    KeywordIndexType,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
+)
+
+from app.core import settings
+
+QUANTIZATION_MODES = ("none", "scalar", "binary")
+# Bytes kept per vector dimension for each quantization mode
+BYTES_PER_DIMENSION = {"none": 4.0, "scalar": 1.0, "binary": 1 / 8}
+
+
+def build_vector_params(
+    dim: int | None = None, on_disk: bool | None = None
+) -> VectorParams:
+    """Vector layout for a new collection"""
+    return VectorParams(
+        size=dim or settings.EMBEDDING_DIM,
+        distance=Distance.COSINE,
+        on_disk=settings.QDRANT_ON_DISK_VECTORS if on_disk is None else on_disk,
+    )
+
+
+def build_quantization_config(
+    mode: str | None = None, always_ram: bool | None = None
+) -> ScalarQuantization | BinaryQuantization | None:
+    """Quantization config for the given mode, None for full precision
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    mode = mode or settings.QDRANT_QUANTIZATION
+    if always_ram is None:
+        always_ram = settings.QDRANT_QUANTIZATION_ALWAYS_RAM
+    if mode == "none":
+        return None
+    if mode == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=always_ram
+            )
+        )
+    if mode == "binary":
+        return BinaryQuantization(
+            binary=BinaryQuantizationConfig(always_ram=always_ram)
+        )
+    raise ValueError(f"Unknown quantization mode: {mode}")
+
+
+def build_quantization_diff(mode: str | None = None):
+    """Quantization update for an existing collection, disabling it for 'none'"""
+    return build_quantization_config(mode) or Disabled.DISABLED
+
+
+def build_vector_params_diff(on_disk: bool | None = None) -> dict:
+    """Vector layout update for an existing collection's unnamed vector"""
+    if on_disk is None:
+        on_disk = settings.QDRANT_ON_DISK_VECTORS
+    return {"": VectorParamsDiff(on_disk=on_disk)}
+
+
+def build_keyword_index_params(is_tenant: bool = False) -> KeywordIndexParams:
+    """Keyword payload index, optionally marking the field as the tenant key
+
+    Qdrant co-locates the points of each tenant on disk and builds extra
+    per-value HNSW links for tenant fields, so filtered searches only touch
+    that tenant's part of the collection.
+    """
+    return KeywordIndexParams(type=KeywordIndexType.KEYWORD, is_tenant=is_tenant)
+
+
+def build_search_params(
+    mode: str | None = None,
+    oversampling: float | None = None,
+    rescore: bool | None = None,
+) -> SearchParams | None:
+    """Search params that oversample quantized candidates and rescore them
+
+    Returns None when the collection is not quantized.
+    """
+    mode = mode or settings.QDRANT_QUANTIZATION
+    if mode == "none":
+        return None
+    return SearchParams(
+        quantization=QuantizationSearchParams(
+            ignore=False,
+            rescore=settings.QDRANT_SEARCH_RESCORE if rescore is None else rescore,
+            oversampling=oversampling or settings.QDRANT_SEARCH_OVERSAMPLING,
+        )
+    )
+
+
+def truncate_vector(vector: list[float], dim: int) -> list[float]:
+    """Keep the leading `dim` components of a Matryoshka embedding, re-normalized"""
+    head = vector[:dim]
+    norm = math.sqrt(sum(x * x for x in head)) or 1.0
+    return [x / norm for x in head]
+
+
+def estimate_ram_bytes(
+    count: int, dim: int, mode: str, on_disk: bool, always_ram: bool = True
+) -> int:
+    """Rough RAM needed for the vectors of a collection, ignoring the HNSW graph"""
+    ram = 0.0
+    if not on_disk:
+        ram += count * dim * BYTES_PER_DIMENSION["none"]
+    if mode != "none" and always_ram:
+        ram += count * dim * BYTES_PER_DIMENSION[mode]
+    return int(ram)
@@ -1,43 +1,248 @@
+import asyncio
+import hashlib
+import threading
+import time
 import uuid
+from functools import partial
 
-from langchain_core.documents import Document
-from langchain_qdrant import QdrantVectorStore, RetrievalMode
+import anyio
+from langchain_qdrant import QdrantVectorStore
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams
-from sqlalchemy import select
+from qdrant_client.http.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+    QueryRequest,
+    RecommendInput,
+    RecommendQuery,
+    SetPayload,
+    SetPayloadOperation,
+)
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core import settings
+from app.core import get_datetime, settings
 from app.core.logging_config import logger
 from app.db.models.job import JobPosting
+from app.integrations.llm.embedding_dispatcher import get_query_embedding_dispatcher
 from app.integrations.llm.provider import get_embedding_model
+from app.integrations.qdrant.local_index import get_local_index
+from app.integrations.qdrant.storage import (
+    build_keyword_index_params,
+    build_quantization_config,
+    build_quantization_diff,
+    build_search_params,
+    build_vector_params,
+    build_vector_params_diff,
+)
+
+# Suffix of versioned jobs collections, also their creation time
+COLLECTION_VERSION_FORMAT = "%Y%m%d%H%M%S"
+ORGANIZATION_ID_KEY = f"{QdrantVectorStore.METADATA_KEY}.organization_id"
+STATUS_KEY = f"{QdrantVectorStore.METADATA_KEY}.status"
 
 
 class JobVectorService:
     def __init__(self):
         self.embedding_model = get_embedding_model()
-        self.client = QdrantClient(url=settings.QDRANT_URL)
         self.collection_name = settings.QDRANT_COLLECTION_NAME
-        self._ensure_collection_exists()
-        self.qdrant = QdrantVectorStore(
-            client=self.client,
-            collection_name=self.collection_name,
-            embedding=self.embedding_model,
-            retrieval_mode=RetrievalMode.DENSE,
+        self.search_params = build_search_params()
+        # The local index is the whole store for the "local" backend and a
+        # write-through failover copy of the live collection otherwise
+        self.local_index = (
+            get_local_index(self.collection_name)
+            if settings.VECTOR_BACKEND == "local" or settings.VECTOR_FAILOVER_CACHE
+            else None
         )
+        self.client = None
+        # The collection is set up on first write instead of here, so building
+        # the service never calls Qdrant and reads can fail over when it is down
+        self._collection_ready = False
+        self._setup_lock = threading.Lock()
+        # Collection the alias pointed at when last checked; a change means
+        # the reindex command swapped in a new collection
+        self._alias_target: str | None = None
+        if settings.VECTOR_BACKEND == "local":
+            return
+        self.client = QdrantClient(url=settings.QDRANT_URL, check_compatibility=False)
 
-    def _ensure_collection_exists(self):
-        if not self.client.collection_exists(self.collection_name):
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=settings.EMBEDDING_DIM, distance=Distance.COSINE
-                ),
+    async def ensure_collection(self) -> bool:
+        """Create the jobs collection and its alias if missing, once per service
+
+        Returns False when Qdrant cannot be reached, leaving the setup to be
+        retried on the next write.
+        """
+        if not self.client or self._collection_ready:
+            return True
+        try:
+            await self._run(self._ensure_collection_once)
+        except Exception as e:
+            logger.warning(f"Qdrant collection setup failed: {e}")
+            return False
+        return True
+
+    def _ensure_collection_once(self) -> None:
+        with self._setup_lock:
+            if not self._collection_ready:
+                self._ensure_collection_exists()
+                self._collection_ready = True
+
+    def _ensure_collection_exists(self, collection_name: str | None = None):
+        collection_name = collection_name or self.collection_name
+        if self.client.collection_exists(collection_name) or self.get_alias_target(
+            collection_name
+        ):
+            logger.trace(f"Qdrant collection already exists: {collection_name}")
+            return
+        if collection_name != self.collection_name:
+            self.create_collection(collection_name)
+            return
+        # The jobs collection is always read through an alias so it can be
+        # rebuilt and swapped without downtime
+        target = self.versioned_collection_name()
+        self.create_collection(target)
+        self.client.update_collection_aliases(
+            change_aliases_operations=[
+                CreateAliasOperation(
+                    create_alias=CreateAlias(
+                        collection_name=target, alias_name=collection_name
+                    )
+                )
+            ]
+        )
+        logger.trace(f"Created alias {collection_name} -> {target}")
+
+    def create_collection(self, collection_name: str) -> None:
+        """Create a collection with the configured vector layout"""
+        self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=build_vector_params(),
+            quantization_config=build_quantization_config(),
+        )
+        self.create_payload_indexes(collection_name)
+        logger.trace(f"Created Qdrant collection: {collection_name}")
+
+    def create_payload_indexes(self, collection_name: str) -> None:
+        """Index the filtered payload fields, with the organization as tenant
+
+        Creating an index that already exists is a no-op in Qdrant.
+        """
+        self.client.create_payload_index(
+            collection_name=collection_name,
+            field_name=ORGANIZATION_ID_KEY,
+            field_schema=build_keyword_index_params(is_tenant=True),
+        )
+        self.client.create_payload_index(
+            collection_name=collection_name,
+            field_name=STATUS_KEY,
+            field_schema=build_keyword_index_params(),
+        )
+
+    def versioned_collection_name(self) -> str:
+        return f"{self.collection_name}_{get_datetime():{COLLECTION_VERSION_FORMAT}}"
+
+    def get_alias_target(self, alias: str | None = None) -> str | None:
+        """Get the collection an alias points at, None if it is not an alias"""
+        alias = alias or self.collection_name
+        for description in self.client.get_aliases().aliases:
+            if description.alias_name == alias:
+                return description.collection_name
+        return None
+
+    def swap_alias(self, target: str) -> str | None:
+        """Atomically point the jobs alias at `target`
+
+        Returns the collection the alias pointed at before, if any. A legacy
+        collection that still carries the alias name is dropped first, which
+        briefly leaves searches without a collection on that one migration.
+        """
+        alias = self.collection_name
+        previous = self.get_alias_target(alias)
+        operations = []
+        if previous:
+            operations.append(
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias))
             )
-            logger.trace(f"Created Qdrant collection: {self.collection_name}")
-        else:
-            logger.trace(f"Qdrant collection already exists: {self.collection_name}")
+        elif self.client.collection_exists(alias):
+            logger.warning(f"Replacing legacy collection {alias} with an alias")
+            self.client.delete_collection(alias)
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(collection_name=target, alias_name=alias)
+            )
+        )
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        logger.info(f"Alias {alias} now points at {target} (was {previous})")
+        return previous
+
+    def count_points(self, collection_name: str | None = None) -> int:
+        return self.client.count(
+            collection_name=collection_name or self.collection_name, exact=True
+        ).count
+
+    def get_point_ids(self, collection_name: str | None = None) -> set[uuid.UUID]:
+        """Get the IDs of every point in a collection"""
+        ids: set[uuid.UUID] = set()
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=collection_name or self.collection_name,
+                limit=1000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+            ids.update(uuid.UUID(str(p.id)) for p in points)
+            if offset is None:
+                return ids
+
+    async def apply_storage_config(self, collection_name: str | None = None) -> None:
+        """Bring an existing collection in line with the quantization settings
+
+        Qdrant rebuilds quantized data and moves vectors in the background, so
+        this is safe to call on every start.
+        """
+        if not self.client:
+            return
+        collection_name = collection_name or self.collection_name
+        try:
+            collection_name = (
+                await self._run(self.get_alias_target, collection_name)
+                or collection_name
+            )
+            await self._run(
+                self.client.update_collection,
+                collection_name=collection_name,
+                vectors_config=build_vector_params_diff(),
+                quantization_config=build_quantization_diff(),
+            )
+            await self._run(self.create_payload_indexes, collection_name)
+        except Exception as e:
+            logger.warning(f"Failed to apply storage config to {collection_name}: {e}")
+            return
+        logger.debug(
+            f"Applied storage config to {collection_name}: "
+            f"quantization={settings.QDRANT_QUANTIZATION}, "
+            f"on_disk={settings.QDRANT_ON_DISK_VECTORS}"
+        )
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking Qdrant client call without blocking the event loop"""
+        return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+    @staticmethod
+    def _point_vector(point) -> list[float] | None:
+        vector = point.vector
+        if isinstance(vector, dict):
+            vector = vector.get("")
+        return vector
 
     def _construct_job_text(self, job: JobPosting) -> str:
         if not job.job_description:
@@ -56,40 +261,44 @@ class JobVectorService:
         ]
         return "\n".join(parts)
 
+    def job_text_hash(self, job: JobPosting) -> str:
+        """Hash of the embedded job text, used to skip unchanged re-embeds"""
+        return self._hash_text(self._construct_job_text(job))
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
     def _get_organization_name(self, job: JobPosting) -> str:
         if not job.organization:
             return "Unknown Organization"
         return job.organization.name
 
+    def _build_metadata(self, job: JobPosting) -> dict:
+        return {
+            "job_id": str(job.job_id),
+            "organization_id": str(job.organization_id),
+            "organization_name": self._get_organization_name(job),
+            "title": job.title,
+            "city": job.location_city,
+            "country": job.location_country,
+            "type": job.location_type,
+            "employment_type": job.employment_type,
+            "salary_min": job.salary_min,
+            "salary_max": job.salary_max,
+            "salary_currency": job.salary_currency,
+            "status": job.status,
+            "posted_date": job.posted_date.isoformat() if job.posted_date else None,
+        }
+
     async def index_job(self, job: JobPosting, db: AsyncSession | None = None) -> bool:
-        if not self.qdrant:
-            logger.warning("Qdrant vector store not initialized")
-            return False
         if job.status != "active":
             logger.debug(
                 f"Skipping indexing for job {job.job_id}: status is not 'active'"
             )
             return False
         try:
-            text_content = self._construct_job_text(job)
-            org_name = self._get_organization_name(job)
-            metadata = {
-                "job_id": str(job.job_id),
-                "organization_id": str(job.organization_id),
-                "organization_name": org_name,
-                "title": job.title,
-                "city": job.location_city,
-                "country": job.location_country,
-                "type": job.location_type,
-                "employment_type": job.employment_type,
-                "salary_min": job.salary_min,
-                "salary_max": job.salary_max,
-                "salary_currency": job.salary_currency,
-                "status": job.status,
-                "posted_date": job.posted_date.isoformat() if job.posted_date else None,
-            }
-            doc = Document(page_content=text_content, metadata=metadata)
-            await self.qdrant.aadd_documents([doc], ids=[str(job.job_id)])
+            await self.index_jobs_batch([job])
             job.is_indexed = True
             if db:
                 await db.flush()
@@ -99,65 +308,574 @@ class JobVectorService:
             logger.error(f"Failed to index job {job.job_id}: {e}")
             return False
 
-    async def index_all_pending_jobs(self, db: AsyncSession):
-        if not self.qdrant:
-            logger.warning("Qdrant vector store not initialized, skipping job indexing")
+    async def index_jobs_batch(
+        self, jobs: list[JobPosting], collection_name: str | None = None
+    ) -> list[uuid.UUID]:
+        """Embed and upsert several jobs with one embedding call and one upsert
+
+        Returns the IDs of the jobs that were written, after recording the
+        hash of their embedded text on the job. Writes to the live collection
+        are mirrored to the local index when it is enabled.
+        """
+        prepared = self._prepare_jobs(jobs)
+        job_ids = await self._index_prepared(prepared, collection_name)
+        hashes = {job_id: text_hash for job_id, _, text_hash, _, _ in prepared}
+        for job in jobs:
+            if job.job_id in hashes:
+                job.embedded_text_hash = hashes[job.job_id]
+        return job_ids
+
+    def _prepare_jobs(self, jobs: list[JobPosting]) -> list[tuple]:
+        """(job_id, organization_id, text hash, text, metadata) of the active jobs
+
+        Read eagerly into plain data, so indexing does not touch the ORM
+        objects again after an await.
+        """
+        prepared = []
+        for job in jobs:
+            if job.status != "active":
+                continue
+            text = self._construct_job_text(job)
+            prepared.append(
+                (
+                    job.job_id,
+                    job.organization_id,
+                    self._hash_text(text),
+                    text,
+                    self._build_metadata(job),
+                )
+            )
+        return prepared
+
+    async def _index_prepared(
+        self, prepared: list[tuple], collection_name: str | None = None
+    ) -> list[uuid.UUID]:
+        if not prepared:
+            return []
+        if collection_name is None:
+            await self.ensure_collection()
+        texts = [text for _, _, _, text, _ in prepared]
+        vectors = await self.embedding_model.aembed_documents(
+            texts, batch_size=len(texts)
+        )
+        job_ids = [job_id for job_id, _, _, _, _ in prepared]
+        # The local index labels each job with its organization for tenant search
+        organization_ids = [
+            str(organization_id) for _, organization_id, _, _, _ in prepared
+        ]
+        if not self.client:
+            await self._run(self.local_index.upsert, job_ids, vectors, organization_ids)
+            return job_ids
+        points = [
+            PointStruct(
+                id=str(job_id),
+                vector=vector,
+                payload={
+                    QdrantVectorStore.CONTENT_KEY: text,
+                    QdrantVectorStore.METADATA_KEY: metadata,
+                },
+            )
+            for (job_id, _, _, text, metadata), vector in zip(
+                prepared, vectors, strict=True
+            )
+        ]
+        await self._run(
+            self.client.upsert,
+            collection_name=collection_name or self.collection_name,
+            points=points,
+        )
+        if collection_name is None and self.local_index:
+            await self._run(self.local_index.upsert, job_ids, vectors, organization_ids)
+        return job_ids
+
+    async def delete_jobs(
+        self, job_ids: list[uuid.UUID], collection_name: str | None = None
+    ) -> None:
+        """Remove jobs from the collection in a single request"""
+        if not job_ids:
             return
-        stmt = (
-            select(JobPosting)
-            .options(
-                selectinload(JobPosting.job_description),
-                selectinload(JobPosting.organization),
+        if self.client:
+            await self._run(
+                self.client.delete,
+                collection_name=collection_name or self.collection_name,
+                points_selector=PointIdsList(
+                    points=[str(job_id) for job_id in job_ids]
+                ),
             )
-            .where(JobPosting.is_indexed == False, JobPosting.status == "active")
+        if collection_name is None and self.local_index:
+            await self._run(self.local_index.delete, list(job_ids))
+
+    async def update_payloads(self, jobs: list[JobPosting]) -> None:
+        """Refresh stored job metadata without re-embedding, in a single request"""
+        # The local index keeps vectors only
+        if not jobs or not self.client:
+            return
+        await self._run(
+            self.client.batch_update_points,
+            collection_name=self.collection_name,
+            update_operations=[
+                SetPayloadOperation(
+                    set_payload=SetPayload(
+                        payload={
+                            QdrantVectorStore.METADATA_KEY: self._build_metadata(job)
+                        },
+                        points=[str(job.job_id)],
+                    )
+                )
+                for job in jobs
+            ],
+        )
+
+    def _pending_jobs_query(self):
+        return select(JobPosting).where(
+            JobPosting.is_indexed == False, JobPosting.status == "active"
+        )
+
+    async def index_all_pending_jobs(self, db: AsyncSession):
+        """Index every active job that is not in Qdrant yet
+
+        Jobs are read in keyset pages, embedded and upserted in batches with
+        bounded concurrency, and marked indexed (and committed) per batch, so
+        an interrupted run resumes where it stopped. Each page is turned into
+        plain data as it is read, since a failed batch rolls back the shared
+        session and expires every job loaded in it.
+        """
+        count_stmt = select(func.count()).select_from(
+            self._pending_jobs_query().subquery()
         )
-        result = await db.execute(stmt)
-        pending_jobs = result.scalars().all()
-        if not pending_jobs:
+        total = (await db.execute(count_stmt)).scalar_one() or 0
+        if not total:
             logger.debug(
                 "No pending active jobs to index (is_indexed=False, status=active)"
             )
             return
         logger.info(
-            f"Found {len(pending_jobs)} pending active jobs to index (is_indexed=False, status=active)"
+            f"Found {total} pending active jobs to index (is_indexed=False, status=active)"
         )
+
+        batch_size = settings.INDEXING_BATCH_SIZE
+        semaphore = asyncio.Semaphore(settings.INDEXING_CONCURRENCY)
+        db_lock = asyncio.Lock()
+        started = time.monotonic()
         successful = 0
         failed = 0
-        for job in pending_jobs:
-            if await self.index_job(job, db):
-                successful += 1
-            else:
-                failed += 1
-        await db.commit()
+
+        async def process(batch: list[tuple]):
+            nonlocal successful, failed
+            try:
+                async with semaphore:
+                    indexed_ids = set(await self._index_prepared(batch))
+                async with db_lock:
+                    if indexed_ids:
+                        await db.execute(
+                            update(JobPosting),
+                            [
+                                {
+                                    "job_id": job_id,
+                                    "is_indexed": True,
+                                    "embedded_text_hash": text_hash,
+                                }
+                                for job_id, _, text_hash, _, _ in batch
+                                if job_id in indexed_ids
+                            ],
+                        )
+                        await db.commit()
+                successful += len(indexed_ids)
+                failed += len(batch) - len(indexed_ids)
+            except Exception as e:
+                failed += len(batch)
+                logger.error(f"Failed to index batch of {len(batch)} jobs: {e}")
+                async with db_lock:
+                    await db.rollback()
+            elapsed = max(time.monotonic() - started, 0.001)
+            logger.info(
+                f"Indexing progress: {successful + failed}/{total} jobs "
+                f"({successful / elapsed:.1f} jobs/s)"
+            )
+
+        tasks: set[asyncio.Task] = set()
+        last_job_id = None
+        try:
+            while True:
+                stmt = (
+                    self._pending_jobs_query()
+                    .options(
+                        selectinload(JobPosting.job_description),
+                        selectinload(JobPosting.organization),
+                    )
+                    .order_by(JobPosting.job_id)
+                    .limit(batch_size)
+                )
+                if last_job_id:
+                    stmt = stmt.where(JobPosting.job_id > last_job_id)
+                async with db_lock:
+                    result = await db.execute(stmt)
+                    jobs = list(result.scalars().all())
+                if not jobs:
+                    break
+                last_job_id = jobs[-1].job_id
+                task = asyncio.create_task(process(self._prepare_jobs(jobs)))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                # Keep at most one page queued ahead of the running batches
+                while len(tasks) > settings.INDEXING_CONCURRENCY:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # Stop in-flight batches too, so none still holds the session
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
         logger.success(
-            f"Completed indexing: {successful} successful, {failed} failed out of {len(pending_jobs)} total jobs"
+            f"Completed indexing: {successful} successful, {failed} failed out of {total} total jobs"
         )
 
-    async def search_jobs(self, query: str, limit: int) -> list[uuid.UUID]:
+    async def search_jobs(
+        self, query: str, limit: int, organization_id: uuid.UUID | None = None
+    ) -> list[uuid.UUID]:
+        """Search jobs by free text, optionally within one organization
+
+        The query is embedded through the shared dispatcher, so concurrent
+        searches are embedded together in one API call.
+        """
         try:
-            if not self.qdrant:
-                logger.warning("Qdrant vector store not initialized")
-                return []
-            results = await self.qdrant.asimilarity_search(query, k=limit)
-            if not results:
-                return []
-            job_ids = []
-            for res in results:
-                try:
-                    job_id_str = res.metadata.get("job_id")
-                    if job_id_str:
-                        job_ids.append(uuid.UUID(job_id_str))
-                except (ValueError, KeyError):
-                    continue
-            return job_ids
+            vector = await get_query_embedding_dispatcher().embed(query)
         except Exception as e:
             logger.error(f"Vector search error: {e}")
             return []
+        hits = await self.search_jobs_by_vector(vector, limit, organization_id)
+        return [job_id for job_id, _ in hits]
+
+    async def search_organization_jobs(
+        self, organization_id: uuid.UUID, query: str, limit: int
+    ) -> list[uuid.UUID]:
+        """Search the jobs of a single organization by free text
+
+        Only active postings are in the collection, so closed or expired
+        postings are never returned.
+        """
+        return await self.search_jobs(query, limit, organization_id=organization_id)
+
+    @staticmethod
+    def _organization_filter(organization_id: uuid.UUID | None) -> Filter | None:
+        if organization_id is None:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(
+                    key=ORGANIZATION_ID_KEY,
+                    match=MatchValue(value=str(organization_id)),
+                )
+            ]
+        )
+
+    def skills_query_text(self, skills: list[str]) -> str:
+        return f"Job suitable for someone with skills: {', '.join(skills)}"
 
     async def recommend_jobs_by_skills(
         self, skills: list[str], limit: int
     ) -> list[uuid.UUID]:
         if not skills:
             return []
-        query_text = f"Job suitable for someone with skills: {', '.join(skills)}"
-        return await self.search_jobs(query_text, limit)
+        return await self.search_jobs(self.skills_query_text(skills), limit)
+
+    async def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed several search queries in a single batched request"""
+        if not texts:
+            return []
+        return await self.embedding_model.aembed_documents(
+            texts, task_type="RETRIEVAL_QUERY"
+        )
+
+    async def search_jobs_by_vector(
+        self,
+        vector: list[float],
+        limit: int,
+        organization_id: uuid.UUID | None = None,
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Search jobs by a precomputed query vector, returning scored job IDs
+
+        With an organization the search is restricted to that tenant's points.
+        Falls back to the local index when Qdrant cannot be reached.
+        """
+        if self.client:
+            try:
+                response = await self._run(
+                    self.client.query_points,
+                    collection_name=self.collection_name,
+                    query=vector,
+                    query_filter=self._organization_filter(organization_id),
+                    limit=limit,
+                    search_params=self.search_params,
+                    with_payload=False,
+                )
+                return [(uuid.UUID(str(p.id)), p.score) for p in response.points]
+            except Exception as e:
+                if not self.local_index:
+                    logger.error(f"Vector search by vector error: {e}")
+                    return []
+                logger.warning(f"Qdrant search failed, using local index: {e}")
+        return await self._run(
+            self.local_index.search,
+            vector,
+            limit,
+            str(organization_id) if organization_id else None,
+        )
+
+    async def similar_jobs(
+        self, job_id: uuid.UUID, limit: int
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Find active jobs closest to an indexed job, using its stored vector
+
+        Qdrant resolves the job's vector by point ID, so no embedding call and
+        only one request are needed. The job itself is never returned.
+        """
+        if self.client:
+            try:
+                response = await self._run(
+                    self.client.query_points,
+                    collection_name=self.collection_name,
+                    query=RecommendQuery(
+                        recommend=RecommendInput(positive=[str(job_id)])
+                    ),
+                    query_filter=Filter(
+                        must=[
+                            FieldCondition(
+                                key=STATUS_KEY,
+                                match=MatchValue(value="active"),
+                            )
+                        ]
+                    ),
+                    limit=limit,
+                    search_params=self.search_params,
+                    with_payload=False,
+                )
+                return [(uuid.UUID(str(p.id)), p.score) for p in response.points]
+            except Exception as e:
+                if not self.local_index:
+                    logger.error(f"Similar jobs search error for {job_id}: {e}")
+                    return []
+                logger.warning(f"Qdrant recommend failed, using local index: {e}")
+        vector = await self.get_job_vector(job_id)
+        if not vector:
+            return []
+        hits = await self._run(self.local_index.search, vector, limit + 1)
+        return [(hit_id, score) for hit_id, score in hits if hit_id != job_id][:limit]
+
+    async def get_job_vector(self, job_id: uuid.UUID) -> list[float] | None:
+        """Fetch the stored embedding of an indexed job"""
+        return (await self.get_job_vectors([job_id])).get(job_id)
+
+    async def get_job_vectors(
+        self, job_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[float]]:
+        """Fetch the stored embeddings of several indexed jobs in one request"""
+        if not job_ids:
+            return {}
+        if self.client:
+            try:
+                points = await self._run(
+                    self.client.retrieve,
+                    collection_name=self.collection_name,
+                    ids=[str(job_id) for job_id in job_ids],
+                    with_vectors=True,
+                    with_payload=False,
+                )
+                return {
+                    uuid.UUID(str(point.id)): vector
+                    for point in points
+                    if (vector := self._point_vector(point))
+                }
+            except Exception as e:
+                if not self.local_index:
+                    logger.error(
+                        f"Failed to fetch vectors for {len(job_ids)} jobs: {e}"
+                    )
+                    return {}
+                logger.warning(f"Qdrant retrieve failed, using local index: {e}")
+        stored = await self._run(self.local_index.get_many, list(job_ids))
+        return {job_id: vector for job_id, (_, vector) in stored.items()}
+
+    async def get_skill_queries(
+        self, profile_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[str, list[float]]]:
+        """Get stored skill-query vectors keyed by profile ID, with their text hash"""
+        if not profile_ids:
+            return {}
+        collection_name = settings.QDRANT_SKILL_QUERY_COLLECTION_NAME
+        if not self.client:
+            return await self._run(
+                get_local_index(collection_name).get_many, list(profile_ids)
+            )
+        try:
+            points = await self._run(
+                self.client.retrieve,
+                collection_name=collection_name,
+                ids=[str(profile_id) for profile_id in profile_ids],
+                with_vectors=True,
+                with_payload=True,
+            )
+        except Exception as e:
+            logger.debug(f"No stored skill queries in {collection_name}: {e}")
+            return {}
+        return {
+            uuid.UUID(str(p.id)): (
+                p.payload.get("text_hash", ""),
+                self._point_vector(p),
+            )
+            for p in points
+        }
+
+    async def upsert_skill_queries(
+        self, items: list[tuple[uuid.UUID, str, list[float]]]
+    ) -> None:
+        """Store skill-query vectors as (profile_id, text_hash, vector) tuples"""
+        if not items:
+            return
+        collection_name = settings.QDRANT_SKILL_QUERY_COLLECTION_NAME
+        if not self.client:
+            await self._run(
+                get_local_index(collection_name).upsert,
+                [profile_id for profile_id, _, _ in items],
+                [vector for _, _, vector in items],
+                [text_hash for _, text_hash, _ in items],
+            )
+            return
+        await self._run(self._ensure_collection_exists, collection_name)
+        await self._run(
+            self.client.upsert,
+            collection_name=collection_name,
+            points=[
+                PointStruct(
+                    id=str(profile_id),
+                    vector=vector,
+                    payload={"text_hash": text_hash},
+                )
+                for profile_id, text_hash, vector in items
+            ],
+        )
+
+    async def match_skill_queries(
+        self, vector: list[float], limit: int
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Find candidate profiles whose skill query is closest to a job vector"""
+        return (await self.match_skill_queries_batch([vector], limit))[0]
+
+    async def match_skill_queries_batch(
+        self, vectors: list[list[float]], limit: int
+    ) -> list[list[tuple[uuid.UUID, float]]]:
+        """`match_skill_queries` for several job vectors in one request"""
+        if not vectors:
+            return []
+        if not self.client:
+            index = get_local_index(settings.QDRANT_SKILL_QUERY_COLLECTION_NAME)
+            return await self._run(
+                lambda: [index.search(vector, limit) for vector in vectors]
+            )
+        try:
+            responses = await self._run(
+                self.client.query_batch_points,
+                collection_name=settings.QDRANT_SKILL_QUERY_COLLECTION_NAME,
+                requests=[
+                    QueryRequest(
+                        query=vector,
+                        limit=limit,
+                        params=self.search_params,
+                        with_payload=False,
+                    )
+                    for vector in vectors
+                ],
+            )
+        except Exception as e:
+            logger.error(f"Skill query matching error: {e}")
+            return [[] for _ in vectors]
+        return [
+            [(uuid.UUID(str(p.id)), p.score) for p in response.points]
+            for response in responses
+        ]
+
+    async def sync_local_index(self) -> None:
+        """Copy vectors from Qdrant into the failover index when they diverge
+
+        Vectors are copied as stored, so warming the cache never re-embeds.
+        """
+        if not self.client or not self.local_index:
+            return
+        try:
+            remote_count = await self._run(self.count_points)
+            if remote_count == self.local_index.count():
+                return
+            logger.info(
+                f"Syncing local vector index ({self.local_index.count()} points) "
+                f"from Qdrant ({remote_count} points)"
+            )
+            seen: set[uuid.UUID] = set()
+            offset = None
+            while True:
+                points, offset = await self._run(
+                    self.client.scroll,
+                    collection_name=self.collection_name,
+                    limit=256,
+                    offset=offset,
+                    with_payload=[ORGANIZATION_ID_KEY],
+                    with_vectors=True,
+                )
+                ids = [uuid.UUID(str(p.id)) for p in points]
+                await self._run(
+                    self.local_index.upsert,
+                    ids,
+                    [self._point_vector(p) for p in points],
+                    [
+                        p.payload.get(QdrantVectorStore.METADATA_KEY, {}).get(
+                            "organization_id", ""
+                        )
+                        for p in points
+                    ],
+                )
+                seen.update(ids)
+                if offset is None:
+                    break
+            stale = list(self.local_index.ids() - seen)
+            await self._run(self.local_index.delete, stale)
+            logger.success(f"Local vector index synced: {len(seen)} points")
+        except Exception as e:
+            logger.warning(f"Failed to sync local vector index: {e}")
+
+    async def detect_alias_swap(self) -> bool:
+        """Check whether the jobs alias moved to another collection
+
+        The reindex command runs in its own process, so the app notices a swap
+        here and rebuilds its failover index from the new collection.
+        Returns True when the alias changed since the previous check.
+        """
+        if not self.client:
+            return False
+        try:
+            target = await self._run(self.get_alias_target)
+        except Exception as e:
+            logger.warning(f"Failed to read the jobs alias: {e}")
+            return False
+        previous, self._alias_target = self._alias_target, target
+        if previous is None or target == previous:
+            return False
+        logger.info(f"Jobs alias moved from {previous} to {target}")
+        if self.local_index:
+            await self._run(self.local_index.reset)
+            await self.sync_local_index()
+        return True
+
+
+_job_vector_service: JobVectorService | None = None
+_job_vector_service_lock = threading.Lock()
+
+
+def get_job_vector_service() -> JobVectorService:
+    """Process-wide jobs vector service, sharing one Qdrant client"""
+    global _job_vector_service
+    with _job_vector_service_lock:
+        if _job_vector_service is None:
+            _job_vector_service = JobVectorService()
+        return _job_vector_service
@@ -95,8 +95,25 @@ class JobResponse(
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class JobFacets(BaseModel):
+    employment_type: Annotated[dict[str, int], "Job count per employment type"]
+    location_type: Annotated[dict[str, int], "Job count per location type"]
+
+
 class JobListResponse(PaginationMixin):
     jobs: Annotated[list[JobResponse], "List of jobs"]
+    next_cursor: Annotated[str | None, "Opaque cursor for the next page"] = None
+    facets: Annotated[JobFacets | None, "Counts per filter value, on request"] = None
+
+
+class SimilarJobsResponse(BaseModel):
+    job_id: UUID
+    jobs: Annotated[list[JobResponse], "Visible jobs most similar to this one"]
+
+
+class SuggestionResponse(BaseModel):
+    titles: Annotated[list[str], "Active job titles matching the prefix"]
+    skills: Annotated[list[str], "Candidate skills matching the prefix"]
 
 
 class JobCreateUpdateBase(JobDescription):
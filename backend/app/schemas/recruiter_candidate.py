@@ -30,6 +30,25 @@ class RecruiterCandidateListResponse(BaseModel):
     total: int
 
 
+class TalentSearchResult(BaseModel):
+    candidate_id: UUID
+    name: str
+    email: EmailStr
+    picture: str | None = None
+    professional_headline: str | None = None
+    professional_summary: str | None = None
+    location_city: str | None = None
+    location_country: str | None = None
+    skills: list[str] = []
+    score: float
+
+
+class TalentSearchResponse(BaseModel):
+    job_id: UUID
+    candidates: list[TalentSearchResult]
+    total: int
+
+
 class UpdateApplicationRequest(BaseModel):
     status: str | None = None
     score: int | None = None
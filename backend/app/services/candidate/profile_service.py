@@ -20,6 +20,10 @@ from app.db.repositories.candidate_repo import (
 from app.db.repositories.user_repo import UserRepository
 from app.schemas import CandidateProfileUpdate
 
+# Profiles whose talent search embedding is out of date, drained by the
+# scheduler in this process
+stale_search_profiles: set[uuid.UUID] = set()
+
 
 class ProfileService:
     def __init__(
@@ -40,6 +44,16 @@ class ProfileService:
         self.candidate_social_link_repo = candidate_social_link_repo
         self.user_repo = user_repo
 
+    @staticmethod
+    def _queue_search_profile(profile_id: uuid.UUID) -> None:
+        """Queue the talent search embedding of a profile for a refresh
+
+        The scheduler re-embeds queued profiles shortly after, so profile
+        requests never wait on the vector store. Anything lost on a restart
+        is picked up by the nightly profile indexing job.
+        """
+        stale_search_profiles.add(profile_id)
+
     async def get_full_profile(self, user: User) -> CandidateProfile | None:
         """Get full candidate profile with all related data"""
         return await self.candidate_profile_repo.get_full_profile(user.user_id)
@@ -59,6 +73,7 @@ class ProfileService:
 
         if update_data:
             await self.candidate_profile_repo.update(profile.profile_id, **update_data)
+            self._queue_search_profile(profile.profile_id)
         return await self.get_full_profile(user)
 
     async def add_experience(self, user: User, data) -> CandidateWorkExperience | None:
@@ -71,7 +86,9 @@ class ProfileService:
             profile_id=profile.profile_id,
             **data.model_dump(),
         )
-        return await self.candidate_work_experience_repo.create(experience)
+        created = await self.candidate_work_experience_repo.create(experience)
+        self._queue_search_profile(profile.profile_id)
+        return created
 
     async def delete_experience(self, user: User, item_id: uuid.UUID) -> bool:
         """Delete work experience"""
@@ -81,6 +98,7 @@ class ProfileService:
         experience = await self.candidate_work_experience_repo.get(item_id)
         if experience and experience.profile_id == profile.profile_id:
             await self.candidate_work_experience_repo.delete(item_id)
+            self._queue_search_profile(profile.profile_id)
             return True
         return False
 
@@ -95,7 +113,11 @@ class ProfileService:
         if not experience or experience.profile_id != profile.profile_id:
             return None
         update_data = data.model_dump(exclude_unset=True)
-        return await self.candidate_work_experience_repo.update(item_id, **update_data)
+        updated = await self.candidate_work_experience_repo.update(
+            item_id, **update_data
+        )
+        self._queue_search_profile(profile.profile_id)
+        return updated
 
     async def add_education(self, user: User, data) -> CandidateEducation | None:
         """Add education"""
@@ -143,7 +165,9 @@ class ProfileService:
             profile_id=profile.profile_id,
             **data.model_dump(),
         )
-        return await self.candidate_skills_repo.create(skill)
+        created = await self.candidate_skills_repo.create(skill)
+        self._queue_search_profile(profile.profile_id)
+        return created
 
     async def delete_skill(self, user: User, item_id: uuid.UUID) -> bool:
         """Delete skill"""
@@ -153,6 +177,7 @@ class ProfileService:
         skill = await self.candidate_skills_repo.get(item_id)
         if skill and skill.profile_id == profile.profile_id:
             await self.candidate_skills_repo.delete(item_id)
+            self._queue_search_profile(profile.profile_id)
             return True
         return False
 
@@ -167,7 +192,9 @@ class ProfileService:
         if not skill or skill.profile_id != profile.profile_id:
             return None
         update_data = data.model_dump(exclude_unset=True)
-        return await self.candidate_skills_repo.update(item_id, **update_data)
+        updated = await self.candidate_skills_repo.update(item_id, **update_data)
+        self._queue_search_profile(profile.profile_id)
+        return updated
 
     async def add_certification(
         self, user: User, data
@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import math
+import uuid
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db.models.candidate import CandidateProfile
+from app.db.repositories.candidate_repo import CandidateProfileRepository
+from app.db.repositories.job_repo import JobRepository
+from app.db.repositories.recommendation_repo import JobRecommendationRepository
+from app.integrations.qdrant.vector_service import JobVectorService
+
+# Vector hits fetched per profile before dropping jobs that are no longer visible
+SEARCH_POOL_FACTOR = 4
+# Profiles a newly created job is matched against during incremental refresh
+INCREMENTAL_FANOUT = 5000
+
+
+class RecommendationService:
+    """Maintains materialized top-K job recommendations per candidate profile"""
+
+    def __init__(
+        self,
+        recommendation_repo: JobRecommendationRepository,
+        candidate_profile_repo: CandidateProfileRepository,
+        job_repo: JobRepository,
+        vector_service: JobVectorService,
+    ):
+        self.recommendation_repo = recommendation_repo
+        self.candidate_profile_repo = candidate_profile_repo
+        self.job_repo = job_repo
+        self.vector_service = vector_service
+
+    async def get_page(
+        self,
+        profile: CandidateProfile,
+        page: int = 1,
+        limit: int = 10,
+        cursor: str | None = None,
+        employment_type: str | None = None,
+        location_type: str | None = None,
+    ) -> dict | None:
+        """Read a page of materialized recommendations
+
+        Profiles that were never materialized are computed on first read.
+        Returns None when there is nothing to recommend.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = None
+        if cursor:
+            score, job_id = decode_cursor(cursor, 2)
+            try:
+                after = (float(score), uuid.UUID(job_id))
+            except (TypeError, ValueError) as e:
+                raise ValueError("Invalid pagination cursor") from e
+
+        has_recommendations = await self.recommendation_repo.has_recommendations(
+            profile.profile_id
+        )
+        if not has_recommendations:
+            # An empty refresh is kept until the nightly run or a new job
+            # matches, instead of being recomputed on every read
+            if await self.recommendation_repo.is_materialized(profile.profile_id):
+                return None
+            if not await self.refresh_profiles([profile]):
+                return None
+
+        rows = await self.recommendation_repo.get_visible_page(
+            profile.profile_id,
+            limit=limit,
+            after=after,
+            offset=(page - 1) * limit,
+            employment_type=employment_type,
+            location_type=location_type,
+        )
+        total = await self.recommendation_repo.count_visible(
+            profile.profile_id,
+            employment_type=employment_type,
+            location_type=location_type,
+        )
+        total_pages = math.ceil(total / limit) if limit > 0 else 0
+        next_cursor = None
+        if len(rows) == limit:
+            last_job, last_score = rows[-1]
+            next_cursor = encode_cursor([last_score, str(last_job.job_id)])
+
+        return {
+            "jobs": [job for job, _ in rows],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "has_next": next_cursor is not None,
+            "has_prev": page > 1 or after is not None,
+            "next_cursor": next_cursor,
+        }
+
+    async def refresh_profiles(self, profiles: list[CandidateProfile]) -> int:
+        """Recompute top-K recommendations for the given profiles
+
+        Skill-query vectors are reused when the skill text has not changed, so
+        a nightly run only embeds profiles whose skills were edited.
+        """
+        profiles = [p for p in profiles if p.skills]
+        if not profiles:
+            return 0
+
+        texts = {
+            p.profile_id: self.vector_service.skills_query_text(
+                sorted(s.skill_name for s in p.skills)
+            )
+            for p in profiles
+        }
+        hashes = {
+            profile_id: hashlib.sha256(text.encode()).hexdigest()
+            for profile_id, text in texts.items()
+        }
+        stored = await self.vector_service.get_skill_queries(list(texts))
+        vectors = {
+            profile_id: vector
+            for profile_id, (text_hash, vector) in stored.items()
+            if vector and text_hash == hashes.get(profile_id)
+        }
+
+        stale = [profile_id for profile_id in texts if profile_id not in vectors]
+        if stale:
+            embedded = await self.vector_service.embed_queries(
+                [texts[profile_id] for profile_id in stale]
+            )
+            vectors.update(zip(stale, embedded, strict=True))
+            await self.vector_service.upsert_skill_queries(
+                [
+                    (profile_id, hashes[profile_id], vectors[profile_id])
+                    for profile_id in stale
+                ]
+            )
+
+        top_k = settings.RECOMMENDATION_TOP_K
+        profile_ids = list(vectors)
+        results = await asyncio.gather(
+            *(
+                self.vector_service.search_jobs_by_vector(
+                    vectors[profile_id], limit=top_k * SEARCH_POOL_FACTOR
+                )
+                for profile_id in profile_ids
+            )
+        )
+        candidate_ids = {job_id for hits in results for job_id, _ in hits}
+        visible_ids = await self.job_repo.filter_visible_ids(list(candidate_ids))
+
+        refreshed = 0
+        for profile_id, hits in zip(profile_ids, results, strict=True):
+            scored = [
+                (job_id, score) for job_id, score in hits if job_id in visible_ids
+            ]
+            await self.recommendation_repo.replace_for_profile(
+                profile_id, scored[:top_k]
+            )
+            if scored:
+                refreshed += 1
+        return refreshed
+
+    async def refresh_batch(
+        self, after_profile_id: uuid.UUID | None = None
+    ) -> tuple[uuid.UUID | None, int]:
+        """Refresh the next batch of profiles
+
+        Returns the last profile ID of the batch (None when done) and the
+        number of profiles that received recommendations.
+        """
+        profiles = await self.candidate_profile_repo.get_batch_with_skills(
+            after_profile_id, limit=settings.RECOMMENDATION_BATCH_SIZE
+        )
+        if not profiles:
+            return None, 0
+        refreshed = await self.refresh_profiles(list(profiles))
+        return profiles[-1].profile_id, refreshed
+
+    async def add_job(self, job_id: uuid.UUID) -> int:
+        """Merge a newly indexed job into the materialized lists it belongs to"""
+        return await self.add_jobs([job_id])
+
+    async def add_jobs(self, job_ids: list[uuid.UUID]) -> int:
+        """Merge newly indexed jobs into the materialized lists they belong to
+
+        Vectors are fetched, matched against skill queries and merged with
+        one request each, however many jobs there are.
+        """
+        vectors = await self.vector_service.get_job_vectors(job_ids)
+        if not vectors:
+            return 0
+        matches = await self.vector_service.match_skill_queries_batch(
+            list(vectors.values()), limit=INCREMENTAL_FANOUT
+        )
+        merged = await self.recommendation_repo.merge_jobs(
+            {
+                job_id: dict(job_matches)
+                for job_id, job_matches in zip(vectors, matches, strict=True)
+            },
+            settings.RECOMMENDATION_TOP_K,
+        )
+        logger.debug(f"Merged {len(vectors)} jobs into {merged} recommendation lists")
+        return merged
+
+    async def remove_jobs(self, job_ids: list[uuid.UUID]) -> int:
+        """Drop jobs from all materialized recommendation lists"""
+        return await self.recommendation_repo.delete_by_jobs(job_ids)
+
+    async def prune_invisible(self) -> int:
+        """Drop recommendations for jobs that were expired or closed"""
+        return await self.recommendation_repo.prune_invisible()
@@ -5,12 +5,12 @@ from app.db.models.resume import (
     ResumeCertification,
     ResumeEducation,
     ResumeSkills,
-    ResumeSocialLink,
     ResumeWorkExperience,
 )
 from app.db.models.user import User
 from app.db.repositories.candidate_repo import CandidateProfileRepository
 from app.db.repositories.resume_repo import (
+    FORK_SECTIONS,
     ResumeCertificationRepository,
     ResumeEducationRepository,
     ResumeRepository,
@@ -52,106 +52,23 @@ class ResumeService:
         self.resume_social_link_repo = resume_social_link_repo
 
     async def create_resume_fork(self, user: User, data: ResumeCreate) -> Resume | None:
-        """Create a new resume by forking from profile"""
-        profile = await self.candidate_profile_repo.get_full_profile(user.user_id)
-        if not profile:
-            return None
-
-        new_resume_id = uuid.uuid4()
-        new_resume = Resume(
-            resume_id=new_resume_id,
-            profile_id=profile.profile_id,
-            target_job_title=data.target_job_title,
-            custom_summary=data.custom_summary or profile.professional_summary,
-        )
-        await self.resume_repo.create(new_resume)
-
-        # Copy work experiences
-        source_experiences = (
-            data.work_experiences
-            if data.work_experiences is not None
-            else (profile.work_experiences or [])
-        )
-        for exp in source_experiences:
-            experience = ResumeWorkExperience(
-                resume_work_experience_id=uuid.uuid4(),
-                resume_id=new_resume_id,
-                job_title=exp.job_title,
-                company=exp.company,
-                location=exp.location,
-                start_date=exp.start_date,
-                end_date=exp.end_date,
-                is_current=exp.is_current,
-                description=getattr(exp, "description", None),
-            )
-            await self.resume_work_experience_repo.create(experience)
-
-        # Copy educations
-        source_educations = (
-            data.educations
-            if data.educations is not None
-            else (profile.educations or [])
-        )
-        for edu in source_educations:
-            education = ResumeEducation(
-                resume_education_id=uuid.uuid4(),
-                resume_id=new_resume_id,
-                college_name=edu.college_name,
-                degree=edu.degree,
-                location=edu.location,
-                start_date=edu.start_date,
-                end_date=edu.end_date,
-                is_current=edu.is_current,
-            )
-            await self.resume_education_repo.create(education)
+        """Create a new resume by forking from profile
 
-        # Copy skills
-        source_skills = (
-            data.skills if data.skills is not None else (profile.skills or [])
+        Sections supplied in the request replace the profile's; the fork is
+        written in a single statement.
+        """
+        sections = {
+            name: None
+            if (items := getattr(data, name)) is None
+            else [item.model_dump() for item in items]
+            for name, *_ in FORK_SECTIONS
+        }
+        resume_id = await self.resume_repo.fork_from_profile(
+            user.user_id, data.target_job_title, data.custom_summary, sections
         )
-        for skill in source_skills:
-            resume_skill = ResumeSkills(
-                resume_skill_id=uuid.uuid4(),
-                resume_id=new_resume_id,
-                skill_name=skill.skill_name,
-            )
-            await self.resume_skill_repo.create(resume_skill)
-
-        # Copy certifications
-        source_certifications = (
-            data.certifications
-            if data.certifications is not None
-            else (profile.certifications or [])
-        )
-        for cert in source_certifications:
-            certification = ResumeCertification(
-                resume_certification_id=uuid.uuid4(),
-                resume_id=new_resume_id,
-                certification_name=cert.certification_name,
-                issuing_body=cert.issuing_body,
-                credential_url=cert.credential_url,
-                issue_date=cert.issue_date,
-                expiration_date=cert.expiration_date,
-                does_not_expire=cert.does_not_expire,
-            )
-            await self.resume_certification_repo.create(certification)
-
-        # Copy social links
-        source_links = (
-            data.social_links
-            if data.social_links is not None
-            else (profile.social_links or [])
-        )
-        for link in source_links:
-            social_link = ResumeSocialLink(
-                resume_social_link_id=uuid.uuid4(),
-                resume_id=new_resume_id,
-                type=link.type,
-                url=link.url,
-            )
-            await self.resume_social_link_repo.create(social_link)
-
-        return await self.get_resume(user, new_resume_id)
+        if not resume_id:
+            return None
+        return await self.resume_repo.get_with_details(resume_id)
 
     async def get_resume(self, user: User, resume_id: uuid.UUID) -> Resume | None:
         """Get resume by ID for a user"""
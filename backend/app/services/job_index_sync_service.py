@@ -0,0 +1,141 @@
+import uuid
+from collections import defaultdict
+
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.db.models.job import IndexAction
+from app.db.repositories.job_repo import (
+    VISIBLE_STATUSES,
+    JobIndexOutboxRepository,
+    JobRepository,
+)
+from app.integrations.qdrant.vector_service import JobVectorService
+from app.services.candidate.recommendation_service import RecommendationService
+from app.services.job_service import search_cache, similar_jobs_cache
+
+
+class JobIndexSyncService:
+    """Applies queued job changes from the outbox to the vector index"""
+
+    def __init__(
+        self,
+        outbox_repo: JobIndexOutboxRepository,
+        job_repo: JobRepository,
+        vector_service: JobVectorService,
+        recommendation_service: RecommendationService,
+    ):
+        self.outbox_repo = outbox_repo
+        self.job_repo = job_repo
+        self.vector_service = vector_service
+        self.recommendation_service = recommendation_service
+
+    async def check_alias_swap(self) -> None:
+        """Drop cached search and similar-job results after a reindex swap
+
+        Both were ranked against the previous collection's embeddings.
+        """
+        if await self.vector_service.detect_alias_swap():
+            search_cache.clear()
+            similar_jobs_cache.clear()
+
+    async def sync_batch(self) -> int:
+        """Process one batch of outbox events and return how many were claimed
+
+        Events are coalesced per job and resolved against the job's current
+        state, so a burst of edits costs at most one Qdrant write per job.
+        Jobs are only re-embedded when the hash of their text changed; other
+        edits become a payload update. Each kind of write is sent as a single
+        batched request, and newly indexed jobs are merged into the
+        materialized recommendations together.
+        """
+        events = await self.outbox_repo.claim_batch(
+            limit=settings.INDEX_SYNC_BATCH_SIZE,
+            max_attempts=settings.INDEX_SYNC_MAX_ATTEMPTS,
+        )
+        if not events:
+            return 0
+
+        requested: dict[uuid.UUID, set[str]] = defaultdict(set)
+        event_ids: dict[uuid.UUID, list[uuid.UUID]] = defaultdict(list)
+        for event in events:
+            requested[event.job_id].add(event.action)
+            event_ids[event.job_id].append(event.event_id)
+
+        jobs = await self.job_repo.get_many_with_details(list(requested))
+        to_delete: list[uuid.UUID] = []
+        to_reindex = []
+        to_payload = []
+        for job_id, actions in requested.items():
+            job = jobs.get(job_id)
+            if not job or job.status not in VISIBLE_STATUSES:
+                to_delete.append(job_id)
+            elif (
+                IndexAction.REINDEX in actions
+                or not job.is_indexed
+                or job.embedded_text_hash != self.vector_service.job_text_hash(job)
+            ):
+                to_reindex.append(job)
+            else:
+                to_payload.append(job)
+
+        await self._apply(
+            "delete",
+            to_delete,
+            event_ids,
+            lambda: self._delete_jobs(to_delete, [j for j in to_delete if j in jobs]),
+        )
+        await self._apply(
+            "reindex",
+            [job.job_id for job in to_reindex],
+            event_ids,
+            lambda: self._reindex_jobs(to_reindex),
+        )
+        await self._apply(
+            "payload update",
+            [job.job_id for job in to_payload],
+            event_ids,
+            lambda: self.vector_service.update_payloads(to_payload),
+        )
+        return len(events)
+
+    async def _apply(
+        self,
+        label: str,
+        job_ids: list[uuid.UUID],
+        event_ids: dict[uuid.UUID, list[uuid.UUID]],
+        operation,
+    ) -> None:
+        """Run one kind of index write and settle its outbox events
+
+        The operation's database writes run in a savepoint, so a failure
+        leaves the transaction usable for recording the failed attempt.
+        """
+        processed = [eid for job_id in job_ids for eid in event_ids[job_id]]
+        try:
+            async with self.outbox_repo.db.begin_nested():
+                await operation()
+        except Exception as e:
+            logger.error(f"Index sync {label} failed for {len(job_ids)} jobs: {e}")
+            await self.outbox_repo.mark_failed(processed, str(e))
+            return
+        await self.outbox_repo.delete_events(processed)
+        for job_id in job_ids:
+            similar_jobs_cache.delete(job_id)
+        if job_ids:
+            logger.debug(f"Index sync applied {label} for {len(job_ids)} jobs")
+
+    async def _delete_jobs(
+        self, job_ids: list[uuid.UUID], existing_ids: list[uuid.UUID]
+    ) -> None:
+        if not job_ids:
+            return
+        await self.vector_service.delete_jobs(job_ids)
+        await self.job_repo.set_indexed(existing_ids, False)
+        await self.recommendation_service.remove_jobs(existing_ids)
+
+    async def _reindex_jobs(self, jobs: list) -> None:
+        if not jobs:
+            return
+        indexed_ids = await self.vector_service.index_jobs_batch(jobs)
+        await self.job_repo.set_indexed(indexed_ids, True)
+        await self.recommendation_service.add_jobs(indexed_ids)
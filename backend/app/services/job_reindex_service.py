@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime
+
+from app.core import get_datetime, settings
+from app.core.logging_config import logger
+from app.db.repositories.job_repo import JobRepository
+from app.integrations.qdrant.vector_service import (
+    COLLECTION_VERSION_FORMAT,
+    JobVectorService,
+)
+
+
+class JobReindexService:
+    """Rebuilds the jobs collection next to the live one and swaps the alias
+
+    Searches keep reading the old collection through the alias until the new
+    one is complete and verified, so a model or dimension change never takes
+    search offline.
+    """
+
+    def __init__(self, job_repo: JobRepository, vector_service: JobVectorService):
+        self.job_repo = job_repo
+        self.vector_service = vector_service
+
+    async def build(self, throttle_seconds: float | None = None) -> str:
+        """Index every active job into a new versioned collection
+
+        Jobs changed while the copy ran are re-embedded and deleted jobs are
+        dropped before the point count is checked against the database.
+
+        Raises:
+            RuntimeError: If the new collection does not match the database
+        """
+        if not self.vector_service.client:
+            raise RuntimeError("Reindexing requires the Qdrant vector backend")
+        if throttle_seconds is None:
+            throttle_seconds = settings.REINDEX_THROTTLE_SECONDS
+        target = self.vector_service.versioned_collection_name()
+        await self.vector_service._run(self.vector_service.create_collection, target)
+        logger.info(f"Reindexing active jobs into {target}")
+
+        indexed = 0
+        last_job_id = None
+        while True:
+            batch = await self.job_repo.get_active_batch(
+                last_job_id, limit=settings.INDEXING_BATCH_SIZE
+            )
+            if not batch:
+                break
+            last_job_id = batch[-1].job_id
+            indexed += len(
+                await self.vector_service.index_jobs_batch(list(batch), target)
+            )
+            logger.info(f"Reindex progress: {indexed} jobs in {target}")
+            # Bound embedding throughput so live traffic keeps its API quota
+            if throttle_seconds:
+                await asyncio.sleep(throttle_seconds)
+
+        await self.catch_up(target, self._built_at(target))
+        await self.verify(target)
+        return target
+
+    @staticmethod
+    def _built_at(target: str) -> datetime:
+        return datetime.strptime(target.rsplit("_", 1)[-1], COLLECTION_VERSION_FORMAT)
+
+    async def catch_up(self, target: str, since: datetime) -> None:
+        """Apply job changes made since `since` to the target collection"""
+        changed = await self.job_repo.get_active_ids_changed_since(since)
+        for i in range(0, len(changed), settings.INDEXING_BATCH_SIZE):
+            jobs = await self.job_repo.get_many_with_details(
+                changed[i : i + settings.INDEXING_BATCH_SIZE]
+            )
+            await self.vector_service.index_jobs_batch(list(jobs.values()), target)
+
+        active_ids = await self.job_repo.get_active_ids()
+        point_ids = await self.vector_service._run(
+            self.vector_service.get_point_ids, target
+        )
+        stale = list(point_ids - active_ids)
+        await self.vector_service.delete_jobs(stale, target)
+        logger.info(
+            f"Reindex catch-up on {target}: {len(changed)} re-embedded, "
+            f"{len(stale)} removed"
+        )
+
+    async def verify(self, target: str) -> None:
+        expected = len(await self.job_repo.get_active_ids())
+        actual = await self.vector_service._run(
+            self.vector_service.count_points, target
+        )
+        if actual != expected:
+            raise RuntimeError(
+                f"Collection {target} has {actual} points, expected {expected}"
+            )
+        logger.info(f"Verified {target}: {actual} points")
+
+    async def swap(
+        self, target: str, drop_previous: bool = True, reset_skill_queries: bool = True
+    ) -> str | None:
+        """Point the jobs alias at `target` and clean up after the swap
+
+        The target may have been built well before the swap, so it is brought
+        up to date first; a second pass covers edits that the outbox worker
+        applied to the old collection while the alias was switching.
+        Stored skill-query vectors come from the previous embedding model, so
+        they are dropped and re-embedded by the next recommendation refresh.
+        The running app sees the new alias target on its next index sync and
+        clears its search cache and failover index itself.
+        """
+        await self.catch_up(target, self._built_at(target))
+        await self.verify(target)
+        swap_started_at = get_datetime()
+        previous = await self.vector_service._run(
+            self.vector_service.swap_alias, target
+        )
+        await self.catch_up(target, swap_started_at)
+
+        await self.job_repo.set_indexed(
+            list(await self.job_repo.get_active_ids()), True
+        )
+        client = self.vector_service.client
+        if previous and drop_previous:
+            await self.vector_service._run(client.delete_collection, previous)
+            logger.info(f"Dropped previous collection {previous}")
+        if reset_skill_queries:
+            await self.vector_service._run(
+                client.delete_collection, settings.QDRANT_SKILL_QUERY_COLLECTION_NAME
+            )
+        return previous
+
+    async def list_versions(self) -> list[tuple[str, bool]]:
+        """List versioned job collections and whether the alias points at them"""
+        client = self.vector_service.client
+        current = await self.vector_service._run(self.vector_service.get_alias_target)
+        prefix = f"{self.vector_service.collection_name}_"
+        response = await self.vector_service._run(client.get_collections)
+        return sorted(
+            (c.name, c.name == current)
+            for c in response.collections
+            if c.name.startswith(prefix) and c.name[len(prefix) :].isdigit()
+        )
@@ -1,18 +1,43 @@
+import hashlib
+import json
+import math
 import uuid
 from datetime import date
+from functools import partial
 
-from app.core import get_datetime
+from app.core import get_datetime, settings
 from app.core.authorization import verify_user_can_edit_job
+from app.core.cache import TTLCache
+from app.core.logging_config import logger
+from app.core.pagination import decode_cursor, encode_cursor
 from app.db.models.job import JobDescription, JobPosting, ShortlistStatus
 from app.db.repositories.candidate_repo import CandidateProfileRepository
 from app.db.repositories.job_repo import JobDescriptionRepository, JobRepository
 from app.db.repositories.user_repo import UserRepository
+from app.db.session import run_after_commit
 from app.integrations.qdrant.vector_service import JobVectorService
+from app.services.candidate.recommendation_service import RecommendationService
 from app.services.recruiter.activity_events import ActivityEventEmitter
-from app.core.logging_config import logger
+from app.services.suggestion_service import title_suggestions
 
 VISIBLE_STATUSES = ["active"]
 
+# Ranked job IDs per (query, filters), shared by all requests of this process
+search_cache = TTLCache(
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+)
+# Exact totals of date-ordered listings per filter set, dropped on job writes
+listing_count_cache = TTLCache(
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+)
+# Similar job IDs per job, dropped when the job is re-embedded or removed
+similar_jobs_cache = TTLCache(
+    ttl_seconds=settings.SIMILAR_JOBS_CACHE_TTL_SECONDS,
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+)
+
 
 class JobService:
     def __init__(
@@ -23,6 +48,7 @@ class JobService:
         user_repo: UserRepository,
         vector_service: JobVectorService,
         activity_emitter: ActivityEventEmitter,
+        recommendation_service: RecommendationService,
     ):
         self.job_repo = job_repo
         self.job_description_repo = job_description_repo
@@ -30,6 +56,7 @@ class JobService:
         self.user_repo = user_repo
         self.vector_service = vector_service
         self.activity_emitter = activity_emitter
+        self.recommendation_service = recommendation_service
 
     async def get_recommendations(
         self,
@@ -38,37 +65,41 @@ class JobService:
         limit: int = 10,
         employment_type: str | None = None,
         location_type: str | None = None,
+        cursor: str | None = None,
     ):
+        """Get recommended jobs from the materialized recommendation table
+
+        Raises:
+            ValueError: If the pagination cursor is malformed
+        """
         candidate = await self.candidate_profile_repo.get_with_skills(user_id)
-        user_skills = []
         if candidate and candidate.skills:
-            user_skills = [s.skill_name for s in candidate.skills]
-
-        job_ids = None
-        order_by_date = True
-        if user_skills:
             try:
-                raw_ids = await self.vector_service.recommend_jobs_by_skills(
-                    user_skills, limit=1000
+                recommendations = await self.recommendation_service.get_page(
+                    candidate,
+                    page=page,
+                    limit=limit,
+                    cursor=cursor,
+                    employment_type=employment_type,
+                    location_type=location_type,
                 )
-                if raw_ids:
-                    job_ids = raw_ids
-                    order_by_date = False
+                if recommendations is not None:
+                    return recommendations
+            except ValueError:
+                raise
             except Exception as e:
-
                 logger.warning(f"Vector search failed for recommendations: {e}")
-                job_ids = None
-                order_by_date = True
 
-        # Get paginated jobs using repository
-        return await self.job_repo.get_visible_jobs_paginated(
+        # Fall back to the newest visible jobs, paged by number since the
+        # cursor parameter carries recommendation cursors here
+        result = await self.job_repo.get_visible_listing_paginated(
             page=page,
             limit=limit,
             employment_type=employment_type,
             location_type=location_type,
-            job_ids=job_ids,
-            order_by_date=order_by_date,
         )
+        result["next_cursor"] = None
+        return result
 
     async def search_jobs(
         self,
@@ -77,25 +108,167 @@ class JobService:
         limit: int = 10,
         employment_type: str | None = None,
         location_type: str | None = None,
+        cursor: str | None = None,
+        include_facets: bool = False,
     ):
-        # Get search results from vector service if query provided
-        job_ids = None
-        order_by_date = True
-        if query.strip():
-            raw_ids = await self.vector_service.search_jobs(query, limit=1000)
-            if raw_ids:
-                job_ids = raw_ids
-                order_by_date = False
-
-        # Get paginated jobs using repository
-        return await self.job_repo.get_visible_jobs_paginated(
+        """Search visible jobs, ranked by relevance when a query is given
+
+        A query is ranked once without filters and each filter combination
+        narrows that list, so both are cached for a short time and following
+        pages or filter changes only fetch their own rows. Facet counts are
+        computed over the same unfiltered list. Date-ordered listings page by
+        a (posted_date, job_id) cursor with a cached total.
+
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another search
+        """
+        query = query.strip()
+        all_ids = await self._get_ranked_ids(query) if query else None
+        if all_ids is not None:
+            key = self._search_key(query, employment_type, location_type)
+            offset = (page - 1) * limit
+            if cursor:
+                cursor_key, offset = decode_cursor(cursor, 2)
+                if cursor_key != key or not isinstance(offset, int) or offset < 0:
+                    raise ValueError("Invalid pagination cursor")
+            ranked_ids = all_ids
+            if employment_type or location_type:
+                ranked_ids = search_cache.get(key)
+                if ranked_ids is None:
+                    ranked_ids = await self.job_repo.get_visible_ids_ranked(
+                        all_ids, employment_type, location_type
+                    )
+                    search_cache.set(key, ranked_ids)
+            result = await self._get_ranked_page(ranked_ids, key, offset, limit)
+            if include_facets:
+                result["facets"] = await self._get_facets(
+                    all_ids, employment_type, location_type
+                )
+            return result
+
+        # Without a query (or search results) jobs are listed by date
+        count_key = ("visible", employment_type, location_type)
+        result = await self.job_repo.get_visible_listing_paginated(
             page=page,
             limit=limit,
             employment_type=employment_type,
             location_type=location_type,
-            job_ids=job_ids,
-            order_by_date=order_by_date,
+            after=self._decode_listing_cursor(cursor),
+            total=listing_count_cache.get(count_key),
         )
+        listing_count_cache.set(count_key, result["total"])
+        if include_facets:
+            result["facets"] = await self._get_facets(
+                None, employment_type, location_type
+            )
+        return result
+
+    @staticmethod
+    def _decode_listing_cursor(cursor: str | None) -> tuple[date, uuid.UUID] | None:
+        """Decode a (posted_date, job_id) listing cursor
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if not cursor:
+            return None
+        posted_date, job_id = decode_cursor(cursor, 2)
+        try:
+            return date.fromisoformat(posted_date), uuid.UUID(job_id)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+
+    async def _get_ranked_ids(self, query: str) -> list[uuid.UUID] | None:
+        key = self._search_key(query, None, None)
+        ranked_ids = search_cache.get(key)
+        if ranked_ids is None:
+            ranked_ids = await self._rank_search_results(query)
+            if ranked_ids is not None:
+                search_cache.set(key, ranked_ids)
+        return ranked_ids
+
+    async def _get_facets(
+        self,
+        job_ids: list[uuid.UUID] | None,
+        employment_type: str | None,
+        location_type: str | None,
+    ) -> dict:
+        """Count visible jobs per employment and location type
+
+        Each facet is counted with the other facet's filter applied but not
+        its own, so the UI can show what switching a value would return. Both
+        come from one grouped query over (employment_type, location_type).
+        """
+        rows = await self.job_repo.get_facet_counts(job_ids)
+        facets: dict[str, dict[str, int]] = {"employment_type": {}, "location_type": {}}
+        for row_employment_type, row_location_type, count in rows:
+            if row_employment_type and location_type in (None, row_location_type):
+                counts = facets["employment_type"]
+                counts[row_employment_type] = counts.get(row_employment_type, 0) + count
+            if row_location_type and employment_type in (None, row_employment_type):
+                counts = facets["location_type"]
+                counts[row_location_type] = counts.get(row_location_type, 0) + count
+        return facets
+
+    async def _rank_search_results(self, query: str) -> list[uuid.UUID] | None:
+        """Rank visible jobs for a query from the full-text and vector indexes
+
+        Short queries are answered from the full-text index alone when it has
+        matches, saving the embedding call. Otherwise both rankings are fused,
+        and either one alone is used when the other is empty, e.g. because
+        embeddings or Qdrant are unavailable. None means neither index had
+        any results.
+        """
+        lexical_ids = await self.job_repo.search_visible_ids(query, 1000)
+        if lexical_ids and len(query.split()) <= settings.LEXICAL_SEARCH_MAX_TERMS:
+            return lexical_ids
+
+        raw_ids = await self.vector_service.search_jobs(query, limit=1000)
+        if not raw_ids:
+            if lexical_ids:
+                logger.debug(f"Vector search empty, using full-text results: {query}")
+                return lexical_ids
+            return None
+        vector_ids = await self.job_repo.get_visible_ids_ranked(raw_ids)
+        return self._fuse_rankings(vector_ids, lexical_ids)
+
+    @staticmethod
+    def _fuse_rankings(*rankings: list[uuid.UUID]) -> list[uuid.UUID]:
+        """Reciprocal rank fusion of several ranked ID lists"""
+        scores: dict[uuid.UUID, float] = {}
+        for ranking in rankings:
+            for rank, job_id in enumerate(ranking, start=1):
+                scores[job_id] = scores.get(job_id, 0.0) + 1 / (
+                    settings.SEARCH_RRF_K + rank
+                )
+        return sorted(scores, key=scores.__getitem__, reverse=True)
+
+    @staticmethod
+    def _search_key(
+        query: str, employment_type: str | None, location_type: str | None
+    ) -> str:
+        payload = json.dumps([" ".join(query.split()), employment_type, location_type])
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    async def _get_ranked_page(
+        self, ranked_ids: list[uuid.UUID], key: str, offset: int, limit: int
+    ) -> dict:
+        jobs = await self.job_repo.get_visible_listing_by_ids(
+            ranked_ids[offset : offset + limit]
+        )
+        total = len(ranked_ids)
+        next_offset = offset + limit
+        next_cursor = encode_cursor([key, next_offset]) if next_offset < total else None
+        return {
+            "jobs": jobs,
+            "total": total,
+            "page": offset // limit + 1 if limit > 0 else 1,
+            "limit": limit,
+            "total_pages": math.ceil(total / limit) if limit > 0 else 0,
+            "has_next": next_cursor is not None,
+            "has_prev": offset > 0,
+            "next_cursor": next_cursor,
+        }
 
     async def create_job(
         self, job_data, user_id: uuid.UUID, organization_id: uuid.UUID
@@ -128,14 +301,18 @@ class JobService:
             application_deadline,
         )
         await self.job_repo.create(job_posting)
+        listing_count_cache.clear()
 
         # Index job in vector service if active
         if job_status == "active":
+            run_after_commit(
+                self.job_repo.db, partial(title_suggestions.add, job_posting.title)
+            )
             job_with_relations = await self.job_repo.get_with_details(job_id)
-            if job_with_relations:
-                await self.vector_service.index_job(
-                    job_with_relations, self.job_repo.db
-                )
+            if job_with_relations and await self.vector_service.index_job(
+                job_with_relations, self.job_repo.db
+            ):
+                await self._add_to_recommendations(job_id)
 
         # Get final job with relations and user info
         job_posting_with_relations = await self.job_repo.get_with_details(job_id)
@@ -161,6 +338,8 @@ class JobService:
 
         # Expire all jobs past their deadline
         await self.job_repo.expire_jobs()
+        listing_count_cache.clear()
+        await self.recommendation_service.prune_invisible()
 
         return jobs_to_auto_shortlist
 
@@ -171,20 +350,47 @@ class JobService:
         status: str | None = None,
         page: int = 1,
         limit: int = 10,
+        cursor: str | None = None,
     ):
-        """Get jobs with pagination and filters"""
-        return await self.job_repo.get_jobs_paginated(
+        """Get jobs with pagination and filters
+
+        Raises:
+            ValueError: If the pagination cursor is malformed
+        """
+        count_key = ("jobs", user_id, organization_id, status)
+        result = await self.job_repo.get_jobs_paginated(
             user_id=user_id,
             organization_id=organization_id,
             status=status,
             page=page,
             limit=limit,
+            after=self._decode_listing_cursor(cursor),
+            total=listing_count_cache.get(count_key),
         )
+        listing_count_cache.set(count_key, result["total"])
+        return result
 
     async def get_job_by_id(self, job_id: uuid.UUID):
         """Get job by ID with details"""
         return await self.job_repo.get_with_details(job_id)
 
+    async def get_similar_jobs(self, job_id: uuid.UUID, limit: int = 6) -> dict:
+        """Get visible jobs similar to a job, from its stored vector
+
+        The ranked pool is cached per job, so a repeated view costs a single
+        primary-key fetch and a first view one vector lookup.
+        """
+        similar_ids = similar_jobs_cache.get(job_id)
+        if similar_ids is None:
+            hits = await self.vector_service.similar_jobs(
+                job_id, settings.SIMILAR_JOBS_POOL_SIZE
+            )
+            similar_ids = [similar_id for similar_id, _ in hits]
+            if similar_ids:
+                similar_jobs_cache.set(job_id, similar_ids)
+        jobs = await self.job_repo.get_visible_listing_by_ids(similar_ids)
+        return {"job_id": job_id, "jobs": jobs[:limit]}
+
     async def expire_job(self, job_id: uuid.UUID, user_id: uuid.UUID):
         """Expire a job if user has permission"""
         user = await self.user_repo.get(user_id)
@@ -200,7 +406,13 @@ class JobService:
         except ValueError:
             return None
 
+        if job_posting.status == "active":
+            run_after_commit(
+                self.job_repo.db, partial(title_suggestions.remove, job_posting.title)
+            )
         await self.job_repo.expire_job(job_id)
+        listing_count_cache.clear()
+        await self.recommendation_service.remove_jobs([job_id])
         return await self.job_repo.get_with_details(job_id)
 
     async def delete_job(self, job_id: uuid.UUID, user_id: uuid.UUID):
@@ -221,26 +433,42 @@ class JobService:
 
         # If the repo raises ValueError, it bubbles up to the API
         await self.job_repo.delete_job_cascade(job_id)
+        listing_count_cache.clear()
+        if job_posting.status == "active":
+            run_after_commit(
+                self.job_repo.db, partial(title_suggestions.remove, job_posting.title)
+            )
         return job_posting
 
     async def update_job(self, job_posting: JobPosting, job_data):
         """Update job posting and description"""
+        previous_title, was_active = job_posting.title, job_posting.status == "active"
         updated_job = await self.job_repo.update_job_and_description(
             job_posting, job_data
         )
-
-        # Index job if it becomes active and wasn't indexed before
-        if job_data.status == "active" and (not job_posting.is_indexed):
-            job_with_relations = await self.job_repo.get_with_details(
-                job_posting.job_id
+        listing_count_cache.clear()
+        if was_active:
+            run_after_commit(
+                self.job_repo.db, partial(title_suggestions.remove, previous_title)
             )
-            if job_with_relations:
-                await self.vector_service.index_job(
-                    job_with_relations, self.job_repo.db
-                )
+        if updated_job.status == "active":
+            run_after_commit(
+                self.job_repo.db, partial(title_suggestions.add, updated_job.title)
+            )
+
+        # Qdrant is synced from the outbox; drop stale recommendations right away
+        if updated_job.status != "active":
+            await self.recommendation_service.remove_jobs([updated_job.job_id])
 
         return await self.job_repo.get_with_details(updated_job.job_id)
 
+    async def _add_to_recommendations(self, job_id: uuid.UUID) -> None:
+        """Merge a freshly indexed job into materialized recommendations"""
+        try:
+            await self.recommendation_service.add_job(job_id)
+        except Exception as e:
+            logger.warning(f"Failed to add job {job_id} to recommendations: {e}")
+
     def _build_job_posting(
         self,
         job_id: uuid.UUID,
@@ -18,49 +18,20 @@ class RecruiterCandidateService:
     async def get_organization_candidates(
         self, organization_id: uuid.UUID, skip: int = 0, limit: int = 100
     ) -> RecruiterCandidateListResponse:
-
-        applications = await self.application_repo.get_by_organization(
+        rows = await self.application_repo.get_candidate_summaries(
             organization_id=organization_id, skip=skip, limit=limit
         )
-        total = await self.application_repo.count_by_organization(organization_id)
-
-        candidate_summaries = []
-        for app in applications:
-            candidate_profile = app.candidate_profile
-            user = candidate_profile.user
-
-            social_links = []
-            for link in candidate_profile.social_links:
-                social_links.append(
-                    {
-                        "social_link_id": link.social_link_id,
-                        "type": link.type,
-                        "url": link.url,
-                    }
-                )
-
-            candidate_summaries.append(
-                CandidateApplicationSummary(
-                    application_id=app.application_id,
-                    job_id=app.job_id,
-                    job_title=app.job.title,
-                    candidate_id=app.candidate_profile_id,
-                    name=user.name,
-                    email=user.email,
-                    phone=candidate_profile.phone,
-                    picture=user.picture,
-                    professional_headline=candidate_profile.professional_headline,
-                    professional_summary=candidate_profile.professional_summary,
-                    current_status=app.current_status,
-                    applied_at=app.applied_at,
-                    score=app.score,
-                    feedback=app.feedback,
-                    social_links=social_links,
-                )
-            )
-
+        # Past the last page there is no row to carry the total
+        total = (
+            rows[0].total
+            if rows
+            else await self.application_repo.count_by_organization(organization_id)
+        )
         return RecruiterCandidateListResponse(
-            candidates=candidate_summaries, total=total
+            candidates=[
+                CandidateApplicationSummary.model_validate(row) for row in rows
+            ],
+            total=total,
         )
 
     async def get_application_resume(
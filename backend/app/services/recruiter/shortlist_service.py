@@ -3,7 +3,7 @@ from typing import Any
 
 from app.agents.shortlisting.main import app as shortlist_agent
 from app.agents.shortlisting.workflow_logger import WorkflowLogger
-from app.core import get_datetime
+from app.core import get_datetime, settings
 from app.core.logging_config import logger
 from app.db.models.application import ApplicationStatus, JobApplication
 from app.db.models.job import ShortlistStatus
@@ -91,16 +91,23 @@ class ShortlistService:
 
             # Process candidates one at a time to avoid LLM rate limiting
             successful = 0
-            failed = 0
+            scored = []
             for i, app in enumerate(applications, 1):
                 logger.info(
                     f"Processing application {i}/{len(applications)}: {app.application_id}"
                 )
                 result = await self._shortlist_candidate(app, jd_text)
-                if isinstance(result, int):
-                    successful += 1
-                else:
-                    failed += 1
+                if result:
+                    scored.append(result)
+                # Scores are written in batched UPDATEs as the run goes, so an
+                # error late in a long run keeps the scores already computed
+                if len(scored) >= settings.SHORTLIST_WRITE_BATCH_SIZE:
+                    await self.application_repo.bulk_update(scored)
+                    successful += len(scored)
+                    scored = []
+            await self.application_repo.bulk_update(scored)
+            successful += len(scored)
+            failed = len(applications) - successful
 
             logger.info(
                 f"AI shortlisting completed for {successful} applications, {failed} applications failed"
@@ -130,8 +137,8 @@ class ShortlistService:
 
     async def _shortlist_candidate(
         self, application: JobApplication, jd_text: str
-    ) -> int | None:
-        """Shortlist a single candidate"""
+    ) -> dict[str, Any] | None:
+        """Score a single candidate, returning the application update to apply"""
         workflow_log = WorkflowLogger(application.job_id, application.application_id)
 
         try:
@@ -180,18 +187,15 @@ class ShortlistService:
 
             workflow_log.log_result(score, reason)
 
-            # Update application with score and feedback
-            await self.application_repo.update(
-                application.application_id,
-                score=score,
-                feedback=reason,
-                updated_at=get_datetime(),
-            )
-
             logger.info(
                 f"Candidate {application.application_id} shortlisted with score {score}/100. Log: {workflow_log.get_log_path()}"
             )
-            return score
+            return {
+                "application_id": application.application_id,
+                "score": score,
+                "feedback": reason,
+                "updated_at": get_datetime(),
+            }
 
         except Exception as e:
             workflow_log.log_error(str(e))
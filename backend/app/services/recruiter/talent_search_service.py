@@ -0,0 +1,72 @@
+import uuid
+
+from app.db.repositories.candidate_repo import CandidateProfileRepository
+from app.db.repositories.job_repo import JobRepository
+from app.integrations.qdrant.candidate_vector_service import CandidateVectorService
+from app.integrations.qdrant.vector_service import JobVectorService
+from app.schemas.recruiter_candidate import TalentSearchResponse, TalentSearchResult
+
+
+class TalentSearchService:
+    def __init__(
+        self,
+        job_repo: JobRepository,
+        candidate_profile_repo: CandidateProfileRepository,
+        job_vector_service: JobVectorService,
+        candidate_vector_service: CandidateVectorService,
+    ):
+        self.job_repo = job_repo
+        self.candidate_profile_repo = candidate_profile_repo
+        self.job_vector_service = job_vector_service
+        self.candidate_vector_service = candidate_vector_service
+
+    async def search_candidates_for_job(
+        self, job_id: uuid.UUID, organization_id: uuid.UUID, limit: int = 20
+    ) -> TalentSearchResponse:
+        """Rank the candidate pool against a job's stored embedding
+
+        Uses the vector already indexed for the job, so no embedding call is
+        made per search.
+
+        Raises:
+            ValueError: If the job is missing, belongs to another organization
+                or has not been indexed yet, or the candidate index cannot be
+                reached
+        """
+        job = await self.job_repo.get(job_id)
+        if not job:
+            raise ValueError("Job not found")
+        if job.organization_id != organization_id:
+            raise ValueError("Access denied: Job belongs to another organization.")
+
+        vector = await self.job_vector_service.get_job_vector(job_id)
+        if not vector:
+            raise ValueError("Job is not indexed yet")
+
+        hits = await self.candidate_vector_service.search_by_vector(
+            vector, max(1, min(limit, 100))
+        )
+        if hits is None:
+            raise ValueError("Talent search is unavailable right now")
+        profiles = await self.candidate_profile_repo.get_many_with_user(
+            [profile_id for profile_id, _ in hits]
+        )
+        candidates = [
+            TalentSearchResult(
+                candidate_id=profile.profile_id,
+                name=profile.full_name,
+                email=profile.email,
+                picture=profile.picture,
+                professional_headline=profile.professional_headline,
+                professional_summary=profile.professional_summary,
+                location_city=profile.location_city,
+                location_country=profile.location_country,
+                skills=[skill.skill_name for skill in profile.skills],
+                score=score,
+            )
+            for profile_id, score in hits
+            if (profile := profiles.get(profile_id)) and profile.user
+        ]
+        return TalentSearchResponse(
+            job_id=job_id, candidates=candidates, total=len(candidates)
+        )
@@ -0,0 +1,35 @@
+from app.core.logging_config import logger
+from app.core.prefix_index import PrefixIndex
+from app.db.repositories.candidate_repo import CandidateSkillsRepository
+from app.db.repositories.job_repo import JobRepository
+
+# Process-wide type-ahead indexes, rebuilt on startup and on a schedule and
+# kept current in between by the job write paths
+title_suggestions = PrefixIndex()
+skill_suggestions = PrefixIndex()
+
+
+class SuggestionService:
+    def __init__(
+        self,
+        job_repo: JobRepository,
+        candidate_skills_repo: CandidateSkillsRepository,
+    ):
+        self.job_repo = job_repo
+        self.candidate_skills_repo = candidate_skills_repo
+
+    async def rebuild(self) -> None:
+        """Reload both indexes from active job titles and skill frequencies"""
+        title_suggestions.replace(await self.job_repo.get_visible_title_counts())
+        skill_suggestions.replace(await self.candidate_skills_repo.get_skill_counts())
+        logger.debug(
+            f"Rebuilt suggestions: {len(title_suggestions)} titles, "
+            f"{len(skill_suggestions)} skills"
+        )
+
+    def suggest(self, prefix: str, limit: int = 8) -> dict:
+        """Suggest job titles and skills for a partial query, from memory only"""
+        return {
+            "titles": title_suggestions.search(prefix, limit),
+            "skills": skill_suggestions.search(prefix, limit),
+        }
@@ -1,17 +1,33 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import settings
 from app.core.logging_config import logger
 from app.db.repositories.application_repo import JobApplicationRepository
-from app.db.repositories.candidate_repo import CandidateProfileRepository
-from app.db.repositories.job_repo import JobDescriptionRepository, JobRepository
+from app.db.repositories.candidate_repo import (
+    CandidateProfileRepository,
+    CandidateSkillsRepository,
+)
+from app.db.repositories.job_repo import (
+    JobDescriptionRepository,
+    JobIndexOutboxRepository,
+    JobRepository,
+)
+from app.db.repositories.recommendation_repo import JobRecommendationRepository
 from app.db.repositories.user_repo import UserRepository
 from app.db.session import AsyncSessionLocal
-from app.integrations.qdrant.vector_service import JobVectorService
+from app.integrations.qdrant.candidate_vector_service import (
+    get_candidate_vector_service,
+)
+from app.integrations.qdrant.vector_service import get_job_vector_service
+from app.services.candidate.profile_service import stale_search_profiles
+from app.services.candidate.recommendation_service import RecommendationService
+from app.services.job_index_sync_service import JobIndexSyncService
 from app.services.job_service import JobService
 from app.services.recruiter.activity_events import ActivityEventEmitter
 from app.services.recruiter.shortlist_service import ShortlistService
+from app.services.suggestion_service import SuggestionService
 
 scheduler = AsyncIOScheduler(timezone=settings.TIMEZONE)
 
@@ -23,8 +39,14 @@ async def expire_jobs_task():
             job_description_repo = JobDescriptionRepository(db)
             candidate_profile_repo = CandidateProfileRepository(db)
             user_repo = UserRepository(db)
-            vector_service = JobVectorService()
+            vector_service = get_job_vector_service()
             activity_emitter = ActivityEventEmitter()
+            recommendation_service = RecommendationService(
+                JobRecommendationRepository(db),
+                candidate_profile_repo,
+                job_repo,
+                vector_service,
+            )
 
             job_service = JobService(
                 job_repo,
@@ -33,6 +55,7 @@ async def expire_jobs_task():
                 user_repo,
                 vector_service,
                 activity_emitter,
+                recommendation_service,
             )
 
             job_ids_to_process = await job_service.auto_expire_jobs()
@@ -64,6 +87,113 @@ async def expire_jobs_task():
             logger.error(f"Cron Job Error: {e}")
 
 
+async def refresh_recommendations_task():
+    async with AsyncSessionLocal() as db:
+        recommendation_service = RecommendationService(
+            JobRecommendationRepository(db),
+            CandidateProfileRepository(db),
+            JobRepository(db),
+            get_job_vector_service(),
+        )
+        after_profile_id = None
+        refreshed = 0
+        while True:
+            try:
+                (
+                    after_profile_id,
+                    count,
+                ) = await recommendation_service.refresh_batch(after_profile_id)
+                await db.commit()  # Commit after each batch of profiles
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Cron: Recommendation refresh failed: {e}")
+                return
+            if after_profile_id is None:
+                break
+            refreshed += count
+        logger.info(f"Cron: Refreshed job recommendations for {refreshed} profiles.")
+
+
+async def index_candidate_profiles_task():
+    async with AsyncSessionLocal() as db:
+        candidate_profile_repo = CandidateProfileRepository(db)
+        candidate_vector_service = get_candidate_vector_service()
+        after_profile_id = None
+        embedded = 0
+        while True:
+            try:
+                profiles = await candidate_profile_repo.get_search_batch(
+                    after_profile_id, limit=settings.INDEXING_BATCH_SIZE
+                )
+                if not profiles:
+                    break
+                after_profile_id = profiles[-1].profile_id
+                embedded += await candidate_vector_service.index_profiles(
+                    list(profiles)
+                )
+            except Exception as e:
+                logger.error(f"Cron: Candidate profile indexing failed: {e}")
+                return
+        logger.info(f"Cron: Re-embedded {embedded} changed candidate profiles.")
+
+
+async def sync_candidate_search_task():
+    """Re-embed the profiles queued by profile writes in this process"""
+    if not stale_search_profiles:
+        return
+    profile_ids = list(stale_search_profiles)
+    stale_search_profiles.difference_update(profile_ids)
+    async with AsyncSessionLocal() as db:
+        try:
+            candidate_profile_repo = CandidateProfileRepository(db)
+            profiles = await candidate_profile_repo.get_many_with_search_details(
+                profile_ids
+            )
+            await get_candidate_vector_service().index_profiles(list(profiles))
+        except Exception as e:
+            # Retried on the next run
+            stale_search_profiles.update(profile_ids)
+            logger.error(f"Cron: Candidate search profile sync failed: {e}")
+
+
+async def rebuild_suggestions_task():
+    async with AsyncSessionLocal() as db:
+        try:
+            await SuggestionService(
+                JobRepository(db), CandidateSkillsRepository(db)
+            ).rebuild()
+        except Exception as e:
+            logger.error(f"Cron: Suggestion index rebuild failed: {e}")
+
+
+async def sync_job_index_task():
+    async with AsyncSessionLocal() as db:
+        job_repo = JobRepository(db)
+        vector_service = get_job_vector_service()
+        sync_service = JobIndexSyncService(
+            JobIndexOutboxRepository(db),
+            job_repo,
+            vector_service,
+            RecommendationService(
+                JobRecommendationRepository(db),
+                CandidateProfileRepository(db),
+                job_repo,
+                vector_service,
+            ),
+        )
+        await sync_service.check_alias_swap()
+        while True:
+            try:
+                claimed = await sync_service.sync_batch()
+                await db.commit()  # Release claimed outbox rows after each batch
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Index sync error: {e}")
+                return
+            if claimed < settings.INDEX_SYNC_BATCH_SIZE:
+                break
+
+
 def start_scheduler():
     scheduler.add_job(
         expire_jobs_task,
@@ -71,6 +201,42 @@ def start_scheduler():
         id="auto_expire_jobs",
         replace_existing=True,
     )
+    scheduler.add_job(
+        refresh_recommendations_task,
+        CronTrigger(hour=1, minute=0),
+        id="refresh_recommendations",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        index_candidate_profiles_task,
+        CronTrigger(hour=2, minute=0),
+        id="index_candidate_profiles",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        rebuild_suggestions_task,
+        IntervalTrigger(minutes=settings.SUGGESTIONS_REBUILD_INTERVAL_MINUTES),
+        id="rebuild_suggestions",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        sync_candidate_search_task,
+        IntervalTrigger(seconds=settings.INDEX_SYNC_INTERVAL_SECONDS),
+        id="sync_candidate_search",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        sync_job_index_task,
+        IntervalTrigger(seconds=settings.INDEX_SYNC_INTERVAL_SECONDS),
+        id="sync_job_index",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
     scheduler.start()
     logger.info("Background Scheduler to auto expire jobs started.")
 
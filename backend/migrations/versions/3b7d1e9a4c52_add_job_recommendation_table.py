@@ -0,0 +1,70 @@
+"""add job recommendation table
+
+Revision ID: 3b7d1e9a4c52
+Revises: 902682dbc72c
+Create Date: 2026-10-19 10:12:44.201733
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7d1e9a4c52"
+down_revision: str | Sequence[str] | None = "902682dbc72c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_recommendation",
+        sa.Column("profile_id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.Uuid(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["job_id"],
+            ["job_posting.job_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["profile_id"],
+            ["candidate_profile.profile_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("profile_id", "job_id"),
+    )
+    op.create_table(
+        "job_recommendation_refresh",
+        sa.Column("profile_id", sa.Uuid(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["profile_id"],
+            ["candidate_profile.profile_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("profile_id"),
+    )
+    op.create_index(
+        op.f("ix_job_recommendation_job_id"),
+        "job_recommendation",
+        ["job_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_job_recommendation_profile_rank",
+        "job_recommendation",
+        ["profile_id", "score", "job_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_job_recommendation_profile_rank", table_name="job_recommendation")
+    op.drop_index(op.f("ix_job_recommendation_job_id"), table_name="job_recommendation")
+    op.drop_table("job_recommendation_refresh")
+    op.drop_table("job_recommendation")
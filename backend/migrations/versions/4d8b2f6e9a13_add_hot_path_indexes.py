@@ -0,0 +1,116 @@
+"""add hot path indexes
+
+Revision ID: 4d8b2f6e9a13
+Revises: e3a9d47f1b26
+Create Date: 2026-10-19 18:41:06.215377
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d8b2f6e9a13"
+down_revision: str | Sequence[str] | None = "e3a9d47f1b26"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+INDEXES = (
+    (
+        "ix_job_application_job_applied",
+        "job_application",
+        ["job_id", "applied_at"],
+        None,
+    ),
+    (
+        "ix_job_application_organization_applied",
+        "job_application",
+        ["organization_id", "applied_at"],
+        None,
+    ),
+    (
+        "ix_job_application_candidate_applied",
+        "job_application",
+        ["candidate_profile_id", "applied_at"],
+        None,
+    ),
+    (
+        "ix_job_application_status_history_application_changed",
+        "job_application_status_history",
+        ["application_id", "changed_at"],
+        None,
+    ),
+    (
+        "ix_job_posting_organization_posted",
+        "job_posting",
+        ["organization_id", "posted_date", "job_id"],
+        None,
+    ),
+    (
+        "ix_job_posting_active_posted",
+        "job_posting",
+        ["posted_date", "job_id"],
+        "status = 'active'",
+    ),
+    (
+        "ix_job_posting_active_deadline",
+        "job_posting",
+        ["application_deadline"],
+        "status = 'active'",
+    ),
+)
+
+
+def _is_invalid(index_name: str) -> bool:
+    """Whether an index exists but was left INVALID by a failed concurrent build"""
+    return bool(
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT NOT indisvalid FROM pg_index "
+                "WHERE indexrelid = to_regclass(:name)"
+            ),
+            {"name": index_name},
+        )
+        .scalar()
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. A failed
+    # or cancelled build leaves an INVALID index behind that IF NOT EXISTS
+    # would keep, so such an index is dropped first and then rebuilt
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, where in INDEXES:
+            if _is_invalid(index_name):
+                op.drop_index(
+                    index_name,
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _, _ in reversed(INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
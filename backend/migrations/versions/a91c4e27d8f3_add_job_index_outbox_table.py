@@ -0,0 +1,51 @@
+"""add job index outbox table
+
+Revision ID: a91c4e27d8f3
+Revises: 3b7d1e9a4c52
+Create Date: 2026-10-19 11:03:18.554120
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a91c4e27d8f3"
+down_revision: str | Sequence[str] | None = "3b7d1e9a4c52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_index_outbox",
+        sa.Column("event_id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.Uuid(), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("event_id"),
+    )
+    op.create_index(
+        op.f("ix_job_index_outbox_created_at"),
+        "job_index_outbox",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_job_index_outbox_job_id"),
+        "job_index_outbox",
+        ["job_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_job_index_outbox_job_id"), table_name="job_index_outbox")
+    op.drop_index(op.f("ix_job_index_outbox_created_at"), table_name="job_index_outbox")
+    op.drop_table("job_index_outbox")
@@ -0,0 +1,31 @@
+"""add job embedded text hash
+
+Revision ID: c5f28e0b7a14
+Revises: a91c4e27d8f3
+Create Date: 2026-10-19 14:22:47.318905
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5f28e0b7a14"
+down_revision: str | Sequence[str] | None = "a91c4e27d8f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "job_posting",
+        sa.Column("embedded_text_hash", sa.String(length=64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("job_posting", "embedded_text_hash")
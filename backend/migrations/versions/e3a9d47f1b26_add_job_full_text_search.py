@@ -0,0 +1,81 @@
+"""add job full text search
+
+Revision ID: e3a9d47f1b26
+Revises: c5f28e0b7a14
+Create Date: 2026-10-19 16:05:12.731842
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a9d47f1b26"
+down_revision: str | Sequence[str] | None = "c5f28e0b7a14"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JOB_DESCRIPTION_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(job_summary, '')), 'B') || "
+    "setweight(to_tsvector('english', job_text_array(job_responsibilities) || ' ' "
+    "|| job_text_array(required_qualifications)), 'C') || "
+    "setweight(to_tsvector('english', job_text_array(preferred) || ' ' "
+    "|| job_text_array(compensation_and_benefits)), 'D')"
+)
+JOB_POSTING_SEARCH_VECTOR = "setweight(to_tsvector('english', title), 'A')"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # array_to_string is only STABLE, which generated columns reject
+    op.execute(
+        """
+        CREATE FUNCTION job_text_array(text[]) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE
+        AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+        """
+    )
+    op.add_column(
+        "job_description",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(JOB_DESCRIPTION_SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "job_posting",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(JOB_POSTING_SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_job_description_search_vector",
+        "job_description",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_job_posting_search_vector",
+        "job_posting",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_job_posting_search_vector", table_name="job_posting")
+    op.drop_index("ix_job_description_search_vector", table_name="job_description")
+    op.drop_column("job_posting", "search_vector")
+    op.drop_column("job_description", "search_vector")
+    op.execute("DROP FUNCTION job_text_array(text[])")
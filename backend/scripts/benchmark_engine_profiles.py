@@ -0,0 +1,115 @@
+"""Benchmark the main job listing queries under each database engine profile
+
+Runs the public listing, the recruiter listing and the ranked-ID fetch used by
+search through the repositories, with a fresh engine per profile, and reports
+throughput and latency percentiles. Only reads are issued.
+
+Usage (from backend/):
+    uv run python -m scripts.benchmark_engine_profiles --iterations 200 --concurrency 8
+    uv run python -m scripts.benchmark_engine_profiles --profiles direct pgbouncer
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.models.job import JobPosting
+from app.db.repositories.job_repo import JobRepository, visible_job_conditions
+from app.db.session import ENGINE_PROFILES, create_engine_for_profile, prewarm_pool
+
+
+async def load_sample(sessions: async_sessionmaker) -> tuple:
+    async with sessions() as db:
+        organization_id = (
+            await db.execute(select(JobPosting.organization_id).limit(1))
+        ).scalar_one_or_none()
+        job_ids = list(
+            (
+                await db.execute(
+                    select(JobPosting.job_id)
+                    .where(*visible_job_conditions())
+                    .limit(100)
+                )
+            ).scalars()
+        )
+    return organization_id, job_ids
+
+
+def build_queries(organization_id, job_ids) -> dict:
+    return {
+        "visible listing": lambda repo: repo.get_visible_jobs_paginated(limit=20),
+        "recruiter listing": lambda repo: repo.get_jobs_paginated(
+            organization_id=organization_id, limit=20
+        ),
+        "ranked fetch": lambda repo: repo.get_visible_by_ids(job_ids[:20]),
+    }
+
+
+async def run_query(sessions, query, iterations: int, concurrency: int) -> list:
+    latencies: list[float] = []
+    remaining = iterations
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            async with sessions() as db:
+                started = time.perf_counter()
+                await query(JobRepository(db))
+                latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def benchmark_profile(profile: str, args: argparse.Namespace) -> None:
+    engine = create_engine_for_profile(profile)
+    sessions = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+    try:
+        await prewarm_pool(engine, args.concurrency)
+        organization_id, job_ids = await load_sample(sessions)
+        if organization_id is None:
+            print("No jobs in the database; nothing to benchmark")
+            return
+        for name, query in build_queries(organization_id, job_ids).items():
+            # Warm-up pass so statement caches are populated where enabled
+            await run_query(sessions, query, args.concurrency, args.concurrency)
+            started = time.perf_counter()
+            latencies = await run_query(
+                sessions, query, args.iterations, args.concurrency
+            )
+            elapsed = time.perf_counter() - started
+            latencies.sort()
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(
+                f"{profile:<22} {name:<18} {len(latencies) / elapsed:8.1f} q/s  "
+                f"p50 {statistics.median(latencies) * 1000:7.2f} ms  "
+                f"p95 {p95 * 1000:7.2f} ms"
+            )
+    finally:
+        await engine.dispose()
+
+
+async def main(args: argparse.Namespace):
+    for profile in args.profiles:
+        await benchmark_profile(profile, args)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--profiles", nargs="+", choices=ENGINE_PROFILES, default=ENGINE_PROFILES
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,113 @@
+"""Benchmark the ORM and Core read paths for job listing pages
+
+Fetches the same visible job pages through the ORM listing methods and their
+Core counterparts that map rows into slotted dataclasses, then validates each
+page into the response schema as the endpoints do. Reports rows per second
+for the fetch alone and for fetch plus validation. Only reads are issued.
+
+Usage (from backend/):
+    uv run python -m scripts.benchmark_job_listing_reads --iterations 200 --limit 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.models.job import JobPosting
+from app.db.repositories.job_repo import JobRepository, visible_job_conditions
+from app.db.session import engine
+from app.schemas.job import JobListResponse, SimilarJobsResponse
+
+
+async def load_job_ids(sessions: async_sessionmaker, limit: int) -> list:
+    async with sessions() as db:
+        result = await db.execute(
+            select(JobPosting.job_id).where(*visible_job_conditions()).limit(limit)
+        )
+        return list(result.scalars())
+
+
+def build_paths(job_ids: list, limit: int) -> dict:
+    """(fetch, validate) pairs per read path, keyed by (listing, path)"""
+
+    def listing_page(page: dict):
+        return JobListResponse.model_validate(page)
+
+    def ranked_jobs(jobs: list):
+        return SimilarJobsResponse.model_validate({"job_id": job_ids[0], "jobs": jobs})
+
+    return {
+        ("date listing", "orm"): (
+            lambda repo: repo.get_visible_jobs_paginated(limit=limit, total=0),
+            listing_page,
+        ),
+        ("date listing", "core"): (
+            lambda repo: repo.get_visible_listing_paginated(limit=limit, total=0),
+            listing_page,
+        ),
+        ("ranked fetch", "orm"): (
+            lambda repo: repo.get_visible_by_ids(job_ids),
+            ranked_jobs,
+        ),
+        ("ranked fetch", "core"): (
+            lambda repo: repo.get_visible_listing_by_ids(job_ids),
+            ranked_jobs,
+        ),
+    }
+
+
+def count_rows(result) -> int:
+    return len(result["jobs"] if isinstance(result, dict) else result)
+
+
+async def run_path(sessions, fetch, validate, iterations: int) -> tuple:
+    """Total rows, fetch seconds and validation seconds over all iterations"""
+    rows = 0
+    fetch_time = validate_time = 0.0
+    for _ in range(iterations):
+        async with sessions() as db:
+            started = time.perf_counter()
+            result = await fetch(JobRepository(db))
+            fetched = time.perf_counter()
+            validate(result)
+            validate_time += time.perf_counter() - fetched
+            fetch_time += fetched - started
+            rows += count_rows(result)
+    return rows, fetch_time, validate_time
+
+
+async def main(args: argparse.Namespace):
+    sessions = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+    try:
+        job_ids = await load_job_ids(sessions, args.limit)
+        if not job_ids:
+            print("No visible jobs in the database; nothing to benchmark")
+            return
+        for (name, path), (fetch, validate) in build_paths(job_ids, args.limit).items():
+            # Warm-up pass so statement caches and pools are populated
+            await run_path(sessions, fetch, validate, 5)
+            rows, fetch_time, validate_time = await run_path(
+                sessions, fetch, validate, args.iterations
+            )
+            print(
+                f"{name:<14} {path:<5} {rows / fetch_time:10.0f} rows/s fetch  "
+                f"{rows / (fetch_time + validate_time):10.0f} rows/s with validation"
+            )
+    finally:
+        await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,180 @@
+"""Benchmark Qdrant storage configurations for the jobs collection
+
+Copies the vectors of the live jobs collection into temporary collections, one
+per (quantization, dimension, on-disk) combination, and reports recall@k
+against exact full-precision search together with estimated vector RAM and
+query latency.
+
+Usage (from backend/):
+    uv run python -m scripts.benchmark_vector_storage --k 10 --queries 100
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import (
+    CollectionStatus,
+    PointStruct,
+    QuantizationSearchParams,
+    SearchParams,
+)
+
+from app.core import settings
+from app.integrations.qdrant.storage import (
+    QUANTIZATION_MODES,
+    build_quantization_config,
+    build_search_params,
+    build_vector_params,
+    estimate_ram_bytes,
+    truncate_vector,
+)
+
+UPSERT_BATCH_SIZE = 256
+
+
+def load_points(client: QdrantClient, collection: str, limit: int) -> list:
+    points = []
+    offset = None
+    while len(points) < limit:
+        batch, offset = client.scroll(
+            collection_name=collection,
+            limit=min(256, limit - len(points)),
+            offset=offset,
+            with_vectors=True,
+            with_payload=False,
+        )
+        points.extend(p for p in batch if p.vector)
+        if offset is None:
+            break
+    return points
+
+
+def vector_of(point) -> list[float]:
+    vector = point.vector
+    return vector.get("") if isinstance(vector, dict) else vector
+
+
+def top_ids(client, collection, query, k, exclude, search_params=None) -> list:
+    response = client.query_points(
+        collection_name=collection,
+        query=query,
+        limit=k + 1,
+        search_params=search_params,
+        with_payload=False,
+    )
+    return [p.id for p in response.points if p.id != exclude][:k]
+
+
+def wait_until_green(client: QdrantClient, collection: str, timeout: float = 600):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.get_collection(collection).status == CollectionStatus.GREEN:
+            return
+        time.sleep(1)
+    raise TimeoutError(f"Collection {collection} did not finish optimizing")
+
+
+def run_config(client, points, queries, truth, args, mode, dim, on_disk) -> dict:
+    name = f"{args.collection}_bench_{mode}_{dim}{'_disk' if on_disk else ''}"
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        collection_name=name,
+        vectors_config=build_vector_params(dim=dim, on_disk=on_disk),
+        quantization_config=build_quantization_config(mode),
+    )
+    try:
+        for i in range(0, len(points), UPSERT_BATCH_SIZE):
+            client.upsert(
+                collection_name=name,
+                points=[
+                    PointStruct(id=p.id, vector=truncate_vector(vector_of(p), dim))
+                    for p in points[i : i + UPSERT_BATCH_SIZE]
+                ],
+            )
+        wait_until_green(client, name)
+
+        search_params = build_search_params(
+            mode, oversampling=args.oversampling, rescore=not args.no_rescore
+        )
+        latencies = []
+        recalls = []
+        for point in queries:
+            query = truncate_vector(vector_of(point), dim)
+            started = time.perf_counter()
+            found = top_ids(client, name, query, args.k, point.id, search_params)
+            latencies.append((time.perf_counter() - started) * 1000)
+            expected = truth[point.id]
+            if expected:
+                recalls.append(len(set(found) & set(expected)) / len(expected))
+    finally:
+        if not args.keep:
+            client.delete_collection(name)
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "dim": dim,
+        "on_disk": on_disk,
+        "recall": statistics.mean(recalls) if recalls else 0.0,
+        "ram_mb": estimate_ram_bytes(len(points), dim, mode, on_disk) / 2**20,
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--collection", default=settings.QDRANT_COLLECTION_NAME)
+    parser.add_argument("--limit", type=int, default=20000, help="points to copy")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--modes", default=",".join(QUANTIZATION_MODES))
+    parser.add_argument("--dims", default="3072,1536,768")
+    parser.add_argument("--on-disk", action="store_true", help="also test on-disk")
+    parser.add_argument("--oversampling", type=float, default=None)
+    parser.add_argument("--no-rescore", action="store_true")
+    parser.add_argument("--keep", action="store_true", help="keep bench collections")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    client = QdrantClient(url=settings.QDRANT_URL)
+    points = load_points(client, args.collection, args.limit)
+    if not points:
+        raise SystemExit(f"No vectors found in {args.collection}")
+    full_dim = len(vector_of(points[0]))
+    dims = [d for d in map(int, args.dims.split(",")) if d <= full_dim]
+    queries = random.Random(args.seed).sample(points, min(args.queries, len(points)))
+
+    # Ground truth: exact full-precision search on the source collection
+    exact = SearchParams(exact=True, quantization=QuantizationSearchParams(ignore=True))
+    truth = {
+        p.id: top_ids(client, args.collection, vector_of(p), args.k, p.id, exact)
+        for p in queries
+    }
+
+    print(
+        f"{len(points)} points, {len(queries)} queries, k={args.k}, "
+        f"source dim={full_dim}"
+    )
+    header = f"{'mode':<8}{'dim':>6}{'on_disk':>9}{'recall@k':>10}{'ram_mb':>10}{'p50_ms':>9}{'p95_ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for mode in args.modes.split(","):
+        for dim in dims:
+            for on_disk in (False, True) if args.on_disk else (False,):
+                row = run_config(
+                    client, points, queries, truth, args, mode, dim, on_disk
+                )
+                print(
+                    f"{row['mode']:<8}{row['dim']:>6}{row['on_disk']!s:>9}"
+                    f"{row['recall']:>10.3f}{row['ram_mb']:>10.1f}"
+                    f"{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Rebuild the jobs vector collection and swap it in without downtime
+
+`QDRANT_COLLECTION_NAME` is an alias over versioned collections. Run `build`
+with the new EMBEDDING_MODEL / EMBEDDING_DIM settings while the app keeps
+serving from the current collection, then `swap` the alias when the app is
+rolled out with the same settings. `run` does both in one go.
+
+Usage (from backend/):
+    uv run python -m scripts.reindex_jobs build [--throttle 0.5]
+    uv run python -m scripts.reindex_jobs swap jobs_20260101120000 [--keep-previous]
+    uv run python -m scripts.reindex_jobs run
+    uv run python -m scripts.reindex_jobs list
+"""
+
+import argparse
+import asyncio
+
+from app.db.repositories.job_repo import JobRepository
+from app.db.session import AsyncSessionLocal
+from app.integrations.qdrant.vector_service import get_job_vector_service
+from app.services.job_reindex_service import JobReindexService
+
+
+async def main(args: argparse.Namespace):
+    async with AsyncSessionLocal() as db:
+        service = JobReindexService(JobRepository(db), get_job_vector_service())
+        if args.command == "list":
+            for name, is_live in await service.list_versions():
+                print(f"{name}{'  <- live' if is_live else ''}")
+            return
+
+        target = args.collection if args.command == "swap" else None
+        if args.command in ("build", "run"):
+            target = await service.build(throttle_seconds=args.throttle)
+            print(f"Built {target}")
+        if args.command in ("swap", "run"):
+            previous = await service.swap(
+                target,
+                drop_previous=not args.keep_previous,
+                reset_skill_queries=not args.keep_skill_queries,
+            )
+            await db.commit()
+            print(f"Alias now points at {target} (previous: {previous})")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="build a new versioned collection")
+    swap = commands.add_parser("swap", help="point the alias at a collection")
+    swap.add_argument("collection")
+    run = commands.add_parser("run", help="build and swap")
+    commands.add_parser("list", help="list versioned collections")
+    for command in (build, run):
+        command.add_argument("--throttle", type=float, default=None)
+    for command in (swap, run):
+        command.add_argument("--keep-previous", action="store_true")
+        command.add_argument("--keep-skill-queries", action="store_true")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
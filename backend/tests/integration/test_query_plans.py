@@ -0,0 +1,252 @@
+"""Hot repository queries are planned with their indexes
+
+Seeds a synthetic dataset inside a transaction, runs ANALYZE and EXPLAINs each
+hot-path query. The transaction is always rolled back, so this is safe against
+any database that has the migrations applied.
+"""
+
+import asyncio
+import os
+from datetime import date
+
+import pytest
+
+if not os.environ.get("DATABASE_URL"):
+    pytest.skip("DATABASE_URL is not set", allow_module_level=True)
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import settings
+from app.db.models.application import JobApplication, JobApplicationStatusHistory
+from app.db.models.job import JobPosting
+from app.db.repositories.job_repo import visible_job_conditions
+
+pytestmark = pytest.mark.integration
+
+SEED_PARAMS = {
+    "organizations": 50,
+    "candidates": 2000,
+    "jobs": 2000,
+    "applications_per_candidate": 20,
+}
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO organization
+        (organization_id, email, password, name, created_at, updated_at)
+    SELECT gen_random_uuid(), 'plan-check-org-' || i || '@example.com', 'x',
+           'Org ' || i, now(), now()
+    FROM generate_series(1, :organizations) AS i
+    """,
+    """
+    INSERT INTO "user" (user_id, email, name, created_at, updated_at)
+    SELECT gen_random_uuid(), 'plan-check-user-' || i || '@example.com',
+           'User ' || i, now(), now()
+    FROM generate_series(1, :candidates) AS i
+    """,
+    """
+    INSERT INTO candidate_profile (profile_id, user_id)
+    SELECT gen_random_uuid(), user_id FROM "user"
+    WHERE email LIKE 'plan-check-user-%'
+    """,
+    """
+    INSERT INTO resume (resume_id, profile_id, created_at, updated_at)
+    SELECT gen_random_uuid(), profile_id, now(), now()
+    FROM candidate_profile JOIN "user" USING (user_id)
+    WHERE email LIKE 'plan-check-user-%'
+    """,
+    """
+    WITH orgs AS (
+        SELECT array_agg(organization_id) AS ids FROM organization
+        WHERE email LIKE 'plan-check-org-%'
+    ), descriptions AS (
+        INSERT INTO job_description
+            (job_description_id, job_summary, job_responsibilities,
+             created_at, updated_at)
+        SELECT gen_random_uuid(), 'Summary', ARRAY['Responsibility'], now(), now()
+        FROM generate_series(1, :jobs)
+        RETURNING job_description_id
+    )
+    INSERT INTO job_posting
+        (job_id, organization_id, job_description_id, title, location_type,
+         status, is_indexed, auto_shortlist, shortlist_status, posted_date,
+         application_deadline, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           orgs.ids[1 + (row_number() OVER () % cardinality(orgs.ids))],
+           job_description_id, 'Job', 'Remote',
+           CASE WHEN random() < 0.3 THEN 'expired' ELSE 'active' END,
+           false, false, 'not_started',
+           current_date - (random() * 365)::int,
+           current_date + (random() * 60)::int,
+           now(), now()
+    FROM descriptions, orgs
+    """,
+    """
+    WITH jobs AS (
+        SELECT array_agg(job_id) AS ids, array_agg(organization_id) AS orgs
+        FROM job_posting
+    ), picks AS (
+        SELECT resume.profile_id, resume.resume_id,
+               1 + floor(random() * cardinality(jobs.ids))::int AS k
+        FROM resume
+        JOIN candidate_profile USING (profile_id)
+        JOIN "user" USING (user_id)
+        CROSS JOIN generate_series(1, :applications_per_candidate)
+        CROSS JOIN jobs
+        WHERE "user".email LIKE 'plan-check-user-%'
+    )
+    INSERT INTO job_application
+        (application_id, candidate_profile_id, job_id, organization_id,
+         resume_id, current_status, applied_at, updated_at)
+    SELECT gen_random_uuid(), profile_id, jobs.ids[k], jobs.orgs[k], resume_id,
+           'applied', now() - random() * interval '365 days', now()
+    FROM picks, jobs
+    """,
+    """
+    INSERT INTO job_application_status_history
+        (status_history_id, application_id, status, changed_at)
+    SELECT gen_random_uuid(), application_id, status,
+           applied_at + random() * interval '7 days'
+    FROM job_application, unnest(ARRAY['applied', 'shortlisted']) AS status
+    """,
+]
+
+ANALYZED_TABLES = [
+    "organization",
+    '"user"',
+    "candidate_profile",
+    "resume",
+    "job_description",
+    "job_posting",
+    "job_application",
+    "job_application_status_history",
+]
+
+# name -> (expected index, statement built from a sampled application row)
+HOT_QUERIES = {
+    "applications by job": (
+        "ix_job_application_job_applied",
+        lambda sample: (
+            select(JobApplication)
+            .where(JobApplication.job_id == sample.job_id)
+            .order_by(JobApplication.applied_at.desc())
+        ),
+    ),
+    "applications by organization": (
+        "ix_job_application_organization_applied",
+        lambda sample: (
+            select(JobApplication)
+            .where(JobApplication.organization_id == sample.organization_id)
+            .order_by(JobApplication.applied_at.desc())
+            .limit(20)
+        ),
+    ),
+    "applications by candidate": (
+        "ix_job_application_candidate_applied",
+        lambda sample: (
+            select(JobApplication)
+            .where(JobApplication.candidate_profile_id == sample.candidate_profile_id)
+            .order_by(JobApplication.applied_at.desc())
+        ),
+    ),
+    "status history by application": (
+        "ix_job_application_status_history_application_changed",
+        lambda sample: (
+            select(JobApplicationStatusHistory)
+            .where(JobApplicationStatusHistory.application_id == sample.application_id)
+            .order_by(JobApplicationStatusHistory.changed_at.desc())
+        ),
+    ),
+    "recruiter job listing": (
+        "ix_job_posting_organization_posted",
+        lambda sample: (
+            select(JobPosting)
+            .where(JobPosting.organization_id == sample.organization_id)
+            .order_by(JobPosting.posted_date.desc(), JobPosting.job_id.desc())
+            .limit(10)
+        ),
+    ),
+    "visible job listing": (
+        "ix_job_posting_active_posted",
+        lambda sample: (
+            select(JobPosting)
+            .where(*visible_job_conditions())
+            .order_by(JobPosting.posted_date.desc(), JobPosting.job_id.desc())
+            .limit(10)
+        ),
+    ),
+    "jobs past deadline": (
+        "ix_job_posting_active_deadline",
+        lambda sample: select(JobPosting.job_id).where(
+            JobPosting.status == "active",
+            JobPosting.application_deadline < date.today(),
+        ),
+    ),
+}
+
+
+def plan_indexes(node: dict) -> set[str]:
+    indexes = {node["Index Name"]} if "Index Name" in node else set()
+    for child in node.get("Plans", []):
+        indexes |= plan_indexes(child)
+    return indexes
+
+
+async def explain(conn: AsyncConnection, statement) -> dict:
+    sql = statement.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    return result.scalar_one()[0]["Plan"]
+
+
+async def seed(conn: AsyncConnection):
+    """Insert the synthetic dataset and return one application row to query by"""
+    for statement in SEED_STATEMENTS:
+        await conn.execute(text(statement), SEED_PARAMS)
+    for table in ANALYZED_TABLES:
+        await conn.execute(text(f"ANALYZE {table}"))
+    result = await conn.execute(
+        select(
+            JobApplication.job_id,
+            JobApplication.organization_id,
+            JobApplication.candidate_profile_id,
+            JobApplication.application_id,
+        ).limit(1)
+    )
+    return result.one()
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def seeded(loop):
+    """Connection holding the seeded dataset, rolled back after the module"""
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    conn = loop.run_until_complete(engine.connect())
+    transaction = loop.run_until_complete(conn.begin())
+    try:
+        yield conn, loop.run_until_complete(seed(conn))
+    finally:
+        loop.run_until_complete(transaction.rollback())
+        loop.run_until_complete(conn.close())
+        loop.run_until_complete(engine.dispose())
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_hot_query_uses_index(loop, seeded, name):
+    conn, sample = seeded
+    expected, build = HOT_QUERIES[name]
+    plan = loop.run_until_complete(explain(conn, build(sample)))
+    used = plan_indexes(plan)
+    assert expected in used, (
+        f"{name}: expected {expected}, plan uses {sorted(used) or plan['Node Type']}"
+    )
@@ -0,0 +1,242 @@
+"""ResumeRepository.fork_from_profile against a migrated PostgreSQL database
+
+Each test runs in a transaction that is rolled back afterwards.
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import date
+
+import pytest
+
+if not os.environ.get("DATABASE_URL"):
+    pytest.skip("DATABASE_URL is not set", allow_module_level=True)
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import settings
+from app.db.models.candidate import (
+    CandidateCertification,
+    CandidateEducation,
+    CandidateProfile,
+    CandidateSkills,
+    CandidateSocialLink,
+    CandidateWorkExperience,
+)
+from app.db.models.resume import (
+    Resume,
+    ResumeCertification,
+    ResumeEducation,
+    ResumeSkills,
+    ResumeSocialLink,
+    ResumeWorkExperience,
+)
+from app.db.models.user import User
+from app.db.repositories.resume_repo import FORK_SECTIONS, ResumeRepository
+
+pytestmark = pytest.mark.integration
+
+RESUME_TABLES = (
+    Resume,
+    ResumeWorkExperience,
+    ResumeEducation,
+    ResumeSkills,
+    ResumeCertification,
+    ResumeSocialLink,
+)
+NO_OVERRIDES = {name: None for name, *_ in FORK_SECTIONS}
+
+
+def run_in_rollback(test):
+    """Run `test(db)` in a session whose transaction is always rolled back"""
+
+    async def run():
+        # A snapshot keeps row counts stable against concurrent writers
+        engine = create_async_engine(
+            settings.DATABASE_URL, poolclass=NullPool, isolation_level="REPEATABLE READ"
+        )
+        try:
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                try:
+                    db = AsyncSession(
+                        bind=conn,
+                        expire_on_commit=False,
+                        join_transaction_mode="create_savepoint",
+                    )
+                    await test(db)
+                finally:
+                    await transaction.rollback()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+async def create_user(db: AsyncSession, with_profile: bool = True) -> User:
+    user = User(
+        user_id=uuid.uuid4(),
+        email=f"fork-test-{uuid.uuid4()}@example.com",
+        name="Fork Test",
+    )
+    db.add(user)
+    if with_profile:
+        profile_id = uuid.uuid4()
+        db.add_all(
+            [
+                CandidateProfile(
+                    profile_id=profile_id,
+                    user_id=user.user_id,
+                    professional_summary="Profile summary",
+                ),
+                CandidateWorkExperience(
+                    candidate_work_experience_id=uuid.uuid4(),
+                    profile_id=profile_id,
+                    job_title="Backend Engineer",
+                    company="Acme",
+                    start_date=date(2020, 1, 1),
+                    is_current=True,
+                ),
+                CandidateEducation(
+                    candidate_education_id=uuid.uuid4(),
+                    profile_id=profile_id,
+                    college_name="State University",
+                    degree="BSc",
+                ),
+                CandidateSkills(
+                    candidate_skill_id=uuid.uuid4(),
+                    profile_id=profile_id,
+                    skill_name="Python",
+                ),
+                CandidateSkills(
+                    candidate_skill_id=uuid.uuid4(),
+                    profile_id=profile_id,
+                    skill_name="SQL",
+                ),
+                CandidateCertification(
+                    candidate_certification_id=uuid.uuid4(),
+                    profile_id=profile_id,
+                    certification_name="Cloud Practitioner",
+                    issuing_body="Cloud Inc",
+                    does_not_expire=True,
+                ),
+                CandidateSocialLink(
+                    social_link_id=uuid.uuid4(),
+                    profile_id=profile_id,
+                    type="github",
+                    url="https://github.com/fork-test",
+                ),
+            ]
+        )
+    await db.flush()
+    return user
+
+
+async def fork(db: AsyncSession, user: User, **kwargs) -> Resume | None:
+    repo = ResumeRepository(db)
+    resume_id = await repo.fork_from_profile(
+        user.user_id,
+        kwargs.get("target_job_title", "Staff Engineer"),
+        kwargs.get("custom_summary"),
+        {**NO_OVERRIDES, **kwargs.get("sections", {})},
+    )
+    if resume_id is None:
+        return None
+    db.expunge_all()
+    return await repo.get_with_details(resume_id)
+
+
+class TestForkFromProfile:
+    def test_copies_every_section_from_profile(self):
+        async def test(db):
+            user = await create_user(db)
+            resume = await fork(db, user, custom_summary="Tailored summary")
+            assert resume.target_job_title == "Staff Engineer"
+            assert resume.custom_summary == "Tailored summary"
+            [experience] = resume.work_experiences
+            assert (experience.job_title, experience.company) == (
+                "Backend Engineer",
+                "Acme",
+            )
+            assert experience.start_date == date(2020, 1, 1)
+            assert experience.is_current
+            assert [e.college_name for e in resume.educations] == ["State University"]
+            assert sorted(s.skill_name for s in resume.skills) == ["Python", "SQL"]
+            [certification] = resume.certifications
+            assert certification.does_not_expire
+            assert [(link.type, link.url) for link in resume.social_links] == [
+                ("github", "https://github.com/fork-test")
+            ]
+
+        run_in_rollback(test)
+
+    def test_overrides_replace_profile_sections(self):
+        async def test(db):
+            user = await create_user(db)
+            resume = await fork(
+                db,
+                user,
+                sections={
+                    "skills": [{"skill_name": "Go"}],
+                    "work_experiences": [
+                        {
+                            "job_title": "Founder",
+                            "company": "Startup",
+                            "location": None,
+                            "start_date": date(2018, 5, 1),
+                            "end_date": None,
+                            "is_current": False,
+                            "description": None,
+                        }
+                    ],
+                },
+            )
+            assert [s.skill_name for s in resume.skills] == ["Go"]
+            [experience] = resume.work_experiences
+            assert (experience.job_title, experience.start_date) == (
+                "Founder",
+                date(2018, 5, 1),
+            )
+            assert experience.end_date is None
+            # Sections without an override are still copied from the profile
+            assert [e.college_name for e in resume.educations] == ["State University"]
+            assert len(resume.social_links) == 1
+
+        run_in_rollback(test)
+
+    def test_empty_override_leaves_section_empty(self):
+        async def test(db):
+            user = await create_user(db)
+            resume = await fork(db, user, sections={"skills": [], "social_links": []})
+            assert resume.skills == []
+            assert resume.social_links == []
+            assert len(resume.work_experiences) == 1
+
+        run_in_rollback(test)
+
+    @pytest.mark.parametrize("custom_summary", [None, ""], ids=["none", "empty"])
+    def test_missing_custom_summary_uses_profile_summary(self, custom_summary):
+        async def test(db):
+            user = await create_user(db)
+            resume = await fork(db, user, custom_summary=custom_summary)
+            assert resume.custom_summary == "Profile summary"
+
+        run_in_rollback(test)
+
+    def test_user_without_profile_writes_nothing(self):
+        async def test(db):
+            user = await create_user(db, with_profile=False)
+            counts = [
+                await db.scalar(select(func.count()).select_from(model))
+                for model in RESUME_TABLES
+            ]
+            assert await fork(db, user) is None
+            assert [
+                await db.scalar(select(func.count()).select_from(model))
+                for model in RESUME_TABLES
+            ] == counts
+
+        run_in_rollback(test)
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from app.integrations.llm.embedding_dispatcher import EmbeddingDispatcher
+
+pytestmark = pytest.mark.unit
+
+
+class FakeEmbedder:
+    """Records each batch and embeds a text as [len(text)]"""
+
+    def __init__(self, drop: int = 0, error: Exception | None = None):
+        self.batches: list[list[str]] = []
+        self.drop = drop
+        self.error = error
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        vectors = [[float(len(text))] for text in texts]
+        return vectors[: len(vectors) - self.drop]
+
+
+def embed_all(dispatcher: EmbeddingDispatcher, texts: list[str]) -> list:
+    async def run():
+        return await asyncio.gather(
+            *(dispatcher.embed(text) for text in texts), return_exceptions=True
+        )
+
+    return asyncio.run(run())
+
+
+class TestEmbeddingDispatcher:
+    def test_coalesces_concurrent_requests(self):
+        embedder = FakeEmbedder()
+        dispatcher = EmbeddingDispatcher(embedder, max_batch_size=10, max_wait_ms=5)
+        results = embed_all(dispatcher, ["a", "bb", "ccc"])
+        assert embedder.batches == [["a", "bb", "ccc"]]
+        assert results == [[1.0], [2.0], [3.0]]
+
+    def test_sequential_requests_get_their_own_batch(self):
+        embedder = FakeEmbedder()
+        dispatcher = EmbeddingDispatcher(embedder, max_batch_size=10, max_wait_ms=1)
+
+        async def run():
+            return [await dispatcher.embed("a"), await dispatcher.embed("bb")]
+
+        assert asyncio.run(run()) == [[1.0], [2.0]]
+        assert embedder.batches == [["a"], ["bb"]]
+
+    def test_splits_at_max_batch_size(self):
+        embedder = FakeEmbedder()
+        # A long window shows full batches are sent without waiting for it
+        dispatcher = EmbeddingDispatcher(embedder, max_batch_size=2, max_wait_ms=60_000)
+        texts = ["a", "bb", "ccc", "dddd"]
+        results = embed_all(dispatcher, texts)
+        assert embedder.batches == [["a", "bb"], ["ccc", "dddd"]]
+        assert results == [[1.0], [2.0], [3.0], [4.0]]
+
+    def test_short_response_fails_every_waiter(self):
+        embedder = FakeEmbedder(drop=1)
+        dispatcher = EmbeddingDispatcher(embedder, max_batch_size=10, max_wait_ms=5)
+        results = embed_all(dispatcher, ["a", "bb", "ccc"])
+        assert len(embedder.batches) == 1
+        assert all(isinstance(result, ValueError) for result in results)
+        assert "Expected 3 embeddings, got 2" in str(results[0])
+
+    def test_provider_exception_fails_every_waiter(self):
+        error = RuntimeError("quota exceeded")
+        embedder = FakeEmbedder(error=error)
+        dispatcher = EmbeddingDispatcher(embedder, max_batch_size=10, max_wait_ms=5)
+        assert embed_all(dispatcher, ["a", "bb"]) == [error, error]
+
+    def test_failed_batch_does_not_affect_next_batch(self):
+        embedder = FakeEmbedder(error=RuntimeError("quota exceeded"))
+        dispatcher = EmbeddingDispatcher(embedder, max_batch_size=10, max_wait_ms=1)
+
+        async def run():
+            with pytest.raises(RuntimeError):
+                await dispatcher.embed("a")
+            embedder.error = None
+            return await dispatcher.embed("bb")
+
+        assert asyncio.run(run()) == [2.0]
@@ -0,0 +1,101 @@
+import base64
+import uuid
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_job_service_readonly
+from app.api.v1 import jobs
+from app.core.limiter import limiter
+from app.core.pagination import decode_cursor, encode_cursor
+from app.services.job_service import JobService
+
+pytestmark = pytest.mark.unit
+
+
+def raw_cursor(payload: bytes) -> str:
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+class TestCursorRoundTrip:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [],
+            [1],
+            ["2026-01-31", "0a1b2c3d-0000-4000-8000-000000000000"],
+            [0.875, "a/b?c=d&e", None, True],
+            [["search", "python", None], 40],
+        ],
+    )
+    def test_json_values_round_trip(self, values):
+        assert decode_cursor(encode_cursor(values), len(values)) == values
+
+    def test_dates_and_uuids_round_trip_as_strings(self):
+        job_id = uuid.uuid4()
+        cursor = encode_cursor([date(2026, 1, 31), job_id])
+        assert decode_cursor(cursor, 2) == ["2026-01-31", str(job_id)]
+
+    def test_cursor_is_url_safe_without_padding(self):
+        cursor = encode_cursor(["?>?>?>", "~~~~~"])
+        assert "=" not in cursor
+        assert set(cursor) <= set(
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+        )
+
+
+class TestInvalidCursor:
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "",
+            "not a cursor",
+            "%%%",
+            "a",
+            raw_cursor(b"\xff\xfe\xfd"),
+            raw_cursor(b"[1,"),
+            raw_cursor(b"{}"),
+            raw_cursor(b'"text"'),
+            raw_cursor(b"null"),
+        ],
+    )
+    def test_malformed_cursor_raises_value_error(self, cursor):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor, 2)
+
+    @pytest.mark.parametrize("values", [[], [1], [1, 2, 3]])
+    def test_wrong_size_raises_value_error(self, values):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(encode_cursor(values), 2)
+
+    @pytest.mark.parametrize(
+        "values", [["yesterday", str(uuid.uuid4())], ["2026-01-31", "job"], [1, 2]]
+    )
+    def test_listing_cursor_with_bad_values_raises_value_error(self, values):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            JobService._decode_listing_cursor(encode_cursor(values))
+
+
+class TestInvalidCursorResponse:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.state.limiter = limiter
+        app.include_router(jobs.router, prefix="/jobs")
+        # The cursor is rejected before the listing is queried
+        job_repo = SimpleNamespace(get_visible_listing_paginated=Mock())
+        app.dependency_overrides[get_job_service_readonly] = lambda: JobService(
+            job_repo, *[None] * 6
+        )
+        yield TestClient(app)
+        job_repo.get_visible_listing_paginated.assert_not_called()
+
+    @pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor(["2026-01-31"])])
+    def test_search_returns_400(self, client, cursor):
+        response = client.get("/jobs/search", params={"cursor": cursor})
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Invalid pagination cursor"}
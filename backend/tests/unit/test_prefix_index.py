@@ -0,0 +1,106 @@
+import pytest
+
+from app.core.prefix_index import MEMO_SIZE, PrefixIndex
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def index():
+    index = PrefixIndex()
+    index.add("Software Engineer", weight=3)
+    index.add("Engineering Manager", weight=5)
+    index.add("Product Designer", weight=2)
+    return index
+
+
+class TestPrefixIndexSearch:
+    def test_matches_term_prefix(self, index):
+        assert index.search("prod", 10) == ["Product Designer"]
+
+    def test_matches_word_inside_term(self, index):
+        assert index.search("eng", 10) == ["Engineering Manager", "Software Engineer"]
+        assert index.search("designer", 10) == ["Product Designer"]
+
+    def test_matches_across_words(self, index):
+        assert index.search("software eng", 10) == ["Software Engineer"]
+        assert index.search("ware", 10) == []
+
+    def test_ignores_case_and_spacing(self, index):
+        assert index.search("  ENGINEERING   man", 10) == ["Engineering Manager"]
+
+    def test_orders_by_weight_and_applies_limit(self, index):
+        index.add("Data Engineer", weight=10)
+        assert index.search("eng", 2) == ["Data Engineer", "Engineering Manager"]
+
+    def test_empty_prefix_or_limit_returns_nothing(self, index):
+        assert index.search("  ", 10) == []
+        assert index.search("eng", 0) == []
+
+    def test_limit_above_memo_size(self):
+        index = PrefixIndex()
+        for i in range(MEMO_SIZE + 5):
+            index.add(f"Engineer {i:02d}", weight=i + 1)
+        results = index.search("eng", MEMO_SIZE + 5)
+        assert len(results) == MEMO_SIZE + 5
+        assert results[0] == f"Engineer {MEMO_SIZE + 4:02d}"
+
+
+class TestPrefixIndexWrites:
+    def test_repeated_add_keeps_first_display_and_sums_weight(self, index):
+        index.add("product designer", weight=10)
+        assert len(index) == 3
+        index.add("Product Manager", weight=11)
+        assert index.search("product", 10) == ["Product Designer", "Product Manager"]
+
+    def test_remove_drops_term_at_zero_weight(self, index):
+        index.remove("Product Designer", weight=2)
+        assert index.search("prod", 10) == []
+        assert index.search("designer", 10) == []
+        assert len(index) == 2
+
+    def test_remove_keeps_term_with_weight_left(self, index):
+        index.remove("Engineering Manager", weight=4)
+        assert index.search("eng", 10) == ["Software Engineer", "Engineering Manager"]
+
+    def test_remove_unknown_term_is_noop(self, index):
+        index.remove("Chef")
+        assert len(index) == 3
+
+    def test_replace_rebuilds_index(self, index):
+        index.replace([("Chef", 1), ("chef", 2), ("Sous Chef", 1)])
+        assert len(index) == 2
+        assert index.search("chef", 10) == ["Chef", "Sous Chef"]
+        assert index.search("eng", 10) == []
+
+
+class TestPrefixIndexMemo:
+    def test_add_drops_memoized_prefix(self, index):
+        assert index.search("eng", 10) == ["Engineering Manager", "Software Engineer"]
+        index.add("Engine Mechanic", weight=1)
+        assert index.search("eng", 10) == [
+            "Engineering Manager",
+            "Software Engineer",
+            "Engine Mechanic",
+        ]
+
+    def test_weight_change_reorders_memoized_prefix(self, index):
+        assert index.search("eng", 1) == ["Engineering Manager"]
+        index.add("Software Engineer", weight=5)
+        assert index.search("eng", 1) == ["Software Engineer"]
+
+    def test_remove_drops_memoized_prefix(self, index):
+        assert index.search("soft", 10) == ["Software Engineer"]
+        index.remove("Software Engineer", weight=3)
+        assert index.search("soft", 10) == []
+        assert index.search("eng", 10) == ["Engineering Manager"]
+
+    def test_unrelated_write_keeps_memo(self, index):
+        index.search("eng", 10)
+        index.add("Chef")
+        assert "eng" in index._memo
+
+    def test_replace_clears_memo(self, index):
+        index.search("eng", 10)
+        index.replace([("Chef", 1)])
+        assert index._memo == {}